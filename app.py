@@ -1,19 +1,47 @@
 import os
+
+# Must happen before the stdlib networking/threading imports below so the
+# gevent workers in gunicorn_conf.py can multiplex blocking I/O.
+if os.environ.get("GEVENT") == "1":
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        pass
+
 import json
 import math
 import hmac
+import hashlib
+import atexit
 from datetime import timedelta
 from typing import Dict, Any, List, Optional, Tuple
-from flask import Flask, jsonify, send_file, request, Response, render_template, render_template_string, redirect, session, url_for
+from flask import Flask, jsonify, send_file, request, Response, render_template, render_template_string, redirect, session, url_for, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 import threading
+import concurrent.futures
+from functools import lru_cache
+from collections import OrderedDict
 
-import wave
 import re
 from pathlib import Path
 import subprocess
-import shlex
 from datetime import datetime
 
+try:
+    from mutagen import File as _mutagen_file  # type: ignore
+except Exception:
+    _mutagen_file = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+try:
+    import ijson  # type: ignore
+except Exception:
+    ijson = None
+
 # Remove complex processing imports - we'll use medb.py as subprocess
 
 
@@ -54,7 +82,10 @@ def inject_asset_version():
 def disable_cache_for_html_and_json(resp: Response):
     try:
         ct = resp.headers.get('Content-Type', '')
-        if ('text/html' in ct) or ('application/json' in ct):
+        # Views that set their own Cache-Control (cacheable 404s,
+        # ETag-validated report JSON) keep it; no-store is only the
+        # default for responses with no explicit policy.
+        if (('text/html' in ct) or ('application/json' in ct)) and 'Cache-Control' not in resp.headers:
             resp.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
             resp.headers['Pragma'] = 'no-cache'
             resp.headers['Expires'] = '0'
@@ -63,22 +94,38 @@ def disable_cache_for_html_and_json(resp: Response):
     return resp
 
 
-def get_audio_duration_seconds(wav_path: str) -> Optional[float]:
-    try:
-        with wave.open(wav_path, 'rb') as w:
-            frames = w.getnframes()
-            rate = w.getframerate()
-            if rate == 0:
-                return None
-            return frames / float(rate)
-    except Exception:
-        return None
+def _json_loads(data: Any) -> Any:
+    """Decode a whole JSON buffer (bytes or str), preferring the native orjson parser."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: Path, obj: Any, indent: bool = False) -> None:
+    """Serialize obj to path, preferring the native orjson encoder."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+
+def get_audio_duration_seconds(audio_path: str) -> Optional[float]:
+    """Read duration from the container header (any format), not just WAV."""
+    if _mutagen_file is not None:
+        try:
+            info = _mutagen_file(audio_path)
+            if info is not None and getattr(info.info, 'length', 0) > 0:
+                return float(info.info.length)
+        except Exception:
+            pass
+    # mutagen missing or format unsupported: fall back to ffprobe
+    return media_duration_seconds(audio_path)
 
 
 def effective_duration_seconds(audio_path: str, transcript: Dict[str, Any]) -> Optional[float]:
     """Return audio duration in seconds, with transcript fallback when audio is unreadable.
 
-    - Try reading container duration via wave
+    - Try reading container duration via mutagen (ffprobe fallback)
     - If unavailable, derive from the maximum end_timestamp in transcript segments
     """
     dur = get_audio_duration_seconds(audio_path)
@@ -87,7 +134,9 @@ def effective_duration_seconds(audio_path: str, transcript: Dict[str, Any]) -> O
     max_end = 0.0
     try:
         for seg in (transcript.get('segments') or []):
-            end = parse_mmss_to_seconds(seg.get('end_timestamp', ''))
+            end = seg.get('end_s')
+            if end is None:
+                end = parse_mmss_to_seconds(seg.get('end_timestamp', ''))
             if end is not None:
                 if end > max_end:
                     max_end = end
@@ -98,28 +147,62 @@ def effective_duration_seconds(audio_path: str, transcript: Dict[str, Any]) -> O
 
 # -------- Multi-record support --------
 
+_MER_RE = re.compile(r"(.+?)_MER\.pdf$", re.IGNORECASE)
+_AUDIO_EXTS = frozenset({".mp3", ".wav", ".m4a", ".webm", ".ogg", ".mp4"})
+
+# Hot-path patterns compiled once: ffmpeg stderr stats and the JSON shapes
+# Gemini wraps transcripts in
+_RE_INPUT_I = re.compile(r'\{[\s\S]*?\"input_i\"\s*:\s*\"?([\-0-9\.]+)\"?')
+_RE_MEAN_VOL = re.compile(r'mean_volume:\s*(-?\d+(?:\.\d+)?)\s*dB')
+_RE_CODEFENCE_JSON = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_RE_INLINE_JSON = re.compile(r'(\{.*"segments".*\})', re.DOTALL)
+
+
 def _record_id_from_mer(path: Path) -> Optional[str]:
-    name = path.name
-    m = re.match(r"(.+?)_MER\.pdf$", name, flags=re.IGNORECASE)
+    m = _MER_RE.match(path.name)
     return m.group(1) if m else None
 
 
 def _is_audio(p: Path) -> bool:
-    return p.suffix.lower() in {".mp3", ".wav", ".m4a", ".webm", ".ogg", ".mp4"}
+    return p.suffix.lower() in _AUDIO_EXTS
+
+
+# Memoized scan_records() result keyed by a stamp folded from the records dir
+# mtime and every record subdirectory's mtime, so both staging at the top
+# level and media dropped inside a record directory invalidate the cache.
+_SCAN_CACHE: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
 
 
 def scan_records() -> Dict[str, Dict[str, Any]]:
+    global _SCAN_CACHE
     base = Path(RECORDS_DIR)
     records: Dict[str, Dict[str, Any]] = {}
     if not base.exists():
         return records
 
-    entries = list(base.iterdir())
+    # Classify each entry once (single is_dir/is_file stat and one lowercase
+    # per name) so the passes below are pure in-memory loops. The same pass
+    # accumulates the cache stamp.
+    try:
+        stamp: Optional[int] = os.stat(base).st_mtime_ns
+    except OSError:
+        stamp = None
+    entries: List[Tuple[Path, str, bool, bool]] = []
+    for p in base.iterdir():
+        is_dir = p.is_dir()
+        entries.append((p, p.name.lower(), is_dir, p.is_file()))
+        if stamp is not None and is_dir:
+            try:
+                stamp ^= hash((p.name, os.stat(p).st_mtime_ns))
+            except OSError:
+                stamp = None
+    if stamp is not None and _SCAN_CACHE is not None and _SCAN_CACHE[0] == stamp:
+        return _SCAN_CACHE[1]
 
     # 1) Discover records by presence of per-record directories. A directory may be
     # raw/staged with <rid>_MER.pdf + media, or already processed with _processed.
-    for d in entries:
-        if not d.is_dir():
+    for d, _, is_dir, _ in entries:
+        if not is_dir:
             continue
         rid = d.name
         mer_candidate = d / f"{rid}_MER.pdf"
@@ -134,18 +217,22 @@ def scan_records() -> Dict[str, Dict[str, Any]]:
             )
 
     # 2) Also index MER PDFs at the root if present (locally they may exist; in Vercel they are ignored)
-    for f in entries:
-        if f.is_file() and f.suffix.lower() == ".pdf" and f.name.lower().endswith("_mer.pdf"):
+    for f, name_lower, _, is_file in entries:
+        if is_file and name_lower.endswith("_mer.pdf"):
             rid = _record_id_from_mer(f)
             if rid:
                 records.setdefault(rid, {"mer_pdf": str(f), "calls": []})
 
-    # 3) Attach any root-level audio/video that match a record prefix (optional)
-    for f in entries:
-        if f.is_file() and _is_audio(f):
-            for rid in list(records.keys()):
+    # 3) Attach any root-level audio/video that match a record prefix (optional).
+    # Sort record ids longest-first once so each media file stops at its most
+    # specific match instead of re-scanning the whole id set.
+    rids_by_len = sorted(records, key=len, reverse=True)
+    for f, name_lower, _, is_file in entries:
+        if is_file and os.path.splitext(name_lower)[1] in _AUDIO_EXTS:
+            for rid in rids_by_len:
                 if f.name.startswith(rid):
                     records[rid]["calls"].append({"path": str(f), "name": f.name})
+                    break
 
     # 4) Attach media files inside per-record directories (current local staging layout)
     for rid, rec in records.items():
@@ -161,22 +248,55 @@ def scan_records() -> Dict[str, Dict[str, Any]]:
         rec["calls"].sort(key=lambda x: x["name"])  # deterministic
         for i, c in enumerate(rec["calls"], start=1):
             c["index"] = i
+    if stamp is not None:
+        _SCAN_CACHE = (stamp, records)
     return records
 
 
+def get_record(rid: str) -> Dict[str, Any]:
+    """Resolve one record from the memoized scan.
+
+    Single-record endpoints (metadata, audio, MER) only need their own
+    entry; with the stamp cache warm this is a dict read, not a rescan."""
+    return scan_records().get(rid) or {}
+
+
 def _processed_dir(record_id: str) -> Path:
     p = Path(RECORDS_DIR) / record_id / "_processed"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+# Long-lived buffered log handles per record: one open() per record instead of
+# an open/write/close triple per log line. Flushed on process exit.
+_LOG_HANDLES: Dict[str, Any] = {}
+_LOG_LOCK = threading.Lock()
+
+
+def _close_log_handles():
+    with _LOG_LOCK:
+        for lf in _LOG_HANDLES.values():
+            try:
+                lf.close()
+            except Exception:
+                pass
+        _LOG_HANDLES.clear()
+
+
+atexit.register(_close_log_handles)
+
+
 def _log_step(record_id: str, message: str):
     try:
         ts = datetime.now().strftime('%H:%M:%S')
         line = f"[{ts}] {message}"
         print(line, flush=True)
-        log_path = _processed_dir(record_id) / 'process.log'
-        with open(log_path, 'a', encoding='utf-8') as lf:
+        with _LOG_LOCK:
+            lf = _LOG_HANDLES.get(record_id)
+            if lf is None or lf.closed:
+                log_path = _processed_dir(record_id) / 'process.log'
+                lf = open(log_path, 'a', encoding='utf-8', buffering=1 << 16)
+                _LOG_HANDLES[record_id] = lf
             lf.write(line + "\n")
     except Exception:
         try:
@@ -185,6 +305,91 @@ def _log_step(record_id: str, message: str):
             pass
 
 
+def _shifted_segment(s: Dict[str, Any], offset: float) -> Dict[str, Any]:
+    """Copy a transcript segment with its timestamps shifted by offset seconds."""
+    st = parse_mmss_to_seconds(s.get('start_timestamp', '') or '') or 0.0
+    en = parse_mmss_to_seconds(s.get('end_timestamp', '') or '') or st
+    return {
+        'segment_id': s.get('segment_id', ''),
+        'text': s.get('text', ''),
+        'speaker': s.get('speaker', ''),
+        'start_timestamp': seconds_to_mmss(st + offset),
+        'end_timestamp': seconds_to_mmss(en + offset),
+    }
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Stage src at dst without duplicating bytes when possible.
+
+    Hardlink first (same filesystem: O(1) regardless of size), then
+    symlink, then fall back to a real copy."""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        os.symlink(os.fspath(src), dst)
+        return
+    except OSError:
+        pass
+    import shutil
+    shutil.copy2(src, dst)
+
+
+def _extract_mp4_audio_parallel(record_id: str, calls: List[Dict[str, Any]], out_root: Path, force: bool) -> None:
+    """Extract audio from every mp4 source concurrently.
+
+    Starts one ffmpeg per video via Popen (argv, no shell) and waits for
+    all of them, so multi-call records overlap their extractions instead
+    of paying them serially inside the transcription workers."""
+    procs: List[Tuple[int, Any]] = []
+    for call_item in calls:
+        audio_path = str(call_item.get("path") or "")
+        if not audio_path.lower().endswith('.mp4'):
+            continue
+        idx = call_item["index"]
+        call_dir = out_root / f"call{idx}"
+        call_dir.mkdir(parents=True, exist_ok=True)
+        mp3_out = call_dir / 'audio.mp3'
+        if (not force) and mp3_out.exists():
+            continue
+        try:
+            _log_step(record_id, f"Call {idx}: Running ffmpeg extraction...")
+            p = subprocess.Popen(
+                ['ffmpeg', '-y', '-nostdin', '-hide_banner', '-loglevel', 'error',
+                 '-i', audio_path, '-vn', '-acodec', 'libmp3lame', '-q:a', '2', str(mp3_out)],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            procs.append((idx, p))
+        except Exception as e:
+            _log_step(record_id, f"Call {idx}: audio extraction failed to start: {e}")
+    for idx, p in procs:
+        try:
+            p.wait(timeout=600)
+            _log_step(record_id, f"Call {idx}: ffmpeg extraction completed")
+        except Exception as e:
+            try:
+                p.kill()
+            except Exception:
+                pass
+            _log_step(record_id, f"Call {idx}: ffmpeg extraction failed: {e}")
+
+
+def _record_input_key(rec: Dict[str, Any]) -> str:
+    """Fingerprint of a record's source files: (path, mtime_ns, size) each."""
+    parts: List[str] = []
+    paths = [rec.get("mer_pdf")] + [c.get("path") for c in rec.get("calls", [])]
+    for p in paths:
+        if not p:
+            continue
+        try:
+            st = os.stat(p)
+            parts.append(f"{p}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{p}:missing")
+    return "|".join(parts)
+
+
 def process_record(record_id: str, api_key: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
     """Process record by calling medb.py as subprocess"""
     recs = scan_records()
@@ -192,6 +397,17 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
     if not rec:
         return {"error": "record_not_found", "id": record_id}
 
+    # Skip the whole pipeline when the inputs are byte-identical to the last
+    # successful run (the key is stamped into the summary below).
+    input_key = _record_input_key(rec)
+    summary_path = Path(RECORDS_DIR) / record_id / "_processed" / "processing_summary.json"
+    if not force and summary_path.exists():
+        prior = load_json_safe(summary_path)
+        if prior and prior.get("_input_key") == input_key:
+            _log_step(record_id, "Inputs unchanged since last run; returning cached summary")
+            prior["status"] = "completed"
+            return prior
+
     _log_step(record_id, f"Starting processing via medb.py (force={force}) api_key_provided={'yes' if api_key else 'no'}")
     print(f"[proc] start record={record_id} force={force}", flush=True)
 
@@ -211,16 +427,14 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
     # Copy MER to record directory if not already there
     record_mer = record_dir / f"{record_id}_MER.pdf"
     if not record_mer.exists():
-        import shutil
-        shutil.copy2(mer_file, record_mer)
-    
-    # Copy media files to record directory if not already there
+        _link_or_copy(mer_file, record_mer)
+
+    # Stage media files in record directory if not already there
     for call in rec.get("calls", []):
         media_path = Path(call["path"])
         record_media = record_dir / media_path.name
         if not record_media.exists():
-            import shutil
-            shutil.copy2(media_path, record_media)
+            _link_or_copy(media_path, record_media)
     
     # Call medb.py as subprocess
     try:
@@ -237,33 +451,46 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
             cwd=Path(__file__).parent,
-            bufsize=1,
-            universal_newlines=True
+            bufsize=1 << 16,
         )
-        
-        # Stream output to log
+
+        # Stream output to log. Binary chunked reads: one syscall per ~64KB
+        # of output, decoding only when a complete line is formatted.
+        pending = b''
         while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                # Forward medb.py output to our log
-                _log_step(record_id, f"medb.py: {output.strip()}")
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                if process.poll() is not None:
+                    break
+                continue
+            pending += chunk
+            lines = pending.split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    # Forward medb.py output to our log
+                    _log_step(record_id, f"medb.py: {line.decode('utf-8', 'replace').strip()}")
+        if pending.strip():
+            _log_step(record_id, f"medb.py: {pending.decode('utf-8', 'replace').strip()}")
         
         return_code = process.poll()
         
         if return_code == 0:
             _log_step(record_id, "medb.py completed successfully")
             
-            # Read the processing summary
-            summary_path = record_dir / "_processed" / "processing_summary.json"
+            # Read the processing summary and stamp the input key so the
+            # next invocation with unchanged sources can short-circuit
             if summary_path.exists():
-                with open(summary_path) as f:
-                    results = json.load(f)
-                    results["status"] = "completed"
-                    return results
+                results = load_json_safe(summary_path)
+                results["_input_key"] = input_key
+                try:
+                    _write_json(summary_path, results, indent=True)
+                except Exception:
+                    pass
+                results["status"] = "completed"
+                write_dashboard_row(record_id)
+                return results
             else:
                 return {"id": record_id, "status": "completed", "message": "Processing completed but summary not found"}
         else:
@@ -292,37 +519,38 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
     _log_step(record_id, f"Found {len(rec.get('calls', []))} call(s)")
     print(f"[proc] calls={len(rec.get('calls', []))}", flush=True)
 
-    # Pre-pass: transcribe all calls in parallel with 5-min chunking
-    pre_transcribed: set = set()
-    def _pre_worker(call_item: Dict[str, Any]):
+    # Pre-pass: transcribe all calls in parallel with 5-min chunking.
+    # Each worker also runs the per-call audibility/screenshot analysis so
+    # the follow-up loop only consumes results (no second walk of the media).
+    def _pre_worker(call_item: Dict[str, Any]) -> Dict[str, Any]:
+        idx = call_item["index"]
+        audio_path = call_item["path"]
+        call_dir = out_root / f"call{idx}"
+        res: Dict[str, Any] = {"index": idx}
         try:
-            idx = call_item["index"]
-            audio_path = call_item["path"]
-            call_dir = out_root / f"call{idx}"
             call_dir.mkdir(parents=True, exist_ok=True)
             _log_step(record_id, f"Call {idx}: source={audio_path}")
             print(f"[pre] call={idx} src={audio_path}", flush=True)
             log_progress(f"Starting Call {idx} processing")
             src_for_transcription = audio_path
             if str(audio_path).lower().endswith('.mp4'):
-                try:
-                    _log_step(record_id, f"Call {idx}: MP4 detected, extracting audio...")
-                    print(f"[pre] call={idx} MP4 detected, extracting audio...", flush=True)
-                    mp3_out = call_dir / 'audio.mp3'
-                    if force or (not mp3_out.exists()):
+                mp3_out = call_dir / 'audio.mp3'
+                if not mp3_out.exists():
+                    # Batch extraction missed or failed for this one; retry inline
+                    try:
                         _log_step(record_id, f"Call {idx}: Running ffmpeg extraction...")
                         print(f"[pre] call={idx} Running ffmpeg extraction...", flush=True)
-                        cmd = f"ffmpeg -y -i {shlex.quote(audio_path)} -vn -acodec libmp3lame -q:a 2 {shlex.quote(str(mp3_out))}"
-                        subprocess.run(cmd, shell=True, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600)
-                        _log_step(record_id, f"Call {idx}: ffmpeg extraction completed")
-                        print(f"[pre] call={idx} ffmpeg extraction completed", flush=True)
-                    if mp3_out.exists():
-                        src_for_transcription = str(mp3_out)
-                        _log_step(record_id, f"Call {idx}: extracted audio -> {mp3_out}")
-                        print(f"[pre] call={idx} extracted audio -> {mp3_out}", flush=True)
-                except Exception as e:
-                    _log_step(record_id, f"Call {idx}: audio extraction failed (prepass): {e}")
-                    print(f"[pre] call={idx}: audio extraction failed: {e}", flush=True)
+                        subprocess.run(
+                            ['ffmpeg', '-y', '-nostdin', '-hide_banner', '-loglevel', 'error',
+                             '-i', str(audio_path), '-vn', '-acodec', 'libmp3lame', '-q:a', '2', str(mp3_out)],
+                            check=False, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600)
+                    except Exception as e:
+                        _log_step(record_id, f"Call {idx}: audio extraction failed (prepass): {e}")
+                        print(f"[pre] call={idx}: audio extraction failed: {e}", flush=True)
+                if mp3_out.exists():
+                    src_for_transcription = str(mp3_out)
+                    _log_step(record_id, f"Call {idx}: extracted audio -> {mp3_out}")
+                    print(f"[pre] call={idx} extracted audio -> {mp3_out}", flush=True)
             transcript_path = call_dir / "transcript.json"
             _log_step(record_id, f"Call {idx}: Checking duration of {src_for_transcription}")
             print(f"[pre] call={idx} Checking duration of {src_for_transcription}", flush=True)
@@ -336,150 +564,46 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
             if treat_as_long:
                 _log_step(record_id, f"Call {idx}: duration {int(dur)}s > 300s, splitting into 5-min chunks")
                 chunks_dir = call_dir / 'chunks'
-                chunk_paths = split_audio_into_chunks(src_for_transcription, chunks_dir, chunk_seconds=300)
+                # Streaming: chunks are transcribed while ffmpeg is still
+                # segmenting the remainder of the file
+                chunk_paths, pieces = split_and_transcribe_streaming(
+                    src_for_transcription, chunks_dir, api_key, record_id, idx, chunk_seconds=300)
                 print(f"[pre] call={idx} chunks={len(chunk_paths)}", flush=True)
-                for ci, cp in enumerate(chunk_paths, start=1):
-                    try:
-                        cdur = media_duration_seconds(cp)
-                    except Exception:
-                        cdur = None
-                    _log_step(record_id, f"Call {idx}: chunk {ci}/{len(chunk_paths)} ready -> {cp} dur={int(cdur or 0)}s")
-                _log_step(record_id, f"Call {idx}: {len(chunk_paths)} chunk(s) ready")
-                pieces = transcribe_in_parallel(chunk_paths, api_key, record_id, idx)
-                merged_t = {"segments": []}
+                # Probe each chunk once; durations double as merge offsets below
+                chunk_durs: List[float] = [media_duration_seconds(cp) or 0.0 for cp in chunk_paths]
+                _log_step(record_id, f"Call {idx}: {len(chunk_paths)} chunk(s) transcribed")
+                merged_segs: List[Dict[str, Any]] = []
                 offset = 0.0
-                for cp, segs_obj in zip(chunk_paths, pieces):
+                for cd, segs_obj in zip(chunk_durs, pieces):
                     segs = (segs_obj or {}).get('segments') or []
-                    cd = media_duration_seconds(cp) or 0.0
-                    for s in segs:
-                        st = parse_mmss_to_seconds(s.get('start_timestamp','') or '') or 0.0
-                        en = parse_mmss_to_seconds(s.get('end_timestamp','') or '') or st
-                        merged_t['segments'].append({
-                            'segment_id': s.get('segment_id',''),
-                            'text': s.get('text',''),
-                            'speaker': s.get('speaker',''),
-                            'start_timestamp': seconds_to_mmss(st + offset),
-                            'end_timestamp': seconds_to_mmss(en + offset),
-                        })
+                    # Single extend per chunk: the list grows once instead of
+                    # append-by-append
+                    merged_segs.extend(_shifted_segment(s, offset) for s in segs)
                     offset += cd
-                with open(transcript_path, 'w') as f:
-                    json.dump(merged_t, f)
+                merged_t = {"segments": merged_segs}
+                _write_json(transcript_path, merged_t)
                 _log_step(record_id, f"Call {idx}: transcript saved -> {transcript_path}")
                 print(f"[pre] call={idx} transcript saved segs={len(merged_t['segments'])}", flush=True)
             else:
                 _log_step(record_id, f"Call {idx}: transcribing (no split)")
                 tdict = _transcribe_one(src_for_transcription, api_key)
-                with open(transcript_path, 'w') as f:
-                    json.dump(tdict, f)
+                _write_json(transcript_path, tdict)
                 _log_step(record_id, f"Call {idx}: transcript saved -> {transcript_path}")
                 print(f"[pre] call={idx} transcript saved (no split) segs={len((tdict or {}).get('segments', []) or [])}", flush=True)
-            pre_transcribed.add(idx)
         except Exception as e:
-            _log_step(record_id, f"Call {call_item.get('index','?')}: pre-transcription error: {e}")
-            print(f"[pre] call={call_item.get('index','?')} ERROR {e}", flush=True)
-
-    _threads: List[threading.Thread] = []
-    for _call in rec.get("calls", []):
-        t = threading.Thread(target=_pre_worker, args=(_call,), daemon=True)
-        _threads.append(t)
-        t.start()
-    for t in _threads:
-        t.join()
-    print("[pre] all pre-transcriptions finished", flush=True)
-    log_progress("Pre-transcription completed")
-
-    # Continue per-call analysis
-    for call in rec.get("calls", []):
-        idx = call["index"]
-        audio_path = call["path"]
-        call_dir = out_root / f"call{idx}"
-        call_dir.mkdir(parents=True, exist_ok=True)
-        _log_step(record_id, f"Call {idx}: source={audio_path}")
-        # If source is a video, extract audio track to MP3 for faster/more reliable transcription
-        src_for_transcription = audio_path
-        if str(audio_path).lower().endswith('.mp4'):
-            try:
-                mp3_out = call_dir / 'audio.mp3'
-                if force or (not mp3_out.exists()):
-                    cmd = f"ffmpeg -y -i {shlex.quote(audio_path)} -vn -acodec libmp3lame -q:a 2 {shlex.quote(str(mp3_out))}"
-                    subprocess.run(cmd, shell=True, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600)
-                if mp3_out.exists():
-                    src_for_transcription = str(mp3_out)
-                    _log_step(record_id, f"Call {idx}: extracted audio -> {mp3_out}")
-            except Exception:
-                _log_step(record_id, f"Call {idx}: audio extraction failed")
+            _log_step(record_id, f"Call {idx}: pre-transcription error: {e}")
+            print(f"[pre] call={idx} ERROR {e}", flush=True)
 
-        # Transcribe
-        transcript_path = call_dir / "transcript.json"
-        if transcribe_audio and (((not transcript_path.exists())) or (force and (idx not in pre_transcribed))):
-            try:
-                # Decide chunking if duration unknown or > 5 minutes
-                dur = media_duration_seconds(src_for_transcription) or 0.0
-                if not dur:
-                    _log_step(record_id, f"Call {idx}: duration unknown (ffprobe failed); defaulting to chunking")
-                treat_as_long = (dur == 0.0) or (dur > 300)
-                if treat_as_long:
-                    _log_step(record_id, f"Call {idx}: duration {int(dur)}s > 300s, splitting into 5-min chunks")
-                    chunks_dir = call_dir / 'chunks'
-                    chunk_paths = split_audio_into_chunks(src_for_transcription, chunks_dir, chunk_seconds=300)
-                    for ci, cp in enumerate(chunk_paths, start=1):
-                        try:
-                            cdur = media_duration_seconds(cp)
-                        except Exception:
-                            cdur = None
-                        _log_step(record_id, f"Call {idx}: chunk {ci}/{len(chunk_paths)} ready -> {cp} dur={int(cdur or 0)}s")
-                    _log_step(record_id, f"Call {idx}: {len(chunk_paths)} chunk(s) ready")
-                    pieces = transcribe_in_parallel(chunk_paths, api_key, record_id, idx)
-                    # Merge chunk transcripts and adjust timestamps with offsets
-                    merged_t = {"segments": []}
-                    offset = 0.0
-                    for pi, (cp, segs_obj) in enumerate(zip(chunk_paths, pieces)):
-                        segs = (segs_obj or {}).get('segments') or []
-                        # Probe each chunk duration for offset
-                        cd = media_duration_seconds(cp) or 0.0
-                        for s in segs:
-                            st = parse_mmss_to_seconds(s.get('start_timestamp','') or '') or 0.0
-                            en = parse_mmss_to_seconds(s.get('end_timestamp','') or '') or st
-                            merged_t['segments'].append({
-                                'segment_id': s.get('segment_id',''),
-                                'text': s.get('text',''),
-                                'speaker': s.get('speaker',''),
-                                'start_timestamp': seconds_to_mmss(st + offset),
-                                'end_timestamp': seconds_to_mmss(en + offset),
-                            })
-                        offset += cd
-                    tdict = merged_t
-                else:
-                    _log_step(record_id, f"Call {idx}: transcribing (no split)")
-                    tdict = transcribe_audio(src_for_transcription, api_key or os.environ.get("GEMINI_API_KEY", ""))
-
-                if save_transcript:
-                    save_transcript(tdict, str(transcript_path))
-                else:
-                    with open(transcript_path, 'w') as f:
-                        json.dump(tdict, f)
-                _log_step(record_id, f"Call {idx}: transcript saved -> {transcript_path}")
-                log_progress(f"Call {idx} transcription completed")
-            except Exception as e:
-                _log_step(record_id, f"Call {idx}: transcription failed: {e}")
-                log_progress(f"Call {idx} transcription failed")
-
-        # Load transcript (robust: supports code-fenced JSON inside raw_text)
-        try:
-            tdict = load_transcript_from_path(transcript_path)
-        except Exception:
-            tdict = {"segments": []}
-        _log_step(record_id, f"Call {idx}: transcript segments={len(tdict.get('segments') or [])}")
-
-        # Optional audio technical analysis (audibility)
+        # Audibility and (for video) screenshots are independent of the
+        # transcript, so they run in the same worker thread.
         try:
             audibility = analyze_audibility(audio_path)
             _log_step(record_id, f"Call {idx}: audibility level={audibility.get('audibility_level')} dBFS={audibility.get('avg_dbfs')}")
         except Exception:
             audibility = {"recording_exists": os.path.exists(audio_path), "audibility_level": "unknown", "avg_dbfs": None}
             _log_step(record_id, f"Call {idx}: audibility analysis failed")
+        res["audibility"] = audibility
 
-        # Optional video frame extraction and simple tagging (if video file)
         video_info = {}
         if str(audio_path).lower().endswith('.mp4'):
             try:
@@ -488,6 +612,43 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
                 shots = []
             video_info = {"screenshots": [str(p) for p in shots]}
             _log_step(record_id, f"Call {idx}: screenshots={len(shots)}")
+        res["video_info"] = video_info
+        return res
+
+    calls = rec.get("calls", [])
+    _extract_mp4_audio_parallel(record_id, calls, out_root, force)
+    pre_by_idx: Dict[int, Dict[str, Any]] = {}
+    if calls:
+        # Bounded pool: cap concurrent Gemini work instead of one
+        # unbounded thread per call.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(calls), 4), thread_name_prefix="pre"
+        ) as ex:
+            for res in ex.map(_pre_worker, calls):
+                pre_by_idx[res["index"]] = res
+    print("[pre] all pre-transcriptions finished", flush=True)
+    log_progress("Pre-transcription completed")
+
+    # Per-call QA/QC over the pre-pass results. Transcripts, audibility and
+    # screenshots were all produced by the workers above, so each worker only
+    # consumes them — no second extraction or duration probe. QA and QC Part2
+    # are LLM calls (I/O-bound), so calls fan out across a pool below.
+    def _qa_worker(call: Dict[str, Any]) -> Dict[str, Any]:
+        idx = call["index"]
+        audio_path = call["path"]
+        call_dir = out_root / f"call{idx}"
+        pre = pre_by_idx.get(idx) or {}
+        transcript_path = call_dir / "transcript.json"
+
+        # Load transcript (robust: supports code-fenced JSON inside raw_text)
+        try:
+            tdict = load_transcript_from_path(transcript_path)
+        except Exception:
+            tdict = {"segments": []}
+        _log_step(record_id, f"Call {idx}: transcript segments={len(tdict.get('segments') or [])}")
+
+        audibility = pre.get("audibility") or {"recording_exists": os.path.exists(audio_path), "audibility_level": "unknown", "avg_dbfs": None}
+        video_info = pre.get("video_info") or {}
 
         # QA report
         qa_path = call_dir / "qa_report.json"
@@ -510,8 +671,7 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
                 if save_qa_report:
                     save_qa_report(qdict, str(qa_path))
                 else:
-                    with open(qa_path, 'w') as f:
-                        json.dump(qdict, f)
+                    _write_json(qa_path, qdict)
                 _log_step(record_id, f"Call {idx}: qa_report.json saved")
                 log_progress(f"Call {idx} QA completed")
             except Exception:
@@ -521,8 +681,7 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
         try:
             existing = {}
             if qa_path.exists():
-                with open(qa_path) as f:
-                    existing = json.load(f)
+                existing = _json_loads(qa_path.read_bytes())
             existing.setdefault('technical_status', {})
             existing['technical_status'].update({
                 'recording_exists': bool(audibility.get('recording_exists')),
@@ -554,8 +713,7 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
                 dq.setdefault('spelling_errors_count', None)
                 dq.setdefault('typos_found', [])
                 dq.setdefault('notes', 'not evaluated')
-            with open(qa_path, 'w') as f:
-                json.dump(existing, f, indent=2)
+            _write_json(qa_path, existing, indent=True)
             _log_step(record_id, f"Call {idx}: qa_report.json enriched (tech/video placeholders)")
         except Exception:
             _log_step(record_id, f"Call {idx}: enrichment failed")
@@ -568,67 +726,88 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
                 if save_qc_part2:
                     save_qc_part2(qc2, str(qc2_path))
                 else:
-                    with open(qc2_path, 'w') as f:
-                        json.dump(qc2, f)
+                    _write_json(qc2_path, qc2)
                 _log_step(record_id, f"Call {idx}: qa_report_part2.json saved")
                 log_progress(f"Call {idx} QC completed")
             except Exception:
                 _log_step(record_id, f"Call {idx}: QC Part2 failed")
                 log_progress(f"Call {idx} QC failed")
 
-        # Compute duration via transcript max end for merged offsets
+        # Parse all segment timestamps once into parallel arrays; the merged
+        # pass and the duration estimate below reuse them instead of
+        # re-parsing MM:SS strings per segment.
+        starts: List[float] = []
+        ends: List[float] = []
         try:
-            max_end = 0.0
             for seg in (tdict.get('segments') or []):
-                e = parse_mmss_to_seconds(seg.get('end_timestamp','') or '')
-                if e is not None and e > max_end:
-                    max_end = e
+                st = parse_mmss_to_seconds(seg.get('start_timestamp','') or '') or 0.0
+                en = parse_mmss_to_seconds(seg.get('end_timestamp','') or '')
+                en = en if en is not None else st
+                starts.append(st)
+                ends.append(en)
+            max_end = max(ends) if ends else 0.0
         except Exception:
+            starts, ends = [], []
             max_end = 0.0
 
-        call_meta.append({
+        return {
             "index": idx,
             "audio_path": audio_path,
             "call_dir": str(call_dir),
             "transcript_path": str(transcript_path),
             "transcript": tdict,
+            "starts": starts,
+            "ends": ends,
             "duration_sec": max_end,
             "qa_path": str(qa_path),
             "qc_path": str(qc2_path),
             "audibility": audibility,
             "video_info": video_info,
-        })
+        }
 
-        results["calls"].append({"index": idx, "transcript": str(transcript_path), "qa_report": str(qa_path), "qc_report": str(qc2_path)})
+    if calls:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(calls), 8), thread_name_prefix="qa"
+        ) as ex:
+            call_meta = list(ex.map(_qa_worker, calls))
+    for m in call_meta:
+        results["calls"].append({"index": m["index"], "transcript": m["transcript_path"], "qa_report": m["qa_path"], "qc_report": m["qc_path"]})
 
     # Merged LLM runs across all calls
     try:
         _log_step(record_id, "Building merged transcript")
-        merged = {"segments": []}
+        merged_all: List[Dict[str, Any]] = []
         offset = 0.0
         for c in sorted(call_meta, key=lambda x: x["index"]):
             segs = (c.get("transcript") or {}).get("segments") or []
-            for s in segs:
-                try:
-                    st = parse_mmss_to_seconds(s.get('start_timestamp','') or '') or 0.0
-                    en = parse_mmss_to_seconds(s.get('end_timestamp','') or '') or st
-                except Exception:
-                    st, en = 0.0, 0.0
-                st2 = max(0.0, st + offset)
-                en2 = max(st2, en + offset)
-                merged["segments"].append({
+            c_starts = c.get("starts") or []
+            c_ends = c.get("ends") or []
+            if len(c_starts) != len(segs):
+                # Parse pass failed for this call; rebuild the arrays once
+                c_starts, c_ends = [], []
+                for s in segs:
+                    st = parse_mmss_to_seconds(s.get('start_timestamp', '') or '') or 0.0
+                    en = parse_mmss_to_seconds(s.get('end_timestamp', '') or '') or st
+                    c_starts.append(st)
+                    c_ends.append(en)
+            # One extend per call with pre-parsed timestamps: pure arithmetic,
+            # no per-segment append growth
+            merged_all.extend(
+                {
                     "segment_id": s.get("segment_id", ""),
                     "text": s.get("text", ""),
                     "speaker": s.get("speaker", ""),
-                    "start_timestamp": seconds_to_mmss(st2),
-                    "end_timestamp": seconds_to_mmss(en2),
-                })
+                    "start_timestamp": seconds_to_mmss(st2 := max(0.0, st + offset)),
+                    "end_timestamp": seconds_to_mmss(max(st2, en + offset)),
+                }
+                for s, st, en in zip(segs, c_starts, c_ends)
+            )
             offset += max(0.0, float(c.get("duration_sec") or 0.0))
+        merged = {"segments": merged_all}
 
         merged_dir = out_root
         merged_tr_path = merged_dir / "merged_transcript.json"
-        with open(merged_tr_path, 'w') as mf:
-            json.dump(merged, mf, indent=2)
+        _write_json(merged_tr_path, merged, indent=True)
         _log_step(record_id, f"Merged transcript saved -> {merged_tr_path} (segments={len(merged.get('segments') or [])})")
         log_progress("Merged transcription completed")
 
@@ -654,8 +833,7 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
                 if lv:
                     qdict.setdefault('video_analysis', {})
                     qdict['video_analysis'].update({'screenshots': lv.get('screenshots', [])})
-                with open(merged_qa_path, 'w') as f:
-                    json.dump(qdict, f, indent=2)
+                _write_json(merged_qa_path, qdict, indent=True)
                 _log_step(record_id, f"Merged qa_report saved -> {merged_qa_path}")
                 log_progress("Merged QA completed")
             except Exception:
@@ -667,8 +845,7 @@ def process_record(record_id: str, api_key: Optional[str] = None, force: bool =
             try:
                 _log_step(record_id, "Merged QC Part2 analysis")
                 qc2 = analyze_qc_part2(merged, api_key or os.environ.get("GEMINI_API_KEY", ""))
-                with open(merged_qc2_path, 'w') as f:
-                    json.dump(qc2, f, indent=2)
+                _write_json(merged_qc2_path, qc2, indent=True)
                 _log_step(record_id, f"Merged qa_report_part2 saved -> {merged_qc2_path}")
                 log_progress("Merged analysis completed")
             except Exception:
@@ -690,19 +867,20 @@ def analyze_audibility(path: str) -> Dict[str, Any]:
     if not os.path.exists(path):
         return {"recording_exists": False, "audibility_level": "not_audible", "avg_dbfs": None}
     try:
-        # Use ffmpeg to compute integrated loudness; suppress output
-        cmd = f"ffmpeg -i {shlex.quote(path)} -filter_complex loudnorm=I=-23:TP=-1.5:LRA=11:print_format=json -f null -"
-        proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=120)
+        # One ffmpeg pass decodes the file once: loudnorm and volumedetect
+        # chained in a single filter graph, both stats parsed from stderr
+        proc = subprocess.run(
+            ['ffmpeg', '-nostdin', '-hide_banner', '-i', path,
+             '-filter_complex', '[0:a]loudnorm=I=-23:TP=-1.5:LRA=11:print_format=json,volumedetect',
+             '-f', 'null', '-'],
+            capture_output=True, text=True, stdin=subprocess.DEVNULL, timeout=120)
         text = (proc.stderr or '') + '\n' + (proc.stdout or '')
         # Accept quoted numeric strings
-        m = re.search(r'\{[\s\S]*?\"input_i\"\s*:\s*\"?([\-0-9\.]+)\"?', text)
+        m = _RE_INPUT_I.search(text)
         val = float(m.group(1)) if m else None
         # Fallback: use volumedetect mean_volume if loudnorm parse failed
         if val is None:
-            cmd2 = f"ffmpeg -i {shlex.quote(path)} -af volumedetect -f null -"
-            p2 = subprocess.run(cmd2, shell=True, capture_output=True, text=True, timeout=60)
-            t2 = (p2.stderr or '') + '\n' + (p2.stdout or '')
-            m2 = re.search(r'mean_volume:\s*(-?\d+(?:\.\d+)?)\s*dB', t2)
+            m2 = _RE_MEAN_VOL.search(text)
             if m2:
                 val = float(m2.group(1))
         level = 'audible'
@@ -719,31 +897,59 @@ def extract_video_screenshots(video_path: str, out_dir: Path) -> List[str]:
     """Extract up to 3 screenshots at ~2-3 minute intervals using ffmpeg."""
     shots: List[str] = []
     try:
-        # Probe duration via ffprobe
-        cmd_dur = f"ffprobe -v error -show_entries format=duration -of default=noprint_wrappers=1:nokey=1 {shlex.quote(video_path)}"
-        dur_out = subprocess.check_output(cmd_dur, shell=True, text=True, timeout=30).strip()
-        dur = float(dur_out) if dur_out else 0.0
+        # Probe duration via the memoized ffprobe helper
+        dur = media_duration_seconds(video_path) or 0.0
         if dur <= 0:
             return shots
-        # Choose 3 timestamps across duration
+        # Choose 3 timestamps across duration and grab them all in one
+        # ffmpeg invocation: one -ss/-i pair per frame mapped to its output
         ts = [max(1, int(dur * p)) for p in (0.2, 0.5, 0.8)]
-        for i, sec in enumerate(ts, start=1):
-            out_path = out_dir / f"frame_{i:02d}.jpg"
-            cmd = f"ffmpeg -ss {sec} -i {shlex.quote(video_path)} -frames:v 1 -q:v 2 {shlex.quote(str(out_path))} -y"
-            subprocess.run(cmd, shell=True, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            if out_path.exists():
-                shots.append(str(out_path))
+        args = ['ffmpeg', '-y', '-nostdin', '-hide_banner', '-loglevel', 'error']
+        out_paths = []
+        for sec in ts:
+            args += ['-ss', str(sec), '-i', video_path]
+        for i in range(len(ts)):
+            out_path = out_dir / f"frame_{i + 1:02d}.jpg"
+            out_paths.append(out_path)
+            args += ['-map', f'{i}:v:0', '-frames:v', '1', '-q:v', '2', str(out_path)]
+        subprocess.run(args, check=False, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
+        shots = [str(p) for p in out_paths if p.exists()]
     except Exception:
         return shots
     return shots
 
 
+# Parsed-JSON cache keyed on (mtime_ns, size): the report files behind the
+# dashboard and detail endpoints rarely change between polls, so repeated
+# disk reads + parses collapse into a dict lookup. Bounded via move-to-end
+# eviction; callers must treat returned objects as read-only.
+_JSON_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_JSON_CACHE_LOCK = threading.Lock()
+_JSON_CACHE_MAX = 512
+
+
 def load_json_safe(path: Path) -> Dict[str, Any]:
+    key = str(path)
+    try:
+        st = os.stat(path)
+        sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return {}
+    with _JSON_CACHE_LOCK:
+        hit = _JSON_CACHE.get(key)
+        if hit is not None and hit[0] == sig:
+            _JSON_CACHE.move_to_end(key)
+            return hit[1]
     try:
-        with open(path) as f:
-            return json.load(f)
+        data = _json_loads(Path(path).read_bytes())
     except Exception:
         return {}
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[key] = (sig, data)
+        _JSON_CACHE.move_to_end(key)
+        while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+            _JSON_CACHE.popitem(last=False)
+    return data
 
 
 def as_dict(value: Any) -> Dict[str, Any]:
@@ -756,29 +962,69 @@ def is_record_staged_only(base: Path) -> bool:
     return str(data.get("status") or "").strip().lower() == "staged"
 
 
+def _attach_numeric_timestamps(transcript: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse MM:SS timestamps into start_s/end_s floats once at load time.
+
+    Every downstream consumer (speaker distribution, WPM, duration
+    estimation) needs seconds, so parse each segment once here instead of
+    re-parsing the same strings per metric."""
+    try:
+        for seg in transcript.get('segments') or []:
+            if 'start_s' not in seg:
+                seg['start_s'] = parse_mmss_to_seconds(seg.get('start_timestamp', '') or '')
+            if 'end_s' not in seg:
+                seg['end_s'] = parse_mmss_to_seconds(seg.get('end_timestamp', '') or '')
+    except Exception:
+        pass
+    return transcript
+
+
 def load_transcript_from_path(path: Path) -> Dict[str, Any]:
     """Load a transcript JSON and normalize shape to {segments:[...]},
     supporting the code-fenced JSON stored under raw_text."""
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = _json_loads(Path(path).read_bytes())
     except Exception:
         return {"segments": []}
     if isinstance(data, dict) and data.get('segments'):
-        return data
+        return _attach_numeric_timestamps(data)
     if isinstance(data, dict) and isinstance(data.get('raw_text'), str):
         parsed = parse_codefenced_json(data['raw_text'])
         if isinstance(parsed, dict) and parsed.get('segments'):
-            return parsed
+            return _attach_numeric_timestamps(parsed)
     return {"segments": []}
 
 
+_LEAN_SEGMENT_KEYS = ('start_timestamp', 'end_timestamp', 'speaker', 'text')
+
+
+def load_transcript_projection(path: Path) -> Dict[str, Any]:
+    """Lean {segments:[...]} with only the fields the transcript view renders.
+
+    With ijson installed the file is stream-parsed so a multi-MB merged
+    transcript never materializes whole; otherwise the normal loader runs
+    and the projection still shrinks the response payload."""
+    if ijson is not None:
+        try:
+            with open(path, 'rb') as f:
+                return {"segments": [
+                    {k: seg.get(k) for k in _LEAN_SEGMENT_KEYS}
+                    for seg in ijson.items(f, 'segments.item')
+                ]}
+        except Exception:
+            pass
+    full = load_transcript_from_path(path)
+    return {"segments": [
+        {k: seg.get(k) for k in _LEAN_SEGMENT_KEYS}
+        for seg in (full.get('segments') or [])
+    ]}
+
+
 def read_json_file(file_path: str) -> Dict[str, Any]:
     if not os.path.exists(file_path):
         return {}
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _json_loads(Path(file_path).read_bytes())
     except Exception:
         return {}
 
@@ -794,7 +1040,7 @@ def parse_codefenced_json(text: str) -> Optional[Dict[str, Any]]:
         if cleaned.lower().startswith('json'):
             cleaned = cleaned[4:].lstrip('\n').lstrip()
     try:
-        return json.loads(cleaned)
+        return _json_loads(cleaned)
     except Exception:
         return None
 
@@ -803,24 +1049,30 @@ def load_transcript() -> Dict[str, Any]:
     data = read_json_file(TRANSCRIPT_PATH)
     # If already in expected shape
     if isinstance(data, dict) and data.get('segments'):
-        return data
+        return _attach_numeric_timestamps(data)
     # If raw_text holding JSON in codefence
     if isinstance(data, dict) and isinstance(data.get('raw_text'), str):
         parsed = parse_codefenced_json(data['raw_text'])
         if isinstance(parsed, dict) and parsed.get('segments'):
-            return parsed
+            return _attach_numeric_timestamps(parsed)
     # Fallback empty structure
     return {"segments": []}
 
 
+@lru_cache(maxsize=16384)
 def parse_mmss_to_seconds(ts: str) -> Optional[float]:
+    """Parse "MM:SS" (or "HH:MM:SS") into seconds.
+
+    Cached because the merge/metric passes parse the same strings over and
+    over — each segment's start usually equals the previous segment's end."""
     try:
-        parts = ts.split(':')
-        if len(parts) != 2:
+        i = ts.find(':')
+        if i <= 0:
             return None
-        minutes = int(parts[0])
-        seconds = int(parts[1])
-        return minutes * 60 + seconds
+        j = ts.find(':', i + 1)
+        if j < 0:
+            return int(ts[:i]) * 60 + int(ts[i + 1:])
+        return int(ts[:i]) * 3600 + int(ts[i + 1:j]) * 60 + int(ts[j + 1:])
     except Exception:
         return None
 
@@ -835,14 +1087,48 @@ def seconds_to_mmss(total_seconds: float) -> str:
         return "0:00"
 
 
-def media_duration_seconds(path: str) -> Optional[float]:
-    """Probe media duration using ffprobe for any container/codec."""
+# Durations survive restarts via a JSON sidecar; keys embed mtime/size so a
+# changed file never serves a stale entry.
+_FFPROBE_CACHE_PATH = Path(RECORDS_DIR) / "_ffprobe_cache.json"
+try:
+    _FFPROBE_CACHE: Dict[str, float] = dict(_json_loads(_FFPROBE_CACHE_PATH.read_bytes()))
+except Exception:
+    _FFPROBE_CACHE = {}
+_FFPROBE_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _probe_duration_cached(path: str, mtime_ns: int, size: int) -> Optional[float]:
+    # mtime_ns/size are part of the key so edits to the file bust the cache
+    key = f"{path}:{mtime_ns}:{size}"
+    with _FFPROBE_CACHE_LOCK:
+        if key in _FFPROBE_CACHE:
+            return _FFPROBE_CACHE[key]
     try:
-        cmd = f"ffprobe -v error -show_entries format=duration -of default=noprint_wrappers=1:nokey=1 {shlex.quote(path)}"
-        out = subprocess.check_output(cmd, shell=True, text=True, timeout=30).strip()
-        return float(out) if out else None
+        out = subprocess.check_output(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', path],
+            text=True, stdin=subprocess.DEVNULL, timeout=30).strip()
+        dur = float(out) if out else None
     except Exception:
         return None
+    if dur is not None:
+        with _FFPROBE_CACHE_LOCK:
+            _FFPROBE_CACHE[key] = dur
+            try:
+                _write_json(_FFPROBE_CACHE_PATH, _FFPROBE_CACHE)
+            except Exception:
+                pass
+    return dur
+
+
+def media_duration_seconds(path: str) -> Optional[float]:
+    """Probe media duration using ffprobe for any container/codec (memoized per file state)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _probe_duration_cached(path, st.st_mtime_ns, st.st_size)
 
 
 def split_audio_into_chunks(src_path: str, out_dir: Path, chunk_seconds: int = 600) -> List[str]:
@@ -855,57 +1141,148 @@ def split_audio_into_chunks(src_path: str, out_dir: Path, chunk_seconds: int = 6
             except Exception: pass
     except Exception:
         pass
+    # Have the segment muxer write its own list of emitted chunks; reading
+    # that one small file replaces a glob + sort of the output directory.
+    list_path = out_dir / 'chunks.txt'
     try:
-        cmd = (
-            f"ffmpeg -y -hide_banner -loglevel error -i {shlex.quote(src_path)} "
-            f"-vn -acodec libmp3lame -q:a 2 -f segment -segment_time {int(chunk_seconds)} "
-            f"{shlex.quote(str(out_dir / 'chunk_%03d.mp3'))}"
-        )
-        subprocess.run(cmd, shell=True, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1200)
+        subprocess.run(
+            ['ffmpeg', '-y', '-nostdin', '-hide_banner', '-loglevel', 'error', '-i', str(src_path),
+             '-vn', '-acodec', 'libmp3lame', '-q:a', '2',
+             '-f', 'segment', '-segment_time', str(int(chunk_seconds)),
+             '-segment_list', str(list_path), '-segment_list_type', 'flat',
+             str(out_dir / 'chunk_%03d.mp3')],
+            check=False, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1200)
     except Exception:
         pass
+    try:
+        with open(list_path) as f:
+            names = [ln.strip() for ln in f if ln.strip()]
+        if names:
+            return [str(out_dir / n) for n in names]
+    except OSError:
+        pass
     return [str(p) for p in sorted(out_dir.glob('chunk_*.mp3'))]
 
 
+def split_and_transcribe_streaming(src_path: str, out_dir: Path, api_key: Optional[str],
+                                   record_id: str, call_idx: int,
+                                   chunk_seconds: int = 300) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Segment audio and transcribe chunks as ffmpeg emits them.
+
+    The segment muxer writes chunk files incrementally, so a chunk is
+    complete as soon as its successor appears (and all of them once ffmpeg
+    exits). Each completed chunk is submitted to _transcribe_one
+    immediately, overlapping transcription with the remaining
+    segmentation instead of waiting for the full split."""
+    import time as _time
+    out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        for f in out_dir.glob('chunk_*.mp3'):
+            try: f.unlink()
+            except Exception: pass
+    except Exception:
+        pass
+    proc = subprocess.Popen(
+        ['ffmpeg', '-y', '-nostdin', '-hide_banner', '-loglevel', 'error', '-i', str(src_path),
+         '-vn', '-acodec', 'libmp3lame', '-q:a', '2',
+         '-f', 'segment', '-segment_time', str(int(chunk_seconds)),
+         str(out_dir / 'chunk_%03d.mp3')],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    futures: Dict[str, Any] = {}
+    deadline = _time.monotonic() + 1200
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix=f"call{call_idx}-tx") as ex:
+        while True:
+            done = proc.poll() is not None
+            present = sorted(str(p) for p in out_dir.glob('chunk_*.mp3'))
+            # Without ffmpeg's exit the newest chunk may still be open
+            ready = present if done else present[:-1]
+            for sp in ready:
+                if sp not in futures:
+                    _log_step(record_id, f"Call {call_idx}: chunk ready -> {sp}")
+                    futures[sp] = ex.submit(_transcribe_one, sp, api_key)
+            if done:
+                break
+            if _time.monotonic() > deadline:
+                _log_step(record_id, f"Call {call_idx}: segmentation timed out; killing ffmpeg")
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+                break
+            _time.sleep(0.5)
+        chunk_paths = sorted(futures)
+        pieces = []
+        for sp in chunk_paths:
+            try:
+                pieces.append(futures[sp].result(timeout=240.0))
+            except Exception as e:
+                _log_step(record_id, f"Call {call_idx}: chunk {sp} failed: {e}")
+                pieces.append({"segments": []})
+    return chunk_paths, pieces
+
+
+# One long-lived pool for timeout-guarded model calls: _transcribe_one used to
+# spin up (and tear down) a single-worker executor per invocation.
+_TX_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="tx")
+
+# Back-pressure across records: per-call pools are capped at 8 workers each,
+# but batch re-processing runs several records at once, so total in-flight
+# Gemini requests could spike unbounded and trip API throttling.
+_GEMINI_SEM = threading.BoundedSemaphore(int(os.environ.get('GEMINI_MAX_INFLIGHT', 16)))
+
+
+@lru_cache(maxsize=1)
+def _transcribe_accepts_timeout() -> bool:
+    """True when transcribe_audio takes a timeout= kwarg (socket deadline)."""
+    try:
+        import inspect
+        return 'timeout' in inspect.signature(transcribe_audio).parameters
+    except Exception:
+        return False
+
+
 def _transcribe_one(path: str, api_key: Optional[str]) -> Dict[str, Any]:
     if not transcribe_audio:
         return {"segments": []}
     try:
         _log_step("transcribe_one", f"START transcription: {path}")
         import time as _time
-        import concurrent.futures as _cf
         t0 = _time.monotonic()
-        # Run the model call with a hard timeout to avoid indefinite hangs
+        # Enforce the deadline inside the client when it supports one: a
+        # socket-level timeout actually aborts the HTTP call, whereas the
+        # executor guard leaves the worker thread running after we give up.
+        key = api_key or os.environ.get("GEMINI_API_KEY", "")
         try:
-            with _cf.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tx-one") as _exe:
-                _future = _exe.submit(transcribe_audio, path, api_key or os.environ.get("GEMINI_API_KEY", ""))
-                result = _future.result(timeout=240.0)
-        except _cf.TimeoutError:
+            with _GEMINI_SEM:
+                if _transcribe_accepts_timeout():
+                    result = transcribe_audio(path, key, timeout=240.0)
+                else:
+                    _future = _TX_EXEC.submit(transcribe_audio, path, key)
+                    result = _future.result(timeout=240.0)
+        except concurrent.futures.TimeoutError:
             dur = _time.monotonic() - t0
             _log_step("transcribe_one", f"TIMEOUT transcription: {path} after {dur:.1f}s")
             return {"segments": []}
         # Handle case where Gemini returns raw_text instead of parsed JSON
         if isinstance(result, dict) and "raw_text" in result and "segments" not in result:
-            import json
-            import re
             raw_text = result["raw_text"]
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', raw_text, re.DOTALL)
+            json_match = _RE_CODEFENCE_JSON.search(raw_text)
             if json_match:
                 try:
-                    parsed = json.loads(json_match.group(1))
+                    parsed = _json_loads(json_match.group(1))
                     dur = _time.monotonic() - t0
                     _log_step("transcribe_one", f"DONE transcription (codefence JSON): {path} in {dur:.1f}s segs={len(parsed.get('segments', []) or [])}")
                     return parsed
-                except json.JSONDecodeError:
+                except Exception:
                     pass
-            json_match = re.search(r'(\{.*"segments".*\})', raw_text, re.DOTALL)
+            json_match = _RE_INLINE_JSON.search(raw_text)
             if json_match:
                 try:
-                    parsed = json.loads(json_match.group(1))
+                    parsed = _json_loads(json_match.group(1))
                     dur = _time.monotonic() - t0
                     _log_step("transcribe_one", f"DONE transcription (inline JSON): {path} in {dur:.1f}s segs={len(parsed.get('segments', []) or [])}")
                     return parsed
-                except json.JSONDecodeError:
+                except Exception:
                     pass
         dur = _time.monotonic() - t0
         segs_len = 0
@@ -955,54 +1332,137 @@ def transcribe_in_parallel(paths: List[str], api_key: Optional[str], record_id:
     return [r or {"segments": []} for r in results]
 
 
-def compute_speaker_distribution(transcript: Dict[str, Any], total_duration: Optional[float]) -> Dict[str, Any]:
+def compute_transcript_metrics(transcript: Dict[str, Any], total_duration: Optional[float]) -> Dict[str, Any]:
+    """Walk the segments list once and return speaker distribution plus WPM.
+
+    Fuses what compute_speaker_distribution and compute_wpm used to do in
+    separate passes; the metadata endpoints previously iterated the same
+    transcript two or three times per request."""
     segments: List[Dict[str, Any]] = transcript.get('segments', []) or []
-    speaker_to_secs: Dict[str, float] = {"agent": 0.0, "customer": 0.0}
+    # Single pass with scalar accumulators; timestamps come pre-parsed from
+    # the lru-cached parser. "doctor" is treated as the legacy "agent" alias.
+    agent_secs = 0.0
+    customer_secs = 0.0
+    doctor_words = 0
+    customer_words = 0
     covered_intervals: List[Tuple[float, float]] = []
-
+    parse = parse_mmss_to_seconds
     for seg in segments:
-        start = parse_mmss_to_seconds(seg.get('start_timestamp', ''))
-        end = parse_mmss_to_seconds(seg.get('end_timestamp', ''))
-        spk_raw = str(seg.get('speaker', '')).lower()
-        # Normalize speaker aliases: treat "doctor" the same as legacy "agent"
-        spk = 'agent' if spk_raw == 'doctor' else spk_raw
+        # Loaders stamp numeric start_s/end_s at ingest; parse only for
+        # older cached transcripts that predate the fields.
+        start = seg.get('start_s')
+        if start is None:
+            start = parse(seg.get('start_timestamp', ''))
+        end = seg.get('end_s')
+        if end is None:
+            end = parse(seg.get('end_timestamp', ''))
         if start is None or end is None or end <= start:
             continue
-        duration = max(0.0, end - start)
-        if spk in speaker_to_secs:
-            speaker_to_secs[spk] += duration
+        spk = str(seg.get('speaker', '')).lower()
+        # str.split() with no argument already drops empty tokens
+        if spk in ('agent', 'doctor'):
+            agent_secs += end - start
+            doctor_words += len(str(seg.get('text', '') or '').split())
+        elif spk == 'customer':
+            customer_secs += end - start
+            customer_words += len(str(seg.get('text', '') or '').split())
         covered_intervals.append((start, end))
 
-    # Estimate dead air as gaps in union of intervals if total_duration known
+    # Estimate dead air as gaps in union of intervals if total_duration known.
+    # Sort + running merge accumulates the spoken total without materializing
+    # the merged interval list.
     dead_air = 0.0
     if total_duration and covered_intervals:
-        covered_intervals.sort(key=lambda x: x[0])
-        merged: List[Tuple[float, float]] = []
+        covered_intervals.sort()
+        spoken_total = 0.0
         cur_start, cur_end = covered_intervals[0]
         for s, e in covered_intervals[1:]:
             if s <= cur_end:
-                cur_end = max(cur_end, e)
+                if e > cur_end:
+                    cur_end = e
             else:
-                merged.append((cur_start, cur_end))
+                spoken_total += cur_end - cur_start
                 cur_start, cur_end = s, e
-        merged.append((cur_start, cur_end))
-        spoken_total = sum(e - s for s, e in merged)
+        spoken_total += cur_end - cur_start
         dead_air = max(0.0, float(total_duration) - spoken_total)
 
-    total_parts = sum(speaker_to_secs.values()) + (dead_air if total_duration else 0.0)
+    total_parts = agent_secs + customer_secs + (dead_air if total_duration else 0.0)
     def pct(x: float) -> float:
         return round((x / total_parts) * 100.0, 2) if total_parts > 0 else 0.0
 
+    def safe_wpm(words: int, seconds: float) -> float:
+        return round((words / (seconds / 60.0)), 2) if seconds > 0 else 0.0
+
     return {
-        "agent_seconds": round(speaker_to_secs["agent"], 2),
-        "customer_seconds": round(speaker_to_secs["customer"], 2),
+        "agent_seconds": round(agent_secs, 2),
+        "customer_seconds": round(customer_secs, 2),
         "dead_air_seconds": round(dead_air, 2),
-        "agent_pct": pct(speaker_to_secs["agent"]),
-        "customer_pct": pct(speaker_to_secs["customer"]),
+        "agent_pct": pct(agent_secs),
+        "customer_pct": pct(customer_secs),
         "dead_air_pct": pct(dead_air if total_duration else 0.0),
+        "doctor_wpm": safe_wpm(doctor_words, agent_secs),
+        "customer_wpm": safe_wpm(customer_words, customer_secs),
     }
 
 
+def _stat_sig(p: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(p)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+# Speaker/WPM metrics keyed on the transcript file's stat signature plus the
+# duration they were computed against; metadata polls for an unchanged call
+# become a dict read.
+_METRICS_CACHE: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+_METRICS_LOCK = threading.Lock()
+
+
+def _transcript_metrics_cached(tr_path: Path, transcript: Dict[str, Any], total_duration: Optional[float]) -> Dict[str, Any]:
+    key = (_stat_sig(tr_path), total_duration)
+    with _METRICS_LOCK:
+        hit = _METRICS_CACHE.get(str(tr_path))
+        if hit is not None and hit[0] == key:
+            return hit[1]
+    res = compute_transcript_metrics(transcript, total_duration)
+    with _METRICS_LOCK:
+        _METRICS_CACHE[str(tr_path)] = (key, res)
+    return res
+
+
+# compute_qc_score results keyed per record on the merged reports' stat
+# signatures; dashboard polls stop re-walking the qa_matrix when nothing
+# changed on disk.
+_QC_SCORE_CACHE: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+_QC_SCORE_LOCK = threading.Lock()
+
+
+def _qc_score_cached(base: Path, qa: Dict[str, Any], qc2: Dict[str, Any], duration_sec: Optional[float]) -> Dict[str, Any]:
+    key = (
+        _stat_sig(base / 'merged_qa_report.json'),
+        _stat_sig(base / 'merged_qa_report_part2.json'),
+        duration_sec,
+    )
+    with _QC_SCORE_LOCK:
+        hit = _QC_SCORE_CACHE.get(str(base))
+        if hit is not None and hit[0] == key:
+            return hit[1]
+    score = compute_qc_score(qa, qc2, duration_sec)
+    with _QC_SCORE_LOCK:
+        _QC_SCORE_CACHE[str(base)] = (key, score)
+    return score
+
+
+def compute_speaker_distribution(transcript: Dict[str, Any], total_duration: Optional[float]) -> Dict[str, Any]:
+    m = compute_transcript_metrics(transcript, total_duration)
+    return {k: m[k] for k in (
+        "agent_seconds", "customer_seconds", "dead_air_seconds",
+        "agent_pct", "customer_pct", "dead_air_pct",
+    )}
+
+
 def compute_qc_score(qa_report: Dict[str, Any], qc2: Dict[str, Any], duration_sec: Optional[float]) -> Dict[str, Any]:
     qa_report = as_dict(qa_report)
     qc2 = as_dict(qc2)
@@ -1125,35 +1585,8 @@ def compute_qc_score(qa_report: Dict[str, Any], qc2: Dict[str, Any], duration_se
 
 
 def compute_wpm(transcript: Dict[str, Any]) -> Dict[str, float]:
-    segments: List[Dict[str, Any]] = transcript.get('segments', []) or []
-    totals = {
-        'doctor_words': 0,
-        'doctor_seconds': 0.0,
-        'customer_words': 0,
-        'customer_seconds': 0.0,
-    }
-    for seg in segments:
-        text = str(seg.get('text', '') or '')
-        start = parse_mmss_to_seconds(seg.get('start_timestamp', ''))
-        end = parse_mmss_to_seconds(seg.get('end_timestamp', ''))
-        if start is None or end is None or end <= start:
-            continue
-        duration = end - start
-        spk_raw = str(seg.get('speaker', '')).lower()
-        role = 'doctor' if spk_raw in ('doctor', 'agent') else ('customer' if spk_raw == 'customer' else None)
-        if not role:
-            continue
-        word_count = len([w for w in text.strip().split() if w])
-        totals[f'{role}_words'] += word_count
-        totals[f'{role}_seconds'] += duration
-
-    def safe_wpm(words: int, seconds: float) -> float:
-        return round((words / (seconds / 60.0)), 2) if seconds > 0 else 0.0
-
-    return {
-        'doctor_wpm': safe_wpm(totals['doctor_words'], totals['doctor_seconds']),
-        'customer_wpm': safe_wpm(totals['customer_words'], totals['customer_seconds']),
-    }
+    m = compute_transcript_metrics(transcript, None)
+    return {'doctor_wpm': m['doctor_wpm'], 'customer_wpm': m['customer_wpm']}
 
 
 def _normalize_status(value: Optional[str]) -> str:
@@ -1281,6 +1714,20 @@ def derive_top_metrics(report: Dict[str, Any], audio_duration: Optional[float])
 
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
+
+if orjson is not None:
+    class _OrjsonProvider(DefaultJSONProvider):
+        """Route jsonify through orjson; transcripts and qa_matrix payloads
+        serialize several times faster than with stdlib json."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
 app.secret_key = os.environ.get("APP_SECRET_KEY") or os.environ.get("SECRET_KEY") or "change-this-local-dev-secret"
 app.config.update(
     SESSION_COOKIE_HTTPONLY=True,
@@ -1303,7 +1750,10 @@ def inject_asset_version_final():
 def disable_cache_for_html_and_json_final(resp: Response):
     try:
         ct = resp.headers.get('Content-Type', '')
-        if ('text/html' in ct) or ('application/json' in ct):
+        # Views that set their own Cache-Control (cacheable 404s,
+        # ETag-validated report JSON) keep it; no-store is only the
+        # default for responses with no explicit policy.
+        if (('text/html' in ct) or ('application/json' in ct)) and 'Cache-Control' not in resp.headers:
             resp.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
             resp.headers['Pragma'] = 'no-cache'
             resp.headers['Expires'] = '0'
@@ -1544,11 +1994,11 @@ def api_metadata():
     transcript = load_transcript()
     report = read_json_file(QA_REPORT_PATH)
     duration_sec = effective_duration_seconds(AUDIO_PATH, transcript)
-    speaker_stats = compute_speaker_distribution(transcript, duration_sec)
     top = derive_top_metrics(report, duration_sec)
     return jsonify({
         "top": top,
-        "speaker": {**speaker_stats, **compute_wpm(transcript)},
+        # One fused pass covers both the distribution and WPM figures
+        "speaker": compute_transcript_metrics(transcript, duration_sec),
     })
 
 @app.route('/api/qcscore')
@@ -1586,7 +2036,7 @@ def api_record_qcscore(rid: str):
         duration_sec = max_end if max_end>0 else None
     except Exception:
         duration_sec = None
-    return jsonify(compute_qc_score(qa, qc2, duration_sec))
+    return jsonify(_qc_score_cached(base, qa, qc2, duration_sec))
 
 
 @app.route('/api/records')
@@ -1604,102 +2054,213 @@ def api_records():
     return jsonify({"records": sorted(payload, key=lambda x: x["id"])})
 
 
-@app.route('/api/records_dashboard')
-def api_records_dashboard():
-    recs = scan_records()
-    out = []
-    for rid, rec in recs.items():
-        base = Path(RECORDS_DIR) / rid / '_processed'
-        staged_only = is_record_staged_only(base)
-        qa = as_dict(load_json_safe(base / 'merged_qa_report.json'))
-        qc2 = as_dict(load_json_safe(base / 'merged_qa_report_part2.json'))
-        is_processed = (not staged_only) and bool(qa or qc2 or load_json_safe(base / 'processing_summary.json'))
-        # compute metrics
+# Shared pool for overlapping small JSON reads; tasks never submit further
+# work into the pool, so nesting under the dashboard executor is safe.
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="io")
+
+
+def _batch_read_json(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Read several JSON files as one submitted batch.
+
+    Kernel-level batching (io_uring) is not portably available and liburing
+    is not a dependency here, so the batch is overlapped on a shared thread
+    pool instead: one submit, N completions, reads coalesce in the page
+    cache."""
+    if len(paths) <= 1:
+        return [load_json_safe(p) for p in paths]
+    return list(_IO_POOL.map(load_json_safe, paths))
+
+
+_DASHBOARD_ROW_SOURCES = (
+    'merged_qa_report.json', 'merged_qa_report_part2.json',
+    'processing_summary.json', 'merged_transcript.json', 'final_decision.json',
+)
+
+
+def _dashboard_row(rid: str, rec: Dict[str, Any]) -> Dict[str, Any]:
+    base = Path(RECORDS_DIR) / rid / '_processed'
+    # One scandir enumerates the record dir; the DirEntry stats answer
+    # both presence and freshness, so absent reports never pay an open()
+    # and the row-cache check costs no per-file stat calls.
+    present: Dict[str, int] = {}
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.name in _DASHBOARD_ROW_SOURCES or entry.name == 'dashboard_row.json':
+                    try:
+                        present[entry.name] = entry.stat().st_mtime_ns
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    # Pre-aggregated row written at pipeline time: one small read instead of
+    # five JSON loads plus a transcript walk. Used only while it is at least
+    # as new as every source report it was derived from.
+    row_mtime = present.get('dashboard_row.json')
+    if row_mtime is not None and all(
+            present[name] <= row_mtime
+            for name in _DASHBOARD_ROW_SOURCES if name in present):
+        row = as_dict(load_json_safe(base / 'dashboard_row.json'))
+        if row:
+            return row
+    to_read = [name for name in _DASHBOARD_ROW_SOURCES if name in present]
+    loaded = dict(zip(to_read, _batch_read_json([base / name for name in to_read])))
+    qa_raw = loaded.get('merged_qa_report.json') or {}
+    qc2_raw = loaded.get('merged_qa_report_part2.json') or {}
+    summary = loaded.get('processing_summary.json') or {}
+    tr = loaded.get('merged_transcript.json') or {}
+    decision = loaded.get('final_decision.json') or {}
+    staged_only = is_record_staged_only(base)
+    qa = as_dict(qa_raw)
+    qc2 = as_dict(qc2_raw)
+    is_processed = (not staged_only) and bool(qa or qc2 or summary)
+    # compute metrics
+    duration = None
+    try:
         duration = None
+        # estimate via last segment end if available
+        max_end = 0.0
+        for s in (tr.get('segments') or []):
+            try:
+                m, s2 = str(s.get('end_timestamp','0:00')).split(':')
+                t = int(m)*60 + int(s2)
+                if t>max_end: max_end = t
+            except Exception:
+                pass
+        duration = max_end if max_end>0 else None
+    except Exception:
+        pass
+    top = derive_top_metrics(qa, duration)
+    # categorize based on final_decision.json if exists
+    category = 'staged'
+    if is_processed:
+        category = 'pass'
+    if is_processed and decision:
+        if (decision.get('ASSIGNBACK') or []):
+            category = 'assignback'
+        elif (decision.get('OPS_ATTENTION') or []):
+            category = 'ops_attention'
+        elif (decision.get('TECH_ISSUES') or []):
+            category = 'tech_issues'
+        elif (decision.get('FLAGS') or []):
+            category = 'flags'
+    media_types = sorted({
+        Path(c.get("name", "")).suffix.lower().lstrip(".") or "media"
+        for c in (rec.get("calls") or [])
+    })
+    media_links = [
+        {
+            "index": c.get("index"),
+            "name": c.get("name"),
+            "url": f"/api/records/{rid}/calls/{c.get('index')}/audio",
+            "type": Path(c.get("name", "")).suffix.lower().lstrip(".") or "media",
+        }
+        for c in (rec.get("calls") or [])
+    ]
+    return {
+        'id': rid,
+        'customerName': qa.get('personal_particulars', {}).get('name') or '-',
+        'doctorName': (qa.get('meta', {}) or {}).get('doctor_name') or '-',
+        'insurerName': INSURER_NAME,
+        'date': (qa.get('meta', {}) or {}).get('date') or '-',
+        'duration': top.get('duration') or '-',
+        'accuracy': top.get('accuracy') if is_processed else None,
+        'questionsAsked': f"{top.get('questions_asked') or 0}/{top.get('total_questions') or 0}" if is_processed else '-',
+        'category': category,
+        'status': 'processed' if is_processed else 'staged',
+        'numCalls': len(rec.get('calls', [])),
+        'mediaTypes': media_types,
+        'merAvailable': bool(rec.get('mer_pdf')),
+        'merUrl': f"/api/records/{rid}/mer" if rec.get('mer_pdf') else None,
+        'mediaLinks': media_links,
+        'storage': 'local_routes',
+        'issues': (qa.get('summary') or {}).get('critical_issues') or [],
+        'qcScore': (_qc_score_cached(base, qa, qc2, duration) or {}).get('total_score', 0) if is_processed else None
+    }
+
+
+def write_dashboard_row(record_id: str) -> None:
+    """Persist the record's dashboard row once, right after processing.
+
+    The dashboard endpoint then serves the canned dict instead of
+    recomputing metrics on every poll; _dashboard_row falls back to the
+    full computation whenever the file is missing or stale."""
+    try:
+        rec = get_record(record_id)
+        if not rec:
+            return
+        base = Path(RECORDS_DIR) / record_id / '_processed'
+        row_path = base / 'dashboard_row.json'
+        # Build from sources, not from a previously cached row
         try:
-            tr = load_json_safe(base / 'merged_transcript.json')
-            duration = None
-            # estimate via last segment end if available
-            max_end = 0.0
-            for s in (tr.get('segments') or []):
-                try:
-                    m, s2 = str(s.get('end_timestamp','0:00')).split(':')
-                    t = int(m)*60 + int(s2)
-                    if t>max_end: max_end = t
-                except Exception:
-                    pass
-            duration = max_end if max_end>0 else None
-        except Exception:
+            row_path.unlink()
+        except OSError:
             pass
-        top = derive_top_metrics(qa, duration)
-        # categorize based on final_decision.json if exists
-        decision = load_json_safe(base / 'final_decision.json')
-        category = 'staged'
-        if is_processed:
-            category = 'pass'
-        if is_processed and decision:
-            if (decision.get('ASSIGNBACK') or []):
-                category = 'assignback'
-            elif (decision.get('OPS_ATTENTION') or []):
-                category = 'ops_attention'
-            elif (decision.get('TECH_ISSUES') or []):
-                category = 'tech_issues'
-            elif (decision.get('FLAGS') or []):
-                category = 'flags'
-        media_types = sorted({
-            Path(c.get("name", "")).suffix.lower().lstrip(".") or "media"
-            for c in (rec.get("calls") or [])
-        })
-        media_links = [
-            {
-                "index": c.get("index"),
-                "name": c.get("name"),
-                "url": f"/api/records/{rid}/calls/{c.get('index')}/audio",
-                "type": Path(c.get("name", "")).suffix.lower().lstrip(".") or "media",
-            }
-            for c in (rec.get("calls") or [])
-        ]
-        out.append({
-            'id': rid,
-            'customerName': qa.get('personal_particulars', {}).get('name') or '-',
-            'doctorName': (qa.get('meta', {}) or {}).get('doctor_name') or '-',
-            'insurerName': INSURER_NAME,
-            'date': (qa.get('meta', {}) or {}).get('date') or '-',
-            'duration': top.get('duration') or '-',
-            'accuracy': top.get('accuracy') if is_processed else None,
-            'questionsAsked': f"{top.get('questions_asked') or 0}/{top.get('total_questions') or 0}" if is_processed else '-',
-            'category': category,
-            'status': 'processed' if is_processed else 'staged',
-            'numCalls': len(rec.get('calls', [])),
-            'mediaTypes': media_types,
-            'merAvailable': bool(rec.get('mer_pdf')),
-            'merUrl': f"/api/records/{rid}/mer" if rec.get('mer_pdf') else None,
-            'mediaLinks': media_links,
-            'storage': 'local_routes',
-            'issues': (qa.get('summary') or {}).get('critical_issues') or [],
-            'qcScore': (compute_qc_score(qa, qc2, duration) or {}).get('total_score', 0) if is_processed else None
-        })
-    return jsonify({'records': out})
+        _write_json(row_path, _dashboard_row(record_id, rec))
+    except Exception:
+        pass
+
+
+@app.route('/api/records_dashboard')
+def api_records_dashboard():
+    recs = scan_records()
+    if not recs:
+        return jsonify({'records': []})
+    items = list(recs.items())
+
+    def _dumps_row(row: Dict[str, Any]) -> bytes:
+        return orjson.dumps(row) if orjson is not None else json.dumps(row).encode('utf-8')
+
+    def generate():
+        # Each row does several JSON reads; overlap the file I/O across
+        # threads and stream rows out as they complete instead of buffering
+        # the whole payload for a second jsonify pass
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(items))) as ex:
+            yield b'{"records":['
+            first = True
+            for row in ex.map(lambda kv: _dashboard_row(kv[0], kv[1]), items):
+                if not first:
+                    yield b','
+                first = False
+                yield _dumps_row(row)
+            yield b']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+# Record processing is heavy (Gemini calls + ffmpeg); bound the worker
+# count and dedupe per record id so repeated POSTs can't trample each other.
+_PROCESS_EXEC = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get('PROCESS_WORKERS', 4)), thread_name_prefix="proc")
+_INFLIGHT: set = set()
+_INFLIGHT_LOCK = threading.Lock()
 
 
 @app.route('/api/records/<rid>/process', methods=['POST'])
 def api_process_record(rid: str):
     api_key = request.headers.get('X-API-Key') or os.environ.get('GEMINI_API_KEY')
     force = (request.args.get('force','false').lower() in ('1','true','yes'))
-    # Run processing in a background thread so UI stays responsive
+    # Run processing on the bounded executor so UI stays responsive and a
+    # burst of POSTs queues instead of spawning a thread per request
     print(f"[api] /api/records/{rid}/process force={force} key={'yes' if api_key else 'no'}", flush=True)
-    t = threading.Thread(target=process_record, args=(rid, api_key, force), daemon=True)
-    t.start()
+    with _INFLIGHT_LOCK:
+        if rid in _INFLIGHT:
+            return jsonify({"status": "already_running", "id": rid})
+        _INFLIGHT.add(rid)
+    future = _PROCESS_EXEC.submit(process_record, rid, api_key, force)
+    future.add_done_callback(lambda _f, _rid=rid: _INFLIGHT.discard(_rid))
     return jsonify({"status": "started", "id": rid, "force": force})
 
 
 @app.route('/api/records/<rid>')
 def api_record_details(rid: str):
     base = Path(RECORDS_DIR) / rid / "_processed"
-    if (not base.exists()) or is_record_staged_only(base):
-        rec = scan_records().get(rid)
+    layout = _processed_layout(rid)
+    staged_only = 'staged.json' in layout["files"] and is_record_staged_only(base)
+    if (not layout["exists"]) or staged_only:
+        rec = get_record(rid)
         if not rec:
-            return jsonify({"error": "not_found"}), 404
+            return _cacheable_404({"error": "not_found"}, as_json=True)
         return jsonify({
             "id": rid,
             "status": "staged",
@@ -1719,7 +2280,7 @@ def api_record_details(rid: str):
 
     # Check if we have medb.py generated summary
     summary_path = base / 'processing_summary.json'
-    if summary_path.exists():
+    if 'processing_summary.json' in layout["files"]:
         summary = as_dict(load_json_safe(summary_path))
         if summary:
             # Convert medb.py format to expected format
@@ -1747,12 +2308,14 @@ def api_record_details(rid: str):
             aggregate = {"breakdown": {}, "total_score": 0, "max_score": 1600, "percentage": 0.0, "category": "Unknown"}
             
             final_decision = load_json_safe(base / 'final_decision.json')
-            return jsonify({"id": rid, "status": "processed", "calls": calls, "aggregate": aggregate, "merged": merged, "final_decision": final_decision})
+            return _conditional_json(
+                {"id": rid, "status": "processed", "calls": calls, "aggregate": aggregate, "merged": merged, "final_decision": final_decision},
+                summary_path, base / 'merged_qa_report.json', base / 'merged_qa_report_part2.json',
+                base / 'merged_transcript.json', base / 'final_decision.json')
 
     # Fallback to old format for backwards compatibility
     calls = []
-    for call_dir in sorted(base.glob('call*')):
-        idx = int(call_dir.name.replace('call',''))
+    for idx, call_dir in _call_dirs(base):
         qa_path = call_dir / 'qa_report.json'
         qc_path = call_dir / 'qa_report_part2.json'
         tr_path = call_dir / 'transcript.json'
@@ -1768,20 +2331,100 @@ def api_record_details(rid: str):
             "duration_sec": dur,
         })
 
-    # Include merged artifacts if present
+    # Include merged artifacts if present (one scandir told us what exists)
     merged = {}
     mqa = base / 'merged_qa_report.json'
     mqc = base / 'merged_qa_report_part2.json'
     mtr = base / 'merged_transcript.json'
-    if mqa.exists() or mqc.exists() or mtr.exists():
+    have = layout["files"]
+    if {'merged_qa_report.json', 'merged_qa_report_part2.json', 'merged_transcript.json'} & have:
         merged = {
-            "qa": as_dict(load_json_safe(mqa)) if mqa.exists() else {},
-            "qc": as_dict(load_json_safe(mqc)) if mqc.exists() else {},
-            "transcript": load_json_safe(mtr) if mtr.exists() else {},
+            "qa": as_dict(load_json_safe(mqa)) if 'merged_qa_report.json' in have else {},
+            "qc": as_dict(load_json_safe(mqc)) if 'merged_qa_report_part2.json' in have else {},
+            "transcript": load_json_safe(mtr) if 'merged_transcript.json' in have else {},
         }
 
     final_decision = load_json_safe(base / 'final_decision.json')
-    return jsonify({"id": rid, "status": "processed", "calls": sorted(calls, key=lambda x: x["index"]), "aggregate": {}, "merged": merged, "final_decision": final_decision})
+    return _conditional_json(
+        {"id": rid, "status": "processed", "calls": sorted(calls, key=lambda x: x["index"]), "aggregate": {}, "merged": merged, "final_decision": final_decision},
+        mqa, mqc, mtr, base / 'final_decision.json')
+
+
+# Snapshot of what exists under <rid>/_processed, keyed on the directory's
+# mtime; endpoints consult it instead of issuing an exists() syscall per file.
+_LAYOUT_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_LAYOUT_LOCK = threading.Lock()
+
+
+def _processed_layout(rid: str) -> Dict[str, Any]:
+    """One scandir of the processed directory: top-level file names plus a
+    {call_index: {file names}} map for the call subdirectories."""
+    base = Path(RECORDS_DIR) / rid / "_processed"
+    try:
+        mtime = os.stat(base).st_mtime_ns
+    except OSError:
+        return {"exists": False, "files": frozenset(), "calls": {}}
+    with _LAYOUT_LOCK:
+        hit = _LAYOUT_CACHE.get(rid)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+    files: set = set()
+    calls: Dict[int, set] = {}
+    try:
+        with os.scandir(base) as it:
+            for e in it:
+                if e.name.startswith('call') and e.name[4:].isdigit() and e.is_dir():
+                    sub: set = set()
+                    try:
+                        with os.scandir(e.path) as jt:
+                            sub = {c.name for c in jt}
+                    except OSError:
+                        pass
+                    calls[int(e.name[4:])] = sub
+                else:
+                    files.add(e.name)
+    except OSError:
+        return {"exists": False, "files": frozenset(), "calls": {}}
+    layout = {"exists": True, "files": files, "calls": calls}
+    with _LAYOUT_LOCK:
+        _LAYOUT_CACHE[rid] = (mtime, layout)
+    return layout
+
+
+def _call_dirs(base: Path) -> List[Tuple[int, Path]]:
+    """(index, path) for callN subdirectories, sorted numerically.
+
+    One scandir pass with DirEntry.is_dir beats Path.glob, which builds a
+    Path per child and runs fnmatch before the caller re-stats to sort."""
+    out: List[Tuple[int, Path]] = []
+    try:
+        with os.scandir(base) as it:
+            for e in it:
+                if e.name.startswith('call') and e.name[4:].isdigit() and e.is_dir():
+                    out.append((int(e.name[4:]), Path(e.path)))
+    except OSError:
+        return []
+    out.sort()
+    return out
+
+
+def _conditional_json(payload: Any, *source_paths: Path) -> Response:
+    """jsonify with ETag/Last-Modified derived from the source files' stats.
+
+    The report endpoints return deterministic JSON built from on-disk
+    files, so a validator lets browser refreshes come back as 304s
+    instead of re-reading and re-serializing the payload."""
+    rv = jsonify(payload)
+    sigs = [s for s in (_stat_sig(p) for p in source_paths) if s is not None]
+    if sigs:
+        rv.set_etag(hashlib.blake2b(repr(sorted(sigs)).encode(), digest_size=8).hexdigest())
+        rv.last_modified = max(s[0] for s in sigs) / 1e9
+        # Explicit policy: store but revalidate. The no-store hooks leave
+        # responses with their own Cache-Control alone, so this is what
+        # clients actually see.
+        rv.headers['Cache-Control'] = 'no-cache'
+        return rv.make_conditional(request)
+    return rv
 
 
 @app.route('/api/records/<rid>/final_decision')
@@ -1789,15 +2432,15 @@ def api_record_final_decision(rid: str):
     base = Path(RECORDS_DIR) / rid / "_processed"
     if not base.exists():
         return jsonify({})
-    return jsonify(load_json_safe(base / 'final_decision.json'))
+    return _conditional_json(load_json_safe(base / 'final_decision.json'), base / 'final_decision.json')
 
 
 @app.route('/api/records/<rid>/mer')
 def api_record_mer(rid: str):
-    rec = scan_records().get(rid, {})
+    rec = get_record(rid)
     mer_path = rec.get('mer_pdf') or str(Path(RECORDS_DIR) / rid / f"{rid}_MER.pdf")
     if not mer_path or not os.path.exists(mer_path):
-        return Response("MER PDF not found", status=404)
+        return _cacheable_404("MER PDF not found")
     url = _read_url_pointer_if_any(mer_path)
     if url:
         return redirect(url, code=302)
@@ -1808,21 +2451,21 @@ def api_record_mer(rid: str):
 @app.route('/api/records/<rid>/calls/<int:idx>/report')
 def api_record_call_report(rid: str, idx: int):
     base = Path(RECORDS_DIR) / rid / "_processed" / f"call{idx}"
+    mbase = Path(RECORDS_DIR) / rid / "_processed"
     data = load_json_safe(base / 'qa_report.json')
     if not data:
         # Fallback to merged
-        mbase = Path(RECORDS_DIR) / rid / "_processed"
         data = load_json_safe(mbase / 'merged_qa_report.json')
-    return jsonify(data)
+    return _conditional_json(data, base / 'qa_report.json', mbase / 'merged_qa_report.json')
 
 @app.route('/api/records/<rid>/calls/<int:idx>/report2')
 def api_record_call_report2(rid: str, idx: int):
     # Prefer merged Part 2 (QC) across calls to match dashboard design
     mbase = Path(RECORDS_DIR) / rid / "_processed"
+    base = mbase / f"call{idx}"
     data = load_json_safe(mbase / 'merged_qa_report_part2.json')
     if not data:
         # Fallback to per-call file if merged not present
-        base = Path(RECORDS_DIR) / rid / "_processed" / f"call{idx}"
         data = load_json_safe(base / 'qa_report_part2.json')
     if not data:
         # Final fallback: medb.py processing_summary carries merged under qa_part2
@@ -1831,73 +2474,113 @@ def api_record_call_report2(rid: str, idx: int):
             maybe = summary.get('qa_part2') or {}
             if maybe:
                 data = maybe
-    return jsonify(data)
+    return _conditional_json(data, mbase / 'merged_qa_report_part2.json',
+                             base / 'qa_report_part2.json', mbase / 'processing_summary.json')
 
 @app.route('/api/records/<rid>/calls/<int:idx>/transcript')
 def api_record_call_transcript(rid: str, idx: int):
     base = Path(RECORDS_DIR) / rid / "_processed" / f"call{idx}"
+    mbase = Path(RECORDS_DIR) / rid / "_processed"
+    lean = request.args.get('lean', 'false').lower() in ('1', 'true', 'yes')
+    if lean and (base / 'transcript.json').exists():
+        return _conditional_json(load_transcript_projection(base / 'transcript.json'),
+                                 base / 'transcript.json')
     t = load_transcript_from_path(base / 'transcript.json')
     if not (t.get('segments') or []):
-        mbase = Path(RECORDS_DIR) / rid / "_processed"
-        try:
-            with open(mbase / 'merged_transcript.json') as f:
-                t = json.load(f)
-        except Exception:
-            t = {"segments": []}
-    return jsonify(t)
+        t = _attach_numeric_timestamps(as_dict(load_json_safe(mbase / 'merged_transcript.json')) or {"segments": []})
+    return _conditional_json(t, base / 'transcript.json', mbase / 'merged_transcript.json')
 
 @app.route('/api/records/<rid>/calls/<int:idx>/metadata')
 def api_record_call_metadata(rid: str, idx: int):
     # Build top & speaker metadata from this call
     base = Path(RECORDS_DIR) / rid / "_processed" / f"call{idx}"
-    tr = load_transcript_from_path(base / 'transcript.json')
+    mbase = Path(RECORDS_DIR) / rid / "_processed"
+    tr_path = base / 'transcript.json'
+    tr = load_transcript_from_path(tr_path)
     qa = load_json_safe(base / 'qa_report.json')
     # Fallback to merged artifacts if per-call files are missing/empty
     if not qa:
-        mbase = Path(RECORDS_DIR) / rid / "_processed"
         qa = load_json_safe(mbase / 'merged_qa_report.json')
     if not (tr.get('segments') or []):
-        try:
-            with open(Path(RECORDS_DIR) / rid / "_processed" / 'merged_transcript.json') as f:
-                tr = json.load(f)
-        except Exception:
-            tr = {"segments": []}
+        # Shared with /transcript via the mtime-keyed JSON cache
+        tr_path = mbase / 'merged_transcript.json'
+        tr = _attach_numeric_timestamps(as_dict(load_json_safe(tr_path)) or {"segments": []})
     duration_sec = effective_duration_seconds(str(base / 'audio.mp3'), tr)
-    speaker_stats = compute_speaker_distribution(tr, duration_sec)
+    # One fused pass covers both the distribution and WPM figures
+    speaker_stats = _transcript_metrics_cached(tr_path, tr, duration_sec)
     top = derive_top_metrics(qa, duration_sec)
 
-    # Resolve MER PDF S3 URL (if local file replaced with URL pointer)
+    # Resolve MER PDF S3 URL: precomputed manifest map first, then the
+    # URL-pointer files, then the local serving route
     mer_url = None
     try:
-        recs = scan_records()
-        rec = recs.get(rid, {})
-        mer_pdf_path = rec.get('mer_pdf')
-        if mer_pdf_path and os.path.exists(mer_pdf_path):
-            mer_url = _read_url_pointer_if_any(mer_pdf_path)
+        rec = get_record(rid)
+        mer_url = _get_manifest()["mer_by_rid"].get(rid)
+        if (not mer_url):
+            mer_pdf_path = rec.get('mer_pdf')
+            if mer_pdf_path and os.path.exists(mer_pdf_path):
+                mer_url = _read_url_pointer_if_any(mer_pdf_path)
         if (not mer_url):
             fallback = Path(RECORDS_DIR) / f"{rid}_MER.pdf"
             if fallback.exists():
                 mer_url = _read_url_pointer_if_any(str(fallback))
-        # Final fallback: lookup in s3_manifest.json if present in repo
-        if (not mer_url):
-            man_path = Path(__file__).parent / 's3_manifest.json'
-            if man_path.exists():
-                try:
-                    with open(man_path, 'r', encoding='utf-8') as mf:
-                        man = json.load(mf)
-                    target_rel = f"reports and recordings/{rid}_MER.pdf"
-                    for item in man.get('items', []):
-                        if item.get('local_path') == target_rel:
-                            mer_url = item.get('presigned_url') or (f"s3://{item.get('bucket')}/{item.get('key')}")
-                            break
-                except Exception:
-                    pass
         if (not mer_url) and rec.get('mer_pdf'):
             mer_url = f"/api/records/{rid}/mer"
     except Exception:
         mer_url = None
 
-    return jsonify({"top": top, "speaker": {**speaker_stats, **compute_wpm(tr)}, "mer_pdf_url": mer_url})
+    return jsonify({"top": top, "speaker": speaker_stats, "mer_pdf_url": mer_url})
+
+@app.route('/api/records/<rid>/bundle')
+def api_record_bundle(rid: str):
+    """Everything the record view needs in one response.
+
+    The UI otherwise issues report/report2/transcript/metadata requests
+    per call plus details and final_decision — ~5K+2 round trips for K
+    calls. The loaders behind this are mtime-cached, so after the first
+    build this is mostly dict reads."""
+    base = Path(RECORDS_DIR) / rid / "_processed"
+    rec = get_record(rid)
+    if not rec and not base.exists():
+        return _cacheable_404({"error": "not_found"}, as_json=True)
+    indices: List[int] = []
+    if base.exists():
+        indices = [i for i, _ in _call_dirs(base)]
+    if not indices:
+        indices = [c.get('index') for c in rec.get('calls', []) if c.get('index')]
+    merged_qa = as_dict(load_json_safe(base / 'merged_qa_report.json'))
+    merged_qc2 = as_dict(load_json_safe(base / 'merged_qa_report_part2.json'))
+    calls = []
+    for i in indices:
+        cbase = base / f"call{i}"
+        tr = load_transcript_from_path(cbase / 'transcript.json')
+        if not (tr.get('segments') or []):
+            tr = as_dict(load_json_safe(base / 'merged_transcript.json')) or {"segments": []}
+        report = as_dict(load_json_safe(cbase / 'qa_report.json')) or merged_qa
+        report2 = merged_qc2 or as_dict(load_json_safe(cbase / 'qa_report_part2.json'))
+        duration_sec = effective_duration_seconds(str(cbase / 'audio.mp3'), tr)
+        calls.append({
+            "idx": i,
+            "report": report,
+            "report2": report2,
+            "transcript": tr,
+            "metadata": {
+                "top": derive_top_metrics(report, duration_sec),
+                "speaker": compute_transcript_metrics(tr, duration_sec),
+            },
+        })
+    payload = {
+        "id": rid,
+        "status": "processed" if (base.exists() and not is_record_staged_only(base)) else "staged",
+        "calls": calls,
+        "final_decision": load_json_safe(base / 'final_decision.json'),
+    }
+    return _conditional_json(
+        payload,
+        base / 'merged_qa_report.json', base / 'merged_qa_report_part2.json',
+        base / 'merged_transcript.json', base / 'final_decision.json',
+        base / 'processing_summary.json')
+
 
 @app.route('/api/records/<rid>/calls/<int:idx>/audio')
 def api_record_call_audio(rid: str, idx: int):
@@ -1910,8 +2593,7 @@ def api_record_call_audio(rid: str, idx: int):
             return redirect(url, code=302)
         return partial_response(audio_path)
     # Fallback to original scanned file if found
-    recs = scan_records()
-    rec = recs.get(rid, {})
+    rec = get_record(rid)
     calls = rec.get('calls', [])
     for c in calls:
         if c.get('index') == idx and os.path.exists(c.get('path','')):
@@ -1923,12 +2605,21 @@ def api_record_call_audio(rid: str, idx: int):
     # Fallback: look up S3 URL from manifest for the exact call index path only
     try:
         expected_lp = f"reports and recordings/{rid}/_processed/call{idx}/audio.mp3"
-        urls = _s3_manifest_lookup_urls(lambda lp: lp == expected_lp)
-        if urls:
-            return redirect(urls[0], code=302)
+        url = _manifest_lookup_exact(expected_lp)
+        if url:
+            return redirect(url, code=302)
     except Exception:
         pass
-    return Response("Audio not found", status=404)
+    return _cacheable_404("Audio not found")
+
+
+def _cacheable_404(body: Any, as_json: bool = False) -> Response:
+    """404s the UI polls repeatedly (missing audio, unprocessed records)
+    get a short public max-age so proxies and browsers stop re-asking."""
+    rv = jsonify(body) if as_json else Response(body, status=404)
+    rv.status_code = 404
+    rv.headers['Cache-Control'] = 'public, max-age=300'
+    return rv
 
 
 def _guess_audio_mime(path: str) -> str:
@@ -1942,38 +2633,71 @@ def _guess_audio_mime(path: str) -> str:
     return 'application/octet-stream'
 
 
+def _audio_cache_headers(rv: Response, path: str) -> Response:
+    """Media files are immutable once staged; let browsers/CDNs serve repeats."""
+    try:
+        st = os.stat(path)
+        rv.headers['Cache-Control'] = 'public, max-age=86400'
+        rv.set_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+        rv.last_modified = st.st_mtime
+    except OSError:
+        pass
+    return rv
+
+
+def _send_whole_file(path: str) -> Response:
+    # conditional=True lets werkzeug answer If-None-Match/Range itself and
+    # routes the body through wsgi.file_wrapper (sendfile when available).
+    # Its ETag must be left alone: swapping in our own after the
+    # conditional check hands clients a validator that never matches, so
+    # revalidations would always refetch the full body. Only the cache
+    # lifetime is ours to set here.
+    rv = send_file(path, conditional=True)
+    rv.headers['Cache-Control'] = 'public, max-age=86400'
+    return rv
+
+
 def partial_response(path: str) -> Response:
     file_size = os.path.getsize(path)
     range_header = request.headers.get('Range', None)
     if not range_header:
-        return send_file(path)
+        return _send_whole_file(path)
 
     bytes_unit, bytes_range = range_header.split('=')
     if bytes_unit != 'bytes':
-        return send_file(path)
+        return _send_whole_file(path)
     start_str, end_str = bytes_range.split('-')
     start = int(start_str) if start_str else 0
     end = int(end_str) if end_str else file_size - 1
     end = min(end, file_size - 1)
     length = end - start + 1
 
-    with open(path, 'rb') as f:
-        f.seek(start)
-        data = f.read(length)
-
-    rv = Response(data, 206, mimetype=_guess_audio_mime(path), direct_passthrough=True)
+    # Stream the range in fixed-size pieces; browsers routinely request
+    # multi-megabyte ranges and buffering them whole balloons RSS.
+    def _gen(remaining: int = length):
+        with open(path, 'rb') as f:
+            f.seek(start)
+            while remaining > 0:
+                buf = f.read(min(65536, remaining))
+                if not buf:
+                    break
+                remaining -= len(buf)
+                yield buf
+
+    rv = Response(_gen(), 206, mimetype=_guess_audio_mime(path), direct_passthrough=True)
     rv.headers.add('Content-Range', f'bytes {start}-{end}/{file_size}')
     rv.headers.add('Accept-Ranges', 'bytes')
     rv.headers.add('Content-Length', str(length))
-    return rv
+    return _audio_cache_headers(rv, path)
 
 
-def _read_url_pointer_if_any(path: str) -> Optional[str]:
-    """If the given file is a small text file containing a single HTTP(S) URL, return it."""
+@lru_cache(maxsize=4096)
+def _url_pointer(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Stat-keyed body of _read_url_pointer_if_any; real media files cache
+    as None so repeat Range requests skip the open entirely."""
+    if size > 2048:
+        return None
     try:
-        size = os.path.getsize(path)
-        if size > 2048:
-            return None
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read(2048).strip()
         first_line = content.splitlines()[0].strip() if content else ''
@@ -1984,20 +2708,96 @@ def _read_url_pointer_if_any(path: str) -> Optional[str]:
     return None
 
 
+def _read_url_pointer_if_any(path: str) -> Optional[str]:
+    """If the given file is a small text file containing a single HTTP(S) URL, return it."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _url_pointer(path, st.st_mtime_ns, st.st_size)
+
+
+# s3_manifest.json parsed once per on-disk version: the metadata and audio
+# endpoints used to open + json.load it on every request.
+_MANIFEST_CACHE: Dict[str, Any] = {"mtime": 0, "items": [], "by_local_path": {}, "mer_by_rid": {}}
+_MANIFEST_LOCK = threading.Lock()
+_MANIFEST_MER_RE = re.compile(r"reports and recordings/(.+?)_MER\.pdf$")
+
+
+def _get_manifest() -> Dict[str, Any]:
+    """Return {items, by_local_path} for s3_manifest.json, reloading on mtime change."""
+    man_path = Path(__file__).parent / 's3_manifest.json'
+    try:
+        mtime = os.stat(man_path).st_mtime_ns
+    except OSError:
+        return {"items": [], "by_local_path": {}}
+    with _MANIFEST_LOCK:
+        if _MANIFEST_CACHE["mtime"] == mtime:
+            return _MANIFEST_CACHE
+        try:
+            man = _json_loads(man_path.read_bytes())
+            items = man.get('items', []) or []
+        except Exception:
+            items = []
+        mer_by_rid: Dict[str, str] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            m = _MANIFEST_MER_RE.match(item.get('local_path') or '')
+            if m:
+                url = _manifest_item_url(item)
+                if url:
+                    mer_by_rid[m.group(1)] = url
+        _MANIFEST_CACHE.update(
+            mtime=mtime,
+            items=items,
+            by_local_path={item.get('local_path'): item for item in items if isinstance(item, dict)},
+            mer_by_rid=mer_by_rid,
+        )
+        return _MANIFEST_CACHE
+
+
+def _manifest_item_url(item: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not item:
+        return None
+    return item.get('presigned_url') or (f"s3://{item.get('bucket')}/{item.get('key')}")
+
+
+# Optional sqlite index over the manifest (scripts/build_manifest_db.py);
+# when present, cold-start exact lookups become one indexed SELECT instead
+# of parsing the whole JSON in every worker.
+_MANIFEST_DB: Optional[Any] = None
+_MANIFEST_DB_LOCK = threading.Lock()
+
+
+def _manifest_lookup_exact(local_path: str) -> Optional[str]:
+    global _MANIFEST_DB
+    db_path = Path(__file__).parent / 's3_manifest.sqlite'
+    if db_path.exists():
+        try:
+            with _MANIFEST_DB_LOCK:
+                if _MANIFEST_DB is None:
+                    import sqlite3
+                    _MANIFEST_DB = sqlite3.connect(str(db_path), check_same_thread=False)
+                row = _MANIFEST_DB.execute(
+                    "SELECT presigned_url, bucket, key FROM manifest WHERE local_path = ?",
+                    (local_path,)).fetchone()
+            if row:
+                return row[0] or f"s3://{row[1]}/{row[2]}"
+        except Exception:
+            pass
+    return _manifest_item_url(_get_manifest()["by_local_path"].get(local_path))
+
+
 def _s3_manifest_lookup_urls(pattern_fn) -> List[str]:
     """Return list of presigned URLs (or s3:// URIs) from s3_manifest.json matching the given predicate on local_path."""
     results: List[str] = []
     try:
-        man_path = Path(__file__).parent / 's3_manifest.json'
-        if not man_path.exists():
-            return results
-        with open(man_path, 'r', encoding='utf-8') as mf:
-            man = json.load(mf)
-        for item in man.get('items', []):
+        for item in _get_manifest()["items"]:
             lp = item.get('local_path') or ''
             try:
                 if pattern_fn(lp):
-                    url = item.get('presigned_url') or (f"s3://{item.get('bucket')}/{item.get('key')}")
+                    url = _manifest_item_url(item)
                     if url:
                         results.append(url)
             except Exception:
@@ -2010,7 +2810,7 @@ def _s3_manifest_lookup_urls(pattern_fn) -> List[str]:
 @app.route('/audio')
 def audio_stream():
     if not os.path.exists(AUDIO_PATH):
-        return Response("Audio not found", status=404)
+        return _cacheable_404("Audio not found")
     url = _read_url_pointer_if_any(AUDIO_PATH)
     if url:
         return redirect(url, code=302)
@@ -2018,6 +2818,8 @@ def audio_stream():
 
 
 if __name__ == '__main__':
+    # Dev-only entrypoint; production runs gunicorn -c gunicorn_conf.py app:app
     host = os.environ.get('HOST', '127.0.0.1')
     port = int(os.environ.get('PORT', '5000'))
-    app.run(host=host, port=port, debug=True, threaded=True)
+    debug = os.environ.get('FLASK_DEBUG', 'false').lower() in ('1', 'true', 'yes')
+    app.run(host=host, port=port, debug=debug, threaded=True)
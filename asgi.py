@@ -0,0 +1,38 @@
+"""ASGI entrypoint so the proxy endpoints can run under Uvicorn.
+
+The Flask dev server (app.run) handles one request per thread; the API
+endpoints are almost entirely I/O-bound (JSON file reads, S3 pointer
+resolution), so serving them through an asyncio event loop multiplexes
+concurrent requests without per-thread overhead.
+
+Run with:
+    uvicorn asgi:asgi_app --workers 2
+"""
+
+import os
+
+from app import app
+
+try:
+    # Preferred: a2wsgi keeps blocking Flask views off the event loop
+    from a2wsgi import WSGIMiddleware
+except ImportError:
+    try:
+        from uvicorn.middleware.wsgi import WSGIMiddleware
+    except ImportError:
+        WSGIMiddleware = None
+
+
+def _build() -> object:
+    if WSGIMiddleware is None:
+        return None
+    # a2wsgi sizes the thread pool that runs the blocking Flask views;
+    # the endpoints are file-I/O bound so a generous pool is cheap.
+    try:
+        return WSGIMiddleware(app, workers=int(os.environ.get("ASGI_VIEW_WORKERS", 32)))
+    except TypeError:
+        # uvicorn's bundled middleware takes no workers argument
+        return WSGIMiddleware(app)
+
+
+asgi_app = _build()
@@ -2,7 +2,12 @@
 import os
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 BASE_DIR = os.environ.get(
     "RECORDS_DIR",
@@ -10,11 +15,23 @@ BASE_DIR = os.environ.get(
 )
 
 
+# Parsed files keyed on (mtime_ns, size) so re-reads of the same report
+# within one build are served from memory. Callers treat results read-only.
+_JSON_CACHE: Dict[str, Any] = {}
+
+
 def load_json(path: Path) -> Dict[str, Any]:
     try:
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        st = os.stat(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        hit = _JSON_CACHE.get(key)
+        if hit is not None:
+            return hit
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        _JSON_CACHE[key] = data
+        return data
     except Exception:
         pass
     return {}
@@ -30,6 +47,15 @@ def to_bool(val: Any) -> Optional[bool]:
     return None
 
 
+def _norm(val: Any) -> str:
+    """Normalize a free-text field to a stripped lowercase string once."""
+    return val.strip().lower() if isinstance(val, str) else ''
+
+
+_BAD_ATTIRE = frozenset(('no', 'missing_apron', 'not_wearing_apron'))
+_BAD_AUDIBILITY = frozenset(('poor', 'inaudible', 'not_audible'))
+
+
 def get_str(d: Dict[str, Any], *keys: str) -> Optional[str]:
     cur: Any = d
     for k in keys:
@@ -66,12 +92,37 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
         'TECH_ISSUES': [],
     }
 
-    # Counts
-    incorrect_items = [it for it in qa_matrix if str(it.get('status','')).lower() == 'incorrect']
-    # Count typos in expected response if the model provided the field
-    typo_items = [it for it in qa_matrix if isinstance(it.get('typo_in_expected_response'), dict) and bool(it['typo_in_expected_response'].get('has_typo'))]
-    clubbed_count = sum(1 for it in qa_matrix if str(it.get('status','')).lower() == 'clubbed')
-    missing_items = [it for it in qa_matrix if str(it.get('status','')).lower() == 'missing']
+    # One pass over qa_matrix builds every view the rules below need;
+    # the per-rule loops each re-lowercased status/question_id for N rows.
+    incorrect_items: List[Dict[str, Any]] = []
+    typo_items: List[Dict[str, Any]] = []
+    missing_items: List[Dict[str, Any]] = []
+    id_missing: List[Dict[str, Any]] = []
+    contra: List[Dict[str, Any]] = []
+    by_qid: Dict[str, Dict[str, Any]] = {}
+    clubbed_count = 0
+    for it in qa_matrix:
+        status = _norm(it.get('status'))
+        qid = _norm(it.get('question_id'))
+        if qid and qid not in by_qid:
+            by_qid[qid] = it
+        if status == 'incorrect':
+            incorrect_items.append(it)
+        elif status == 'clubbed':
+            clubbed_count += 1
+        elif status == 'missing':
+            missing_items.append(it)
+            if qid.startswith('pp.id.'):
+                id_missing.append(it)
+        # Count typos in expected response if the model provided the field
+        typo = it.get('typo_in_expected_response')
+        if isinstance(typo, dict) and bool(typo.get('has_typo')):
+            typo_items.append(it)
+        if 'later revealed' in _norm(it.get('captured_response')):
+            contra.append({'id': it.get('question_id'), 'text': it.get('question_text')})
+
+    def _qid_status(qid: str) -> str:
+        return _norm((by_qid.get(qid) or {}).get('status'))
 
     # Helper to add
     def add(cat: str, title: str, detail: Any):
@@ -82,13 +133,11 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
         add('ASSIGNBACK', 'Questions missing', [{'id': it.get('question_id'), 'text': it.get('question_text')} for it in missing_items])
 
     # PP.Name incorrect
-    for it in qa_matrix:
-        if str(it.get('question_id','')).strip().lower() == 'pp.name' and str(it.get('status','')).lower() == 'incorrect':
-            add('ASSIGNBACK', 'Customer name incorrect (PP.Name)', {'captured': it.get('captured_response'), 'expected': it.get('expected_response')})
-            break
+    if _qid_status('pp.name') == 'incorrect':
+        it = by_qid['pp.name']
+        add('ASSIGNBACK', 'Customer name incorrect (PP.Name)', {'captured': it.get('captured_response'), 'expected': it.get('expected_response')})
 
     # Missing ID proof verification
-    id_missing = [it for it in qa_matrix if str(it.get('question_id','')).lower().startswith('pp.id.') and str(it.get('status','')).lower() == 'missing']
     if id_missing:
         add('ASSIGNBACK', 'Missing ID proof verification', [{'id': it.get('question_id'), 'expected': it.get('expected_response')} for it in id_missing])
 
@@ -112,7 +161,7 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
 
     # Self-introduction missing
     call_open = (qc_params.get('call_opening') or {})
-    if str(call_open.get('value','')).strip().lower() == 'no':
+    if _norm(call_open.get('value')) == 'no':
         add('ASSIGNBACK', 'Doctor self-introduction missing', {})
 
     # Major prompting
@@ -124,8 +173,8 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
             add('ASSIGNBACK', 'Major doctor-led prompting detected', {'examples': examples, 'timestamps': ts})
 
     # Doctor not wearing apron
-    attire = str((video.get('attire_check') or '')).strip().lower()
-    if attire in ('no','missing_apron','not_wearing_apron'):
+    attire = _norm(video.get('attire_check'))
+    if attire in _BAD_ATTIRE:
         add('ASSIGNBACK', 'Doctor not wearing apron', {'attire_check': video.get('attire_check')})
 
     # OPS ATTENTION rules
@@ -136,17 +185,17 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
         pass
 
     # DOB incorrect
-    for it in qa_matrix:
-        if str(it.get('question_id','')).strip().lower() == 'pp.dob' and str(it.get('status','')).lower() == 'incorrect':
-            add('OPS_ATTENTION', 'Incorrect date of birth', {'captured': it.get('captured_response'), 'expected': it.get('expected_response')})
-            break
+    if _qid_status('pp.dob') == 'incorrect':
+        it = by_qid['pp.dob']
+        add('OPS_ATTENTION', 'Incorrect date of birth', {'captured': it.get('captured_response'), 'expected': it.get('expected_response')})
 
     if 4 <= len(incorrect_items) <= 7:
         add('OPS_ATTENTION', '4-7 incorrect documentation entries', {'count': len(incorrect_items)})
 
     # Occupation 1.4 incorrect
-    for it in qa_matrix:
-        if str(it.get('question_id','')).strip().lower() in ('1.4','1.4.') and str(it.get('status','')).lower() == 'incorrect':
+    for qid in ('1.4', '1.4.'):
+        if _qid_status(qid) == 'incorrect':
+            it = by_qid[qid]
             add('OPS_ATTENTION', 'Incorrect occupation (1.4)', {'captured': it.get('captured_response'), 'expected': it.get('expected_response')})
             break
 
@@ -171,12 +220,7 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
     except Exception:
         pass
 
-    # Contradictory responses
-    contra = []
-    for it in qa_matrix:
-        cr = str(it.get('captured_response') or '')
-        if 'later revealed' in cr.lower():
-            contra.append({'id': it.get('question_id'), 'text': it.get('question_text')})
+    # Contradictory responses (collected in the qa_matrix pass above)
     if contra:
         add('FLAGS', 'Contradictory responses', contra)
 
@@ -186,7 +230,7 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
         add('FLAGS', 'Privacy breach in video', {})
 
     # Unprofessional behavior
-    pol = str(get_str(qc_params, 'politeness', 'value') or '').strip().lower()
+    pol = _norm(get_str(qc_params, 'politeness', 'value'))
     if pol in ('no','partial'):
         add('FLAGS', 'Unprofessional behavior (politeness)', {'value': pol})
 
@@ -195,28 +239,48 @@ def summarize_record(rec_dir: Path) -> Dict[str, Any]:
     if rec_exists is False:
         add('TECH_ISSUES', 'Recording file missing', {})
 
-    aud = str(tech.get('audibility_level') or '').strip().lower()
-    if aud in ('poor','inaudible','not_audible'):
+    aud = _norm(tech.get('audibility_level'))
+    if aud in _BAD_AUDIBILITY:
         add('TECH_ISSUES', 'Voice not audible', {'audibility_level': tech.get('audibility_level')})
 
     return issues
 
 
-def main():
-    base = Path(BASE_DIR)
-    for item in base.iterdir():
-        if not item.is_dir():
-            continue
-        out_dir = item / '_processed'
-        if not out_dir.exists():
-            continue
-        try:
-            result = summarize_record(item)
+def _build_one(rec_dir: Path) -> Tuple[str, Optional[str]]:
+    """Summarize one record and write its final_decision.json.
+
+    Returns (record_name, error) so pool workers never raise across the
+    process boundary."""
+    try:
+        out_dir = rec_dir / '_processed'
+        result = summarize_record(rec_dir)
+        if orjson is not None:
+            with open(out_dir / 'final_decision.json', 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
             with open(out_dir / 'final_decision.json', 'w', encoding='utf-8') as f:
                 json.dump(result, f, indent=2, ensure_ascii=False)
-            print(f"final_decision.json written for {item.name}")
-        except Exception as e:
-            print(f"Failed {item}: {e}")
+        return rec_dir.name, None
+    except Exception as e:
+        return rec_dir.name, str(e)
+
+
+def main():
+    base = Path(BASE_DIR)
+    dirs = [p for p in base.iterdir() if p.is_dir() and (p / '_processed').exists()]
+    if not dirs:
+        return
+    # Records are independent and the cost is JSON parsing, so fan out
+    # across cores; a single record skips the pool overhead.
+    if len(dirs) > 1:
+        import multiprocessing
+        with multiprocessing.Pool(min(len(dirs), os.cpu_count() or 1)) as pool:
+            results = pool.imap_unordered(_build_one, dirs)
+            for name, err in results:
+                print(f"Failed {name}: {err}" if err else f"final_decision.json written for {name}")
+    else:
+        name, err = _build_one(dirs[0])
+        print(f"Failed {name}: {err}" if err else f"final_decision.json written for {name}")
 
 
 if __name__ == '__main__':
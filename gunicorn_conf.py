@@ -0,0 +1,16 @@
+"""Gunicorn config for serving the dashboard.
+
+Run with:
+    GEVENT=1 gunicorn -c gunicorn_conf.py app:app
+
+The endpoints are I/O-bound (JSON file reads, S3 redirects, outbound
+Gemini calls), so gevent workers let one process multiplex many requests.
+"""
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2 * multiprocessing.cpu_count() + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = 1000
+timeout = 120
@@ -14,16 +14,45 @@ The system checks if the doctor:
 import os
 import json
 import base64
+import hashlib
 import argparse
 import subprocess
-import shlex
 import re
+import time
+import random
+import threading
+import mmap
+import functools
 from typing import Dict, List, Any, Tuple, Optional
 from pathlib import Path
 import PyPDF2
+try:
+    import pypdfium2 as pdfium  # C-backed PDFium; much faster than PyPDF2
+except Exception:
+    pdfium = None
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
 from google import genai
 from google.genai import types
 
+# Compiled once at import; these run inside hot loops over ffmpeg stderr
+# and model output, where per-call re.* lookups add up.
+_INPUT_I_RE = re.compile(r'"input_i"\s*:\s*"?(-?\d+(?:\.\d+)?)"?')
+_DURATION_RE = re.compile(r'Duration:\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+_MEAN_VOL_RE = re.compile(r'mean_volume:\s*(-?\d+(?:\.\d+)?)\s*dB')
+_JSON_BLOCK_RE = re.compile(r"```json\s*(\{[\s\S]*?\})\s*```")
+_SEGMENTS_RE = re.compile(r"(\{[\s\S]*?\"segments\"[\s\S]*?\})")
+
 
 def log_progress(step: str, current: int = 0, total: int = 100):
     """Log progress with percentage"""
@@ -35,41 +64,200 @@ def log_progress(step: str, current: int = 0, total: int = 100):
         print(f"[---] [----------] {step}", flush=True)
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> genai.Client:
+    """One client per API key for the whole process.
+
+    Constructing genai.Client rebuilds HTTP pools and auth state; reusing
+    a single instance keeps connections alive across the transcription,
+    frame and QA calls instead of paying a TLS handshake per request, and
+    the concurrent QA fan-out multiplexes over the shared pool."""
+    return genai.Client(api_key=api_key)
+
+
+class _TokenBucket:
+    """Blocking token bucket keyed to the Gemini requests-per-minute budget.
+
+    Every generate_content call acquires a token first, so total request
+    rate stays under the quota no matter how many worker threads fan out
+    above it. Refill is computed lazily on acquire."""
+
+    def __init__(self, rpm: float):
+        self.capacity = max(1.0, rpm)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_GEMINI_BUCKET = _TokenBucket(float(os.environ.get('GEMINI_RPM', '60')))
+
+# Context-cache handles keyed by (api_key, kind). The static instruction
+# blocks are identical across every chunk/frame call of a run, so they
+# are uploaded once via the Caches API and referenced by name instead of
+# being re-sent each time. None records a failed create (e.g. prompt
+# below the cache minimum) so it is not retried every call.
+_PROMPT_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
+_PROMPT_CACHE_LOCK = threading.Lock()
+
+
+def _cached_prompt_name(client, api_key: str, kind: str, texts: Tuple[str, ...],
+                        model: str = "gemini-2.5-flash") -> Optional[str]:
+    key = (api_key, kind)
+    with _PROMPT_CACHE_LOCK:
+        if key in _PROMPT_CACHE:
+            return _PROMPT_CACHE[key]
+    name: Optional[str] = None
+    try:
+        cache = client.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                contents=[types.Content(role="user",
+                                        parts=[types.Part.from_text(text=t) for t in texts])],
+            ),
+        )
+        name = getattr(cache, 'name', None)
+    except Exception:
+        name = None
+    with _PROMPT_CACHE_LOCK:
+        _PROMPT_CACHE[key] = name
+    return name
+
+
+def _generate_content(client, model: str, contents, config, retries: int = 3):
+    """Rate-limited generate_content with exponential backoff and jitter.
+
+    All Gemini call sites go through here so transcription, frame
+    analysis and QA share one request budget; transient errors (429s,
+    network blips) are retried instead of failing the whole record."""
+    delay = 2.0
+    for attempt in range(retries):
+        _GEMINI_BUCKET.acquire()
+        try:
+            return client.models.generate_content(model=model, contents=contents, config=config)
+        except Exception:
+            if attempt == retries - 1:
+                raise
+            time.sleep(delay + random.uniform(0, delay))
+            delay *= 2
+
+
+def _generate_content_streamed(client, model: str, contents, config) -> Optional[str]:
+    """Stream a response and return its accumulated text, None on failure.
+
+    Streaming overlaps JSON transfer with generation, so the first bytes
+    of a big QA matrix arrive while the model is still writing the rest;
+    callers fall back to the blocking wrapper when it returns None."""
+    try:
+        _GEMINI_BUCKET.acquire()
+        buf: List[str] = []
+        for chunk in client.models.generate_content_stream(model=model, contents=contents, config=config):
+            t = getattr(chunk, 'text', None)
+            if t:
+                buf.append(t)
+        return ''.join(buf) if buf else None
+    except Exception:
+        return None
+
+
 def extract_audio_from_video(video_path: str, output_path: str, timeout: int = 600) -> bool:
     """Extract audio from video file using ffmpeg"""
     try:
         print(f"Extracting audio from {Path(video_path).name}...")
-        cmd = f"ffmpeg -y -i {shlex.quote(video_path)} -vn -acodec libmp3lame -q:a 2 {shlex.quote(output_path)}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout)
+        cmd = ["ffmpeg", "-y", "-i", video_path, "-vn", "-acodec", "libmp3lame", "-q:a", "2", output_path]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
         return Path(output_path).exists()
     except Exception as e:
         print(f"Audio extraction failed: {e}")
         return False
 
 
+def prepare_audio(video_path: str, output_path: str, timeout: int = 900) -> Tuple[bool, Optional[Dict[str, Any]], Optional[float]]:
+    """Extract audio, measure loudness and read duration in one ffmpeg run.
+
+    The naive pipeline decodes the source twice (once for the mp3, once
+    for the loudnorm probe) and then probes it a third time for the
+    duration; asplit feeds the same decoded stream to both outputs, and
+    the duration is scraped from the input banner ffmpeg already prints
+    on stderr, so long videos are demuxed and decoded only once with no
+    ffprobe round trip. Returns (extracted_ok, technical_analysis,
+    duration_seconds) with the same dict shape as
+    analyze_audio_technical; dict and duration are None when the
+    respective stats could not be parsed."""
+    try:
+        print(f"Extracting audio from {Path(video_path).name}...")
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-nostdin", "-i", video_path,
+            "-filter_complex", "[0:a]asplit=2[a1][a2];[a2]loudnorm=I=-23:TP=-1.5:LRA=11:print_format=json[a3]",
+            "-map", "[a1]", "-acodec", "libmp3lame", "-q:a", "2", output_path,
+            "-map", "[a3]", "-f", "null", "-",
+        ]
+        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                           stdin=subprocess.DEVNULL)
+        ok = Path(output_path).exists()
+        tech = None
+        duration = None
+        if ok:
+            full = (p.stderr or '') + '\n' + (p.stdout or '')
+            # Loudness stats print at the tail, the input banner with the
+            # duration at the head; scan only those windows.
+            m = _INPUT_I_RE.search(full[-8192:])
+            if m:
+                val = float(m.group(1))
+                level = 'audible' if val >= -40 else 'not_audible'
+                tech = {"recording_exists": True, "audibility_level": level, "avg_dbfs": val}
+            md = _DURATION_RE.search(full[:8192])
+            if md:
+                duration = int(md.group(1)) * 3600 + int(md.group(2)) * 60 + float(md.group(3))
+        return ok, tech, duration
+    except Exception as e:
+        print(f"Audio extraction failed: {e}")
+        return False, None, None
+
+
 def get_media_duration(path: str) -> Optional[float]:
     """Get media duration using ffprobe"""
     try:
-        cmd = f"ffprobe -v error -show_entries format=duration -of default=noprint_wrappers=1:nokey=1 {shlex.quote(path)}"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+        cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+               "-of", "default=noprint_wrappers=1:nokey=1", path]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
         return float(result.stdout.strip()) if result.stdout.strip() else None
     except Exception:
         return None
 
 def analyze_audio_technical(path: str) -> Dict[str, Any]:
+    # The loudness reduction itself runs inside ffmpeg (loudnorm, with
+    # volumedetect as fallback): a single pass over the samples in native
+    # code. No PCM buffer ever reaches Python, so there is no sample loop
+    # here worth JIT-compiling.
     if not os.path.exists(path):
         return {"recording_exists": False, "audibility_level": "not_audible", "avg_dbfs": None}
     try:
-        cmd = f"ffmpeg -i {shlex.quote(path)} -filter_complex loudnorm=I=-23:TP=-1.5:LRA=11:print_format=json -f null -"
-        p = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=120)
-        text = (p.stderr or '') + '\n' + (p.stdout or '')
-        m = re.search(r'"input_i"\s*:\s*"?(\-?\d+(?:\.\d+)?)"?', text)
+        cmd = ["ffmpeg", "-i", path, "-filter_complex",
+               "loudnorm=I=-23:TP=-1.5:LRA=11:print_format=json", "-f", "null", "-"]
+        p = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        # The stats print at the very end of the run, so only the tail of
+        # the (potentially megabytes of) ffmpeg output needs scanning.
+        text = ((p.stderr or '') + '\n' + (p.stdout or ''))[-8192:]
+        m = _INPUT_I_RE.search(text)
         val = float(m.group(1)) if m else None
         if val is None:
-            cmd2 = f"ffmpeg -i {shlex.quote(path)} -af volumedetect -f null -"
-            p2 = subprocess.run(cmd2, shell=True, capture_output=True, text=True, timeout=60)
-            t2 = (p2.stderr or '') + '\n' + (p2.stdout or '')
-            m2 = re.search(r'mean_volume:\s*(-?\d+(?:\.\d+)?)\s*dB', t2)
+            cmd2 = ["ffmpeg", "-i", path, "-af", "volumedetect", "-f", "null", "-"]
+            p2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=60)
+            t2 = ((p2.stderr or '') + '\n' + (p2.stdout or ''))[-8192:]
+            m2 = _MEAN_VOL_RE.search(t2)
             val = float(m2.group(1)) if m2 else None
         level = 'unknown'
         if val is not None:
@@ -92,58 +280,174 @@ def split_audio_into_chunks(src_path: str, out_dir: Path, chunk_seconds: int = 3
     except Exception:
         pass
     try:
-        cmd = (
-            f"ffmpeg -y -hide_banner -loglevel error -i {shlex.quote(src_path)} "
-            f"-vn -acodec libmp3lame -q:a 2 -f segment -segment_time {int(chunk_seconds)} "
-            f"{shlex.quote(str(out_dir / 'chunk_%03d.mp3'))}"
-        )
-        subprocess.run(cmd, shell=True, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1200)
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-i", src_path,
+            "-vn", "-acodec", "libmp3lame", "-q:a", "2",
+            "-f", "segment", "-segment_time", str(int(chunk_seconds)),
+            str(out_dir / 'chunk_%03d.mp3'),
+        ]
+        subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1200)
     except Exception:
         pass
     return [str(p) for p in sorted(out_dir.glob('chunk_*.mp3'))]
 
 
-def transcribe_chunks_and_merge(paths: List[str], api_key: str) -> Dict[str, Any]:
-    """Transcribe list of chunk paths sequentially and merge with offset timestamps."""
-    merged = {"segments": []}
-    offset = 0.0
+# Set by --batch: route chunk transcription through Gemini Batch Mode
+# (50% cost, no RPM throttling, results within 24h) for offline runs.
+USE_BATCH = False
+
+
+def transcribe_chunks_batch(paths: List[str], api_key: str, poll_seconds: int = 30,
+                            timeout_seconds: int = 24 * 3600) -> List[Dict[str, Any]]:
+    """Submit all chunk transcriptions as one Gemini batch job.
+
+    Builds one inlined request per chunk (same prompt/config as
+    transcribe_audio), polls until the job finishes, and returns the
+    parsed transcripts in input order; failed entries come back as empty
+    segment lists."""
+    client = _get_client(api_key)
+    prompt = get_gemini_transcription_prompt()
+    context = (
+        "Context: This is a brief medical history verification call. A doctor calls a customer on behalf "
+        "of an insurance company. Pay attention to names, IDs, dates (DOB), and medical details."
+    )
+    requests = []
     for cp in paths:
+        # b64encode accepts any buffer, so encode straight off the mmap
+        # rather than materializing the raw bytes first.
+        with open(cp, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    audio_b64 = base64.b64encode(mm).decode('ascii')
+            except Exception:
+                audio_b64 = base64.b64encode(f.read()).decode('ascii')
+        requests.append({
+            "contents": [{
+                "role": "user",
+                "parts": [
+                    {"text": context},
+                    {"text": prompt},
+                    {"inline_data": {"mime_type": "audio/mpeg", "data": audio_b64}},
+                ],
+            }],
+            "config": {"response_mime_type": "application/json"},
+        })
+    job = client.batches.create(model="gemini-2.5-flash", src=requests)
+    print(f"Batch job submitted: {job.name} ({len(paths)} chunks)")
+    deadline = time.time() + timeout_seconds
+    done_states = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+    # job.state is a JobState enum whose str() is "JobState.JOB_STATE_...";
+    # strip the class prefix so the bare names above match.
+    while str(job.state).split('.')[-1] not in done_states:
+        if time.time() > deadline:
+            print("Batch job timed out; returning empty transcripts")
+            return [{"segments": []} for _ in paths]
+        time.sleep(poll_seconds)
+        job = client.batches.get(name=job.name)
+    results: List[Dict[str, Any]] = []
+    inlined = getattr(getattr(job, 'dest', None), 'inlined_responses', None) or []
+    for i in range(len(paths)):
+        transcript: Dict[str, Any] = {"segments": []}
+        try:
+            resp = inlined[i].response
+            transcript = parse_llm_json(_get_response_text(resp))
+        except Exception:
+            pass
+        results.append(transcript if isinstance(transcript, dict) else {"segments": []})
+    return results
+
+
+def transcribe_chunks_and_merge(paths: List[str], api_key: str, max_workers: int = 6,
+                                chunk_seconds: Optional[float] = None,
+                                total_duration: Optional[float] = None) -> Dict[str, Any]:
+    """Transcribe chunk paths concurrently and merge with offset timestamps.
+
+    Each chunk is an independent Gemini call, so wall time is bounded by
+    the slowest chunk instead of the sum; the worker count stays small to
+    respect the API's request-per-minute budget. Offsets are precomputed
+    from the chunk durations so results can be stitched in input order.
+
+    When the caller produced the chunks with a fixed -segment_time and
+    knows the source duration, pass chunk_seconds/total_duration and the
+    per-chunk ffprobe round trips are skipped: every chunk but the last
+    is exactly chunk_seconds long."""
+    merged = {"segments": []}
+    if not paths:
+        return merged
+    import concurrent.futures
+
+    def _one(cp: str) -> Dict[str, Any]:
         try:
-            tdict = transcribe_audio(cp, api_key)
+            return transcribe_audio(cp, api_key) or {"segments": []}
         except Exception:
-            tdict = {"segments": []}
+            return {"segments": []}
+
+    workers = min(len(paths), max_workers)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        if chunk_seconds and total_duration:
+            durations = [max(0.0, min(float(chunk_seconds), float(total_duration) - i * float(chunk_seconds)))
+                         for i in range(len(paths))]
+        else:
+            durations = list(ex.map(lambda p: get_media_duration(p) or 0.0, paths))
+        if USE_BATCH and len(paths) > 1:
+            transcripts = transcribe_chunks_batch(paths, api_key)
+        else:
+            transcripts = list(ex.map(_one, paths))
+
+    offset = 0.0
+    for tdict, cdur in zip(transcripts, durations):
         segs = (tdict or {}).get('segments', []) or []
-        cdur = get_media_duration(cp) or 0.0
-        for s in segs:
-            try:
-                st = parse_timestamp_to_seconds(s.get('start_timestamp') or '0:00')
-                en = parse_timestamp_to_seconds(s.get('end_timestamp') or '0:00')
-            except Exception:
-                st, en = 0.0, 0.0
+        starts = _shift_mmss([s.get('start_timestamp') or '0:00' for s in segs], offset)
+        ends = _shift_mmss([s.get('end_timestamp') or '0:00' for s in segs], offset)
+        for s, st, en in zip(segs, starts, ends):
             merged['segments'].append({
                 'segment_id': s.get('segment_id',''),
                 'text': s.get('text',''),
                 'speaker': s.get('speaker',''),
-                'start_timestamp': seconds_to_timestamp(max(0.0, st + offset)),
-                'end_timestamp': seconds_to_timestamp(max(0.0, en + offset)),
+                'start_timestamp': st,
+                'end_timestamp': en,
             })
         offset += cdur
-    return merged
+    return _attach_numeric_timestamps(merged)
+
+
+# Screenshots only feed a qualitative attire/visibility check, so cap
+# them at 1280px wide (never upscale) and use a lighter JPEG quality;
+# a 4K source frame shrinks from multiple MB to a couple hundred KB.
+_FRAME_SCALE = "scale='min(1280,iw)':-2"
 
 
-def extract_video_frames(video_path: str, output_dir: Path) -> List[str]:
+def extract_video_frames(video_path: str, output_dir: Path,
+                         duration: Optional[float] = None) -> List[str]:
     frames: List[str] = []
     try:
-        dur = get_media_duration(video_path) or 0.0
+        # Callers that already know the duration (prepare_audio scrapes it
+        # from the same container) pass it in and skip the ffprobe here.
+        dur = duration if duration and duration > 0 else (get_media_duration(video_path) or 0.0)
         if dur <= 0:
             return frames
         ts_points = [int(dur * p) for p in (0.2, 0.5, 0.8)]
-        for i, sec in enumerate(ts_points, start=1):
-            out_path = output_dir / f"frame_{i:02d}.jpg"
-            cmd = f"ffmpeg -ss {sec} -i {shlex.quote(video_path)} -frames:v 1 -q:v 2 {shlex.quote(str(out_path))} -y"
-            subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
-            if out_path.exists():
-                frames.append(str(out_path))
+        out_paths = [output_dir / f"frame_{i:02d}.jpg" for i in range(1, len(ts_points) + 1)]
+        # One process grabs all three frames: each -ss applies to the
+        # following -i (fast keyframe seek), and each output maps one
+        # input, so the container is opened per seek but ffmpeg is
+        # spawned once instead of three times.
+        cmd: List[str] = ["ffmpeg", "-y"]
+        for sec in ts_points:
+            cmd += ["-ss", str(sec), "-i", video_path]
+        for idx, out_path in enumerate(out_paths):
+            cmd += ["-map", f"{idx}:v", "-frames:v", "1",
+                    "-vf", _FRAME_SCALE, "-q:v", "5", str(out_path)]
+        subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        frames = [str(p) for p in out_paths if p.exists()]
+        if not frames:
+            # Fallback: one spawn per frame, as before
+            for sec, out_path in zip(ts_points, out_paths):
+                cmd = ["ffmpeg", "-ss", str(sec), "-i", video_path,
+                       "-frames:v", "1", "-vf", _FRAME_SCALE, "-q:v", "5", str(out_path), "-y"]
+                subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                if out_path.exists():
+                    frames.append(str(out_path))
     except Exception:
         pass
     return frames
@@ -160,13 +464,30 @@ def analyze_video_frames(frames: List[str], api_key: str) -> Dict[str, Any]:
             "privacy_explanation": "NA",
             "screenshots": []
         }
+    cache_key = None
     try:
-        client = genai.Client(api_key=api_key)
+        h = hashlib.blake2b(digest_size=16)
+        for fp in frames:
+            h.update(_file_digest_payload(fp))
+        cache_key = _gemini_cache_key('frames', h.digest())
+        cached = _gemini_cache_get(cache_key)
+        if cached is not None:
+            cached.setdefault("screenshots", frames)
+            return cached
+    except Exception:
+        cache_key = None
+    try:
+        client = _get_client(api_key)
         parts: List[types.Part] = []
         for fp in frames:
-            with open(fp, 'rb') as f:
-                img = f.read()
-            parts.append(types.Part(inlineData=types.Blob(mimeType="image/jpeg", data=img)))
+            # Prefer a Files API upload per frame (URI reference, no base64)
+            try:
+                uploaded = client.files.upload(file=fp)
+                parts.append(types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type or "image/jpeg"))
+            except Exception:
+                with open(fp, 'rb') as f:
+                    img = f.read()
+                parts.append(types.Part(inlineData=types.Blob(mimeType="image/jpeg", data=img)))
         prompt = """
 Analyze these video frames and return STRICT JSON with explanations for each check.
 
@@ -185,10 +506,16 @@ Rules:
 - Visibility: judge whether both doctor and customer are visible in the frames. Explain with which frame(s) support the conclusion.
 - Privacy: ONLY evaluate the doctor's background. Consider breaches such as people walking behind the doctor, visible private boards/files/monitors showing confidential data, or an identifiable patient nearby. The customer's background does NOT affect privacy. Explain clearly.
 """
-        contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)] + parts)]
-        config = types.GenerateContentConfig(temperature=0.1, response_mime_type="application/json")
-        resp = client.models.generate_content(model="gemini-2.5-flash", contents=contents, config=config)
-        out = json.loads(resp.text)
+        cache_name = _cached_prompt_name(client, api_key, 'frames', (prompt,))
+        if cache_name:
+            contents = [types.Content(role="user", parts=parts)]
+            config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json",
+                                                 cached_content=cache_name)
+        else:
+            contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)] + parts)]
+            config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json")
+        resp = _generate_content(client, "gemini-2.5-flash", contents, config)
+        out = parse_llm_json(resp.text)
         # Normalize and attach screenshots
         if not isinstance(out, dict):
             out = {}
@@ -199,6 +526,8 @@ Rules:
         out.setdefault("privacy_maintained", None)
         out.setdefault("privacy_explanation", "")
         out.setdefault("screenshots", frames)
+        if cache_key:
+            _gemini_cache_put(cache_key, out)
         return out
     except Exception:
         return {
@@ -231,43 +560,89 @@ def _get_response_text(resp: Any) -> str:
         return ''
 
 
+# Every MM:SS stamp under two hours maps through these precomputed
+# tables, turning the split/int/format work in the merge loops into a
+# single dict or index lookup; out-of-range values take the slow path.
+_TS_TO_SEC = {f"{m}:{s:02d}": m * 60 + s for m in range(120) for s in range(60)}
+_SEC_TO_TS = tuple(f"{s // 60}:{s % 60:02d}" for s in range(7200))
+
+
 def parse_timestamp_to_seconds(timestamp: str) -> float:
-    """Convert MM:SS timestamp to seconds"""
-    try:
-        parts = timestamp.split(':')
-        if len(parts) == 2:
-            return int(parts[0]) * 60 + int(parts[1])
+    """Convert MM:SS timestamp to seconds, 0.0 on malformed input"""
+    hit = _TS_TO_SEC.get(timestamp)
+    if hit is not None:
+        return hit
+    if not isinstance(timestamp, str):
         return 0.0
-    except:
+    i = timestamp.find(':')
+    if i < 0:
         return 0.0
+    mm, ss = timestamp[:i], timestamp[i + 1:]
+    if mm.isdigit() and ss.isdigit():
+        return int(mm) * 60 + int(ss)
+    return 0.0
 
 
 def seconds_to_timestamp(seconds: float) -> str:
-    """Convert seconds to MM:SS format"""
+    """Convert seconds to MM:SS format, 0:00 on malformed input"""
+    if not isinstance(seconds, (int, float)):
+        try:
+            seconds = float(seconds)
+        except (TypeError, ValueError):
+            return "0:00"
     try:
         s = int(seconds)
-        m = s // 60
-        r = s % 60
-        return f"{m}:{r:02d}"
-    except:
+    except (ValueError, OverflowError):  # nan/inf
         return "0:00"
+    if 0 <= s < 7200:
+        return _SEC_TO_TS[s]
+    return f"{s // 60}:{s % 60:02d}"
 
 
-def mmss_to_hhmmss(ts: str) -> str:
-    """Convert MM:SS to HH:MM:SS, robust to bad input."""
+def _split_hms(total: int) -> Tuple[int, int, int]:
+    """Break total seconds into (h, m, s); compiled by numba when installed."""
+    return total // 3600, (total % 3600) // 60, total % 60
+
+
+if njit is not None:
+    _split_hms = njit(cache=True)(_split_hms)
+
+
+def seconds_to_hhmmss(total: float) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    h, m, s = _split_hms(int(total))
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def _attach_numeric_timestamps(transcript: Dict) -> Dict:
+    """Stamp integer start_s/end_s on each segment, parsed once.
+
+    Downstream consumers (WPM aggregation, text formatting, metric
+    loops) then do integer arithmetic instead of re-splitting the MM:SS
+    strings on every pass. Existing fields are left untouched."""
     try:
-        parts = ts.split(':')
-        if len(parts) != 2:
-            return "00:00:00"
-        m = int(parts[0]); s = int(parts[1])
-        total = m * 60 + s
-        h = total // 3600
-        rem = total % 3600
-        m2 = rem // 60
-        s2 = rem % 60
-        return f"{h:02d}:{m2:02d}:{s2:02d}"
+        for seg in (transcript or {}).get('segments', []) or []:
+            if 'start_s' not in seg:
+                seg['start_s'] = int(parse_timestamp_to_seconds(seg.get('start_timestamp') or '0:00'))
+            if 'end_s' not in seg:
+                seg['end_s'] = int(parse_timestamp_to_seconds(seg.get('end_timestamp') or '0:00'))
     except Exception:
+        pass
+    return transcript
+
+
+def mmss_to_hhmmss(ts: str) -> str:
+    """Convert MM:SS to HH:MM:SS, robust to bad input."""
+    if not isinstance(ts, str):
+        return "00:00:00"
+    i = ts.find(':')
+    if i < 0:
         return "00:00:00"
+    mm, ss = ts[:i], ts[i + 1:]
+    if not (mm.isdigit() and ss.isdigit()):
+        return "00:00:00"
+    h, m2, s2 = _split_hms(int(mm) * 60 + int(ss))
+    return f"{h:02d}:{m2:02d}:{s2:02d}"
 
 
 def build_merged_transcript_text(merged: Dict[str, Any]) -> str:
@@ -283,8 +658,9 @@ def build_merged_transcript_text(merged: Dict[str, Any]) -> str:
         parts: List[str] = []
         for seg in by_call[call_idx]:
             sid = seg.get('segment_id') or ''
-            st = mmss_to_hhmmss(seg.get('start_timestamp') or '0:00')
-            en = mmss_to_hhmmss(seg.get('end_timestamp') or '0:00')
+            ss, es = seg.get('start_s'), seg.get('end_s')
+            st = seconds_to_hhmmss(ss) if isinstance(ss, int) else mmss_to_hhmmss(seg.get('start_timestamp') or '0:00')
+            en = seconds_to_hhmmss(es) if isinstance(es, int) else mmss_to_hhmmss(seg.get('end_timestamp') or '0:00')
             spk_raw = str(seg.get('speaker') or '').lower()
             speaker = 'doctor' if spk_raw in ('doctor','agent') else ('customer' if spk_raw=='customer' else spk_raw or 'doctor')
             text = (seg.get('text') or '').strip()
@@ -297,58 +673,94 @@ def build_merged_transcript_text(merged: Dict[str, Any]) -> str:
     return '\n'.join(lines).strip()
 
 
+def _shift_mmss(stamps: List[str], offset: float) -> List[str]:
+    """Shift a batch of MM:SS stamps by offset seconds, clamped at 0:00.
+
+    Parsing is per-string either way, but the add/divmod/format work is
+    done as a handful of NumPy array ops when the library is present;
+    for merges of thousands of segments that beats one Python call pair
+    per stamp. Falls back to the scalar helpers otherwise."""
+    if np is None or len(stamps) < 32:
+        return [seconds_to_timestamp(max(0.0, parse_timestamp_to_seconds(s) + offset)) for s in stamps]
+    totals = np.fromiter((parse_timestamp_to_seconds(s) for s in stamps),
+                         dtype=np.int64, count=len(stamps))
+    totals = np.maximum(totals + int(offset), 0)
+    mins, secs = totals // 60, totals % 60
+    out = np.char.add(np.char.add(mins.astype(str), ':'), np.char.mod('%02d', secs))
+    return out.tolist()
+
+
 def merge_transcripts(transcripts: List[Dict[str, Any]], call_durations: List[float]) -> Dict[str, Any]:
     """Merge multiple transcripts with adjusted timestamps"""
     merged = {"segments": []}
     offset = 0.0
-    
+
     for i, (transcript, duration) in enumerate(zip(transcripts, call_durations)):
         segments = transcript.get('segments', [])
         print(f"Merging call {i+1}: {len(segments)} segments, duration: {duration:.1f}s")
-        
-        for segment in segments:
-            # Parse timestamps
-            start_str = segment.get('start_timestamp', '0:00')
-            end_str = segment.get('end_timestamp', '0:00')
-            
-            start_sec = parse_timestamp_to_seconds(start_str)
-            end_sec = parse_timestamp_to_seconds(end_str)
-            
-            # Adjust with offset
-            new_start = start_sec + offset
-            new_end = end_sec + offset
-            
-            # Create merged segment
-            merged_segment = {
+
+        # Shift all timestamps for this call in one batch
+        starts = _shift_mmss([s.get('start_timestamp', '0:00') for s in segments], offset)
+        ends = _shift_mmss([s.get('end_timestamp', '0:00') for s in segments], offset)
+
+        for segment, new_start, new_end in zip(segments, starts, ends):
+            merged["segments"].append({
                 "segment_id": f"call{i+1}_{segment.get('segment_id', '')}",
                 "text": segment.get('text', ''),
                 "speaker": segment.get('speaker', ''),
-                "start_timestamp": seconds_to_timestamp(new_start),
-                "end_timestamp": seconds_to_timestamp(new_end),
+                "start_timestamp": new_start,
+                "end_timestamp": new_end,
                 "call_index": i + 1
-            }
-            
-            merged["segments"].append(merged_segment)
-        
+            })
+
         # Update offset for next call
         offset += duration
-    
+
     print(f"Merged transcript: {len(merged['segments'])} total segments across {len(transcripts)} calls")
-    return merged
+    return _attach_numeric_timestamps(merged)
+
+
+_MEDIA_EXTS = frozenset({'.mp3', '.wav', '.m4a', '.mp4', '.webm', '.ogg', '.flac'})
 
 
 def find_media_files(directory: Path) -> List[Path]:
     """Find all audio/video files in directory"""
-    media_extensions = {'.mp3', '.wav', '.m4a', '.mp4', '.webm', '.ogg', '.flac'}
     media_files = []
-    
-    for ext in media_extensions:
-        media_files.extend(directory.glob(f"*{ext}"))
-    
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _MEDIA_EXTS:
+                    media_files.append(Path(entry.path))
+    except OSError:
+        return []
+
     # Sort by name for consistent ordering
     return sorted(media_files, key=lambda x: x.name)
 
 
+def scan_record(record_path: Path) -> Tuple[List[Path], List[Path]]:
+    """Classify a record directory's entries in one scandir pass.
+
+    Returns (mer_files, media_files), both name-sorted. glob plus
+    find_media_files each read the directory separately; one pass with
+    cheap suffix checks covers both."""
+    mer_files: List[Path] = []
+    media_files: List[Path] = []
+    try:
+        with os.scandir(record_path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                lower = entry.name.lower()
+                if lower.endswith('_mer.pdf'):
+                    mer_files.append(Path(entry.path))
+                elif os.path.splitext(lower)[1] in _MEDIA_EXTS:
+                    media_files.append(Path(entry.path))
+    except OSError:
+        return [], []
+    return sorted(mer_files, key=lambda x: x.name), sorted(media_files, key=lambda x: x.name)
+
+
 def get_gemini_transcription_prompt():
     return """
                             Generate a transcript of the call given in the audio file. If the audio is not in english then first translate to english and then transcribe. Include timestamps, speaker identification & emotion of the speaker.
@@ -397,6 +809,116 @@ def get_gemini_transcription_prompt():
                             """
 
 
+# Content-addressed cache for model results: re-running the pipeline on the
+# same media serves transcripts/frame analyses from disk instead of burning
+# quota. Keyed on media bytes + model + prompt version; bounded by mtime LRU.
+_GEMINI_CACHE_DIR = Path(os.environ.get('MEDB_CACHE_DIR', str(Path(__file__).parent / '.gemini_cache')))
+_GEMINI_CACHE_MAX = int(os.environ.get('MEDB_CACHE_MAX_ENTRIES', '512'))
+_PROMPT_VERSION = 'v1'
+
+
+def _gemini_cache_key(kind: str, payload: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{kind}|gemini-2.5-flash|{_PROMPT_VERSION}|".encode('utf-8'))
+    h.update(payload)
+    return h.hexdigest()
+
+
+def _file_digest_payload(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        # mmap lets the hash walk the kernel page cache directly instead
+        # of copying the file through 1 MB Python buffers; empty files
+        # and exotic filesystems fall back to the chunked read.
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        except Exception:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    return h.digest()
+
+
+def _gemini_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    path = _GEMINI_CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        os.utime(path)  # refresh mtime so eviction is least-recently-used
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _gemini_cache_put(key: str, obj: Dict[str, Any]) -> None:
+    try:
+        _GEMINI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _GEMINI_CACHE_DIR / f"{key}.json"
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(obj, f)
+        os.replace(tmp, path)
+        # Evict oldest entries beyond the cap
+        entries = sorted(_GEMINI_CACHE_DIR.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:max(0, len(entries) - _GEMINI_CACHE_MAX)]:
+            try:
+                stale.unlink()
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+
+_MIME_BY_EXT = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+}
+
+
+def _guess_audio_mime_type(file_path: str) -> str:
+    """Detect mime type based on file extension"""
+    return _MIME_BY_EXT.get(Path(file_path).suffix.lower(), "application/octet-stream")
+
+
+def _parse_codefenced_json(text: str) -> Optional[Dict[str, Any]]:
+    """Salvage a JSON object out of a code-fenced or chatty model reply."""
+    try:
+        t = (text or '').strip()
+        if t.startswith('```') and t.endswith('```'):
+            t = t[3:-3].strip()
+            if t.lower().startswith('json'):
+                t = t[4:].lstrip('\n').lstrip()
+            return _json_loads(t)
+        m = _JSON_BLOCK_RE.search(t)
+        if m:
+            return _json_loads(m.group(1))
+        m2 = _SEGMENTS_RE.search(t)
+        if m2:
+            return _json_loads(m2.group(1))
+    except Exception:
+        return None
+    return None
+
+
+def parse_llm_json(text: Any) -> Optional[Any]:
+    """Parse a model reply as JSON: direct parse first, fence salvage second.
+
+    Single entry point for every response-parsing site, so the fast path
+    (a clean JSON body, which response_mime_type usually guarantees) is
+    one parse and the fence/regex stripping only runs on failure.
+    Returns None when nothing parseable is found."""
+    if not isinstance(text, str) or not text.strip():
+        return None
+    try:
+        return _json_loads(text)
+    except Exception:
+        return _parse_codefenced_json(text)
+
+
 def transcribe_audio(audio_file_path: str, api_key: str) -> Dict:
     """
     Transcribe audio file using Gemini 2.5 Flash
@@ -408,27 +930,32 @@ def transcribe_audio(audio_file_path: str, api_key: str) -> Dict:
     Returns:
         Transcription in JSON format
     """
-    client = genai.Client(api_key=api_key)
+    cache_key = None
+    try:
+        cache_key = _gemini_cache_key('transcribe', _file_digest_payload(audio_file_path))
+        cached = _gemini_cache_get(cache_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        cache_key = None
+
+    client = _get_client(api_key)
     model = "gemini-2.5-flash"
-    
-    # Read raw audio bytes
-    with open(audio_file_path, "rb") as audio_file:
-        audio_bytes = audio_file.read()
-
-    # Detect mime type based on file extension
-    def guess_audio_mime_type(file_path: str) -> str:
-        ext = Path(file_path).suffix.lower()
-        mapping = {
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".m4a": "audio/mp4",
-            ".flac": "audio/flac",
-            ".ogg": "audio/ogg",
-            ".webm": "audio/webm",
-        }
-        return mapping.get(ext, "application/octet-stream")
-    mime_type = guess_audio_mime_type(audio_file_path)
-    
+
+    mime_type = _guess_audio_mime_type(audio_file_path)
+
+    # Upload via the Files API and reference by URI: the SDK streams the
+    # file from disk, skips the ~33% base64 inflation of inlineData, and
+    # lets retries reuse the uploaded file. Only the inline fallback ever
+    # materializes the audio in memory.
+    try:
+        uploaded = client.files.upload(file=audio_file_path)
+        audio_part = types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type or mime_type)
+    except Exception:
+        with open(audio_file_path, "rb") as audio_file:
+            audio_bytes = audio_file.read()
+        audio_part = types.Part(inlineData=types.Blob(mimeType=mime_type, data=audio_bytes))
+
     # Prepare the content with transcription prompt
     prompt = get_gemini_transcription_prompt()
     context = (
@@ -436,53 +963,58 @@ def transcribe_audio(audio_file_path: str, api_key: str) -> Dict:
         "of an insurance company. Pay attention to names, IDs, dates (DOB), and medical details."
     )
     
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_text(text=context),
-                types.Part.from_text(text=prompt),
-                types.Part(
-                    inlineData=types.Blob(
-                        mimeType=mime_type,
-                        data=audio_bytes,
-                    )
-                )
-            ],
-        ),
-    ]
-    
-    # Generate transcription with JSON response requested
-    config = types.GenerateContentConfig(response_mime_type="application/json")
-    response = client.models.generate_content(model=model, contents=contents, config=config)
-
-    def _parse_codefenced_json(text: str) -> Optional[Dict[str, Any]]:
-        try:
-            t = (text or '').strip()
-            if t.startswith('```') and t.endswith('```'):
-                t = t[3:-3].strip()
-                if t.lower().startswith('json'):
-                    t = t[4:].lstrip('\n').lstrip()
-                return json.loads(t)
-            m = re.search(r"```json\s*(\{[\s\S]*?\})\s*```", t)
-            if m:
-                return json.loads(m.group(1))
-            m2 = re.search(r"(\{[\s\S]*?\"segments\"[\s\S]*?\})", t)
-            if m2:
-                return json.loads(m2.group(1))
-        except Exception:
-            return None
-        return None
+    # Reference the static instruction block from the context cache when
+    # available so each chunk call only carries the audio part.
+    cache_name = _cached_prompt_name(client, api_key, 'transcribe', (context, prompt), model=model)
+    if cache_name:
+        contents = [types.Content(role="user", parts=[audio_part])]
+        config = types.GenerateContentConfig(response_mime_type="application/json",
+                                             cached_content=cache_name)
+    else:
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(text=context),
+                    types.Part.from_text(text=prompt),
+                    audio_part,
+                ],
+            ),
+        ]
+        # Generate transcription with JSON response requested
+        config = types.GenerateContentConfig(response_mime_type="application/json")
+    response = _generate_content(client, model, contents, config)
 
     # Parse JSON response
-    try:
-        transcript = json.loads(_get_response_text(response))
+    raw_text = _get_response_text(response)
+    transcript = parse_llm_json(raw_text)
+    if isinstance(transcript, dict):
+        _attach_numeric_timestamps(transcript)
+        if cache_key and transcript.get('segments'):
+            _gemini_cache_put(cache_key, transcript)
         return transcript
-    except Exception:
-        salvaged = _parse_codefenced_json(_get_response_text(response))
-        if isinstance(salvaged, dict):
-            return salvaged
-        return {"segments": [], "raw_text": _get_response_text(response)}
+    return {"segments": [], "raw_text": raw_text}
+
+
+_MER_HEADER_KEYWORDS = ('Proposal No.', 'Name Of Member', 'DOB Of Member')
+
+# With pyahocorasick installed the header keywords compile into one
+# automaton, so classifying a line is a single DFA walk instead of one
+# substring scan per keyword. The automaton is built once at import.
+try:
+    import ahocorasick  # type: ignore
+    _MER_HEADER_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _MER_HEADER_KEYWORDS:
+        _MER_HEADER_AUTOMATON.add_word(_kw, _kw)
+    _MER_HEADER_AUTOMATON.make_automaton()
+except Exception:
+    _MER_HEADER_AUTOMATON = None
+
+
+def _is_mer_header_line(line: str) -> bool:
+    if _MER_HEADER_AUTOMATON is not None:
+        return next(_MER_HEADER_AUTOMATON.iter(line), None) is not None
+    return any(keyword in line for keyword in _MER_HEADER_KEYWORDS)
 
 
 def extract_pdf_to_markdown(pdf_path: str) -> str:
@@ -495,52 +1027,143 @@ def extract_pdf_to_markdown(pdf_path: str) -> str:
     Returns:
         Markdown formatted text
     """
-    markdown_text = "## Medical Examination Report\n\n"
-    
-    # Read PDF
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        
-        # Extract text from all pages
-        for page_num, page in enumerate(pdf_reader.pages, 1):
-            text = page.extract_text()
-            
-            # Add page header
-            markdown_text += f"\n### Page {page_num}\n\n"
-            
-            # Process text - basic cleanup
-            lines = text.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                # Detect headers (lines with specific patterns)
-                if any(keyword in line for keyword in ['Proposal No.', 'Name Of Member', 'DOB Of Member']):
-                    markdown_text += f"**{line}**\n\n"
-                elif line.startswith('3.'):
-                    markdown_text += f"\n#### {line}\n"
-                elif 'YES' in line or 'NO' in line:
-                    markdown_text += f"- {line}\n"
-                else:
-                    markdown_text += f"{line}\n"
-    
-    return markdown_text
+    parts: List[str] = ["## Medical Examination Report\n\n"]
+
+    # Extract text from all pages (PDFium when available, PyPDF2 otherwise)
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        page_texts = [page.get_textpage().get_text_range() for page in pdf]
+    else:
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            page_texts = [page.extract_text() for page in pdf_reader.pages]
+
+    for page_num, text in enumerate(page_texts, 1):
+        # Add page header
+        parts.append(f"\n### Page {page_num}\n\n")
+
+        # Process text - basic cleanup
+        for line in text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Detect headers (lines with specific patterns)
+            if _is_mer_header_line(line):
+                parts.append(f"**{line}**\n\n")
+            elif line.startswith('3.'):
+                parts.append(f"\n#### {line}\n")
+            elif 'YES' in line or 'NO' in line:
+                parts.append(f"- {line}\n")
+            else:
+                parts.append(f"{line}\n")
+
+    return ''.join(parts)
+
+
+def _json_loads(text: Any) -> Any:
+    """Parse JSON with orjson when installed (2-5x faster on big payloads)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _write_json(path: Any, obj: Any, default=None) -> None:
+    """Write pretty-printed UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                 default=default))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False, default=default)
+
+
+def _compact_json(obj: Any) -> str:
+    """Serialize for prompt embedding: no indent, no ASCII escaping.
+
+    Indented JSON roughly doubles the token count of a long transcript;
+    compact separators keep the structure the model needs without the
+    whitespace. orjson is used when installed since these payloads run
+    to megabytes."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
 
 
-def generate_qa_prompt(transcript: Dict, mer_markdown: str) -> str:
+_CACHED_DATA_NOTE = "(provided in the cached context above)"
+
+
+def transcript_to_plain_text(transcript: Dict) -> str:
+    """Flatten a transcript dict to one speaker-labeled line per segment.
+
+    The QA prompts only need who said what and when; the full JSON form
+    (ids, emotions, nested objects) costs 2-4x the tokens for the same
+    information. Dicts that already carry flat text (the merged-text
+    override) pass through unchanged."""
+    if not isinstance(transcript, dict):
+        return ''
+    raw = transcript.get('raw_text')
+    if isinstance(raw, str) and not transcript.get('segments'):
+        return raw
+    lines = []
+    for seg in transcript.get('segments', []) or []:
+        text = (seg.get('text') or '').strip()
+        lines.append(f"[{seg.get('start_timestamp') or '0:00'}] {seg.get('speaker') or 'unknown'}: {text}")
+    return '\n'.join(lines)
+
+
+def _qa_shared_context(transcript: Dict, mer_markdown: str) -> str:
+    """The bulky per-record data shared by the QA analyses.
+
+    Uploaded once per record as explicit cached content so each analysis
+    request carries only its instructions and schema."""
+    return (
+        "## TRANSCRIPT:\n" + transcript_to_plain_text(transcript) +
+        "\n\n## MER DOCUMENTATION:\n" + mer_markdown
+    )
+
+
+def get_or_extract_mer(mer_pdf_path: str, out_dir: Path) -> str:
+    """Extract the MER PDF to markdown, cached beside the record.
+
+    Extraction is deterministic and CPU-heavy, so the markdown is kept in
+    _processed/mer.md with a sidecar recording the PDF's content hash;
+    re-runs (e.g. --skip-transcription iterations) hit the cache instead
+    of re-parsing the PDF."""
+    md_path = out_dir / 'mer.md'
+    meta_path = out_dir / 'mer.md.meta.json'
+    digest = None
+    try:
+        digest = _file_digest_payload(mer_pdf_path).hex()
+        with open(meta_path, 'rb') as f:
+            meta = _json_loads(f.read())
+        if meta.get('hash') == digest and md_path.exists():
+            return md_path.read_text(encoding='utf-8')
+    except Exception:
+        pass
+    text = extract_pdf_to_markdown(mer_pdf_path)
+    try:
+        md_path.write_text(text, encoding='utf-8')
+        if digest:
+            _write_json(meta_path, {'hash': digest})
+    except Exception:
+        pass
+    return text
+
+
+def generate_qa_prompt(transcript: Dict, mer_markdown: str, include_data: bool = True) -> str:
     """
     Generate prompt for QA analysis
     """
+    # Fixed instructions and schema come first and the volatile transcript/
+    # MER data last: calls for different records then share a long,
+    # byte-identical prefix, which is what Gemini's implicit prompt cache
+    # keys on.
+    transcript_block = transcript_to_plain_text(transcript) if include_data else _CACHED_DATA_NOTE
+    mer_block = mer_markdown if include_data else _CACHED_DATA_NOTE
     return f"""
-You are a medical QA auditor for MediBuddy. Analyze the conversation transcript against the MER documentation.
-
-## TRANSCRIPT:
-{json.dumps(transcript, indent=2)}
-
-## MER DOCUMENTATION:
-{mer_markdown}
+You are a medical QA auditor for MediBuddy. Analyze the conversation transcript against the MER documentation; both are provided in the INPUT section at the end of this prompt.
 
 ## TASK:
 Compare the conversation transcript with the MER form to identify:
@@ -670,26 +1293,50 @@ Personal Particulars must also be VERIFIED like usual questions and reflected in
 - For ID proofs, preserve values exactly as heard or summarized (full or last few digits; alphanumeric allowed); treat minor spacing/case as equivalent when comparing.
 
 Note: Do NOT compute or return numeric summary counts (totals, asked, missed, incorrect, paraphrased, clubbed, overall score). These will be computed locally from the returned JSON across all sections.
+
+### INPUT ###
+
+## TRANSCRIPT:
+{transcript_block}
+
+## MER DOCUMENTATION:
+{mer_block}
 """
 
 
-def analyze_qa(transcript: Dict, mer_markdown: str, api_key: str) -> Dict:
+def analyze_qa(transcript: Dict, mer_markdown: str, api_key: str,
+               cache_name: Optional[str] = None) -> Dict:
     """
     Perform QA analysis using Gemini
-    
+
     Args:
         transcript: Transcription JSON
         mer_markdown: MER document in markdown
         api_key: Gemini API key
-    
+        cache_name: optional explicit-cache handle holding the
+            transcript/MER data, so the prompt carries instructions only
+
     Returns:
         QA analysis report
     """
-    client = genai.Client(api_key=api_key)
+    client = _get_client(api_key)
     model = "gemini-2.5-flash"
-    
-    prompt = generate_qa_prompt(transcript, mer_markdown)
-    
+
+    # Memoize on the full inline prompt (the canonical form of the
+    # inputs): temperature 0.1 makes re-runs of unchanged records
+    # effectively deterministic, so repeat invocations hit disk.
+    full_prompt = generate_qa_prompt(transcript, mer_markdown)
+    try:
+        memo_key = _gemini_cache_key('qa1', full_prompt.encode('utf-8'))
+        cached = _gemini_cache_get(memo_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        memo_key = None
+
+    prompt = full_prompt if cache_name is None else generate_qa_prompt(
+        transcript, mer_markdown, include_data=False)
+
     contents = [
         types.Content(
             role="user",
@@ -698,61 +1345,63 @@ def analyze_qa(transcript: Dict, mer_markdown: str, api_key: str) -> Dict:
             ],
         ),
     ]
+
+    if cache_name:
+        generate_content_config = types.GenerateContentConfig(
+            temperature=0,
+            response_mime_type="application/json",
+            cached_content=cache_name,
+        )
+    else:
+        generate_content_config = types.GenerateContentConfig(
+            temperature=0,  # Deterministic analysis output
+            response_mime_type="application/json"  # Request JSON response
+        )
     
-    generate_content_config = types.GenerateContentConfig(
-        temperature=0.1,  # Low temperature for consistent analysis
-        response_mime_type="application/json"  # Request JSON response
-    )
-    
-    response = client.models.generate_content(
-        model=model,
-        contents=contents,
-        config=generate_content_config,
-    )
-    
+    # Stream the response when possible — the QA matrix is the largest
+    # payload the model produces — and fall back to the blocking call.
+    raw = _generate_content_streamed(client, model, contents, generate_content_config)
+    response = None
+    if raw is None:
+        response = _generate_content(client, model, contents, generate_content_config)
+
     # Parse JSON response robustly
-    try:
+    if raw is None:
         raw = _get_response_text(response)
         if not isinstance(raw, str) or not raw.strip():
             raw = getattr(response, 'text', '') or ''
-        # handle fenced JSON
-        t = raw.strip()
-        if t.startswith('```') and t.endswith('```'):
-            t = t[3:-3].strip()
-            if t.lower().startswith('json'):
-                t = t[4:].lstrip('\n').lstrip()
-        return json.loads(t)
-    except Exception:
-        return {"error": "Failed to parse QA analysis", "raw_response": _get_response_text(response)}
+    result = parse_llm_json(raw)
+    if result is not None:
+        if memo_key and isinstance(result, dict) and result:
+            _gemini_cache_put(memo_key, result)
+        return result
+    return {"error": "Failed to parse QA analysis", "raw_response": raw}
 
 
-def save_qa_report(qa_report: Dict, output_path: str):
+def save_qa_report(qa_report: Dict, output_path: str, transcript: Optional[Dict] = None):
     """
     Save QA report to JSON file
-    
+
     Args:
         qa_report: QA analysis report
         output_path: Path to save the report
+        transcript: Transcript dict used for the WPM meta; when omitted,
+            falls back to reading TRANSCRIPT_PATH from disk (legacy behavior)
     """
-    # Try to append WPM computed from transcript if available in working dir
+    # Try to append WPM computed from transcript
     try:
-        transcript_path = os.environ.get("TRANSCRIPT_PATH", "/Users/vishalsharma/Downloads/medibuddy/transcript.json")
-        if os.path.exists(transcript_path):
-            with open(transcript_path, 'r', encoding='utf-8') as tf:
-                tdata = json.load(tf)
+        tdata = transcript
+        if tdata is None:
+            transcript_path = os.environ.get("TRANSCRIPT_PATH", "/Users/vishalsharma/Downloads/medibuddy/transcript.json")
+            if os.path.exists(transcript_path):
+                with open(transcript_path, 'r', encoding='utf-8') as tf:
+                    tdata = json.load(tf)
+        if isinstance(tdata, dict):
             # If transcript is stored as codefenced JSON inside raw_text, parse it
             if isinstance(tdata, dict) and 'segments' not in tdata and isinstance(tdata.get('raw_text'), str):
-                raw = tdata['raw_text'].strip()
-                if raw.startswith('```') and raw.endswith('```'):
-                    raw = raw[3:-3].strip()
-                    if raw.lower().startswith('json'):
-                        raw = raw[4:].lstrip('\n').lstrip()
-                try:
-                    parsed_inner = json.loads(raw)
-                    if isinstance(parsed_inner, dict) and parsed_inner.get('segments'):
-                        tdata = parsed_inner
-                except Exception:
-                    pass
+                parsed_inner = parse_llm_json(tdata['raw_text'])
+                if isinstance(parsed_inner, dict) and parsed_inner.get('segments'):
+                    tdata = parsed_inner
             # Lightweight WPM calc to embed into report meta
             def parse_ts(ts: str):
                 try:
@@ -760,16 +1409,42 @@ def save_qa_report(qa_report: Dict, output_path: str):
                 except Exception:
                     return None
             totals = {'doctor_words':0,'doctor_seconds':0.0,'customer_words':0,'customer_seconds':0.0}
-            for seg in tdata.get('segments', []) or []:
-                sp = str(seg.get('speaker','')).lower()
-                role = 'doctor' if sp in ('doctor','agent') else ('customer' if sp=='customer' else None)
-                if not role: continue
-                start = parse_ts(seg.get('start_timestamp','') or '')
-                end = parse_ts(seg.get('end_timestamp','') or '')
-                if start is None or end is None or end<=start: continue
-                text = str(seg.get('text','') or '')
-                totals[f'{role}_words'] += len([w for w in text.strip().split() if w])
-                totals[f'{role}_seconds'] += (end-start)
+            segs = tdata.get('segments', []) or []
+            def ts_or_neg(ts: str) -> int:
+                v = parse_ts(ts)
+                return -1 if v is None else v
+            # Segments written by this pipeline carry precomputed integer
+            # start_s/end_s fields; parsing the MM:SS strings is only the
+            # fallback for transcripts from older runs.
+            def seg_sec(seg, field, ts_key) -> int:
+                v = seg.get(field)
+                return v if isinstance(v, int) else ts_or_neg(seg.get(ts_key, '') or '')
+            if np is not None and len(segs) >= 32:
+                # Pure numeric aggregation: mask by speaker and sum as
+                # arrays instead of dispatching per segment in Python.
+                n = len(segs)
+                speakers = np.array([str(s.get('speaker','')).lower() for s in segs])
+                starts = np.fromiter((seg_sec(s, 'start_s', 'start_timestamp') for s in segs), dtype=np.int64, count=n)
+                ends = np.fromiter((seg_sec(s, 'end_s', 'end_timestamp') for s in segs), dtype=np.int64, count=n)
+                wcounts = np.fromiter((len(str(s.get('text','') or '').split()) for s in segs), dtype=np.int64, count=n)
+                valid = (starts >= 0) & (ends > starts)
+                mask_doc = np.isin(speakers, ('doctor', 'agent')) & valid
+                mask_cust = (speakers == 'customer') & valid
+                totals['doctor_words'] = int(wcounts[mask_doc].sum())
+                totals['doctor_seconds'] = float((ends - starts)[mask_doc].sum())
+                totals['customer_words'] = int(wcounts[mask_cust].sum())
+                totals['customer_seconds'] = float((ends - starts)[mask_cust].sum())
+            else:
+                for seg in segs:
+                    sp = str(seg.get('speaker','')).lower()
+                    role = 'doctor' if sp in ('doctor','agent') else ('customer' if sp=='customer' else None)
+                    if not role: continue
+                    start = seg_sec(seg, 'start_s', 'start_timestamp')
+                    end = seg_sec(seg, 'end_s', 'end_timestamp')
+                    if start < 0 or end <= start: continue
+                    text = str(seg.get('text','') or '')
+                    totals[f'{role}_words'] += len(text.split())
+                    totals[f'{role}_seconds'] += (end-start)
             def wpm(words, secs):
                 return round((words / (secs/60.0)), 2) if secs>0 else 0.0
             meta_wpm = {
@@ -779,12 +1454,12 @@ def save_qa_report(qa_report: Dict, output_path: str):
             qa_report.setdefault('meta', {}).update(meta_wpm)
     except Exception:
         pass
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(qa_report, f, indent=2, ensure_ascii=False)
+    _write_json(output_path, qa_report)
     print(f"QA report saved to: {output_path}")
 
 
-def get_qc_part2_prompt(transcript: Dict) -> str:
+def get_qc_part2_prompt(transcript: Dict, include_data: bool = True) -> str:
+    transcript_block = transcript_to_plain_text(transcript) if include_data else _CACHED_DATA_NOTE
     return f"""
 Analyze the medical verification call transcript and extract quality control parameters per the schema below.
 Only use transcript evidence and provide timestamps as proof. Return STRICT JSON matching the exact schema.
@@ -796,9 +1471,6 @@ Prompting rule: This is a rare, customer-side third-party coaching situation. Fl
 
 Observations rule: Use observations.value="NA" when there are no special customer-side observations to report (for example, no hesitation, no third-party prompting, no unusual event). Use observations.value="Yes" only when a relevant observation is present and captured. Use observations.value="No" only when a required observation was missed.
 
-TRANSCRIPT JSON:
-{json.dumps(transcript, indent=2)}
-
 OUTPUT SCHEMA:
 {{
   "qc_parameters": {{
@@ -829,28 +1501,47 @@ OUTPUT SCHEMA:
 }}
 
 Guidelines: 1) Be objective; 2) Provide timestamps; 3) Use NA when not applicable; 4) Keep explanations ≤ 50 words; 5) Focus on doctor's performance.
+
+### INPUT ###
+
+TRANSCRIPT JSON:
+{transcript_block}
 """
 
 
-def analyze_qc_part2(transcript: Dict, api_key: str) -> Dict:
-    client = genai.Client(api_key=api_key)
+def analyze_qc_part2(transcript: Dict, api_key: str, cache_name: Optional[str] = None) -> Dict:
+    client = _get_client(api_key)
     model = "gemini-2.5-flash"
-    prompt = get_qc_part2_prompt(transcript)
-    contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)])]
-    config = types.GenerateContentConfig(temperature=0.1, response_mime_type="application/json")
-    response = client.models.generate_content(model=model, contents=contents, config=config)
+    full_prompt = get_qc_part2_prompt(transcript)
     try:
-        return json.loads(response.text)
-    except json.JSONDecodeError:
-        return {"error": "Failed to parse QC part 2", "raw_response": response.text}
+        memo_key = _gemini_cache_key('qc2', full_prompt.encode('utf-8'))
+        cached = _gemini_cache_get(memo_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        memo_key = None
+    prompt = full_prompt if cache_name is None else get_qc_part2_prompt(transcript, include_data=False)
+    contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)])]
+    if cache_name:
+        config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json",
+                                             cached_content=cache_name)
+    else:
+        config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json")
+    response = _generate_content(client, model, contents, config)
+    result = parse_llm_json(response.text)
+    if result is not None:
+        if memo_key and isinstance(result, dict) and result:
+            _gemini_cache_put(memo_key, result)
+        return result
+    return {"error": "Failed to parse QC part 2", "raw_response": response.text}
 
 
 def save_qc_part2(qc_report: Dict, output_path: str):
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(qc_report, f, indent=2, ensure_ascii=False)
+    _write_json(output_path, qc_report)
     print(f"QC Part 2 saved to: {output_path}")
 
-def get_mer_typo_prompt(mer_markdown: str) -> str:
+def get_mer_typo_prompt(mer_markdown: str, include_data: bool = True) -> str:
+    mer_block = mer_markdown if include_data else _CACHED_DATA_NOTE
     return f"""
 You are checking only the MER (Medical Examination Report) text for spelling mistakes that the doctor may have typed/filled.
 
@@ -861,9 +1552,6 @@ Rules (strict):
 - If a field becomes correct by only removing extra spaces inside words, it is not a spelling mistake.
 - When in doubt whether a token is a template label vs filled value, default to not flagging it.
 
-MER TEXT:
-{mer_markdown}
-
 Return STRICT JSON:
 {{
   "documentation_quality": {{
@@ -872,19 +1560,85 @@ Return STRICT JSON:
     "notes": "short explanation of the approach and examples context if helpful"
   }}
 }}
+
+### INPUT ###
+
+MER TEXT:
+{mer_block}
 """
 
 def analyze_mer_typos(mer_markdown: str, api_key: str) -> Dict:
-    client = genai.Client(api_key=api_key)
+    client = _get_client(api_key)
     model = "gemini-2.5-flash"
     prompt = get_mer_typo_prompt(mer_markdown)
+    try:
+        memo_key = _gemini_cache_key('typos', prompt.encode('utf-8'))
+        cached = _gemini_cache_get(memo_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        memo_key = None
     contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)])]
-    config = types.GenerateContentConfig(temperature=0.1, response_mime_type="application/json")
-    resp = client.models.generate_content(model=model, contents=contents, config=config)
+    config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json")
+    resp = _generate_content(client, model, contents, config)
+    result = parse_llm_json(resp.text)
+    if result is not None:
+        if memo_key and isinstance(result, dict) and result:
+            _gemini_cache_put(memo_key, result)
+        return result
+    return {"documentation_quality": {"spelling_errors_count": 0, "typos_found": [], "notes": "parse_error"}, "raw_response": resp.text}
+
+
+# Fold QA Part 1, QC Part 2 and the MER typo check into one Gemini call.
+# Off by default: the parallel two-call path with an explicit context
+# cache is the proven one; flip this on to trade it for a single
+# round-trip that sends the shared transcript+MER prefix exactly once.
+USE_COMBINED_QA = os.environ.get('GEMINI_COMBINED_QA', '0').strip().lower() in ('1', 'true', 'yes')
+
+
+def analyze_all(transcript: Dict, mer_markdown: str, api_key: str) -> Dict:
+    """Run all three analyses (QA part 1, QC part 2, MER typos) in one call.
+
+    The instruction blocks are concatenated under labeled sections after a
+    single copy of the shared transcript+MER context, so per-request
+    overhead and the shared prefix tokens are paid once instead of three
+    times. The reply is one JSON object keyed qa_part1 / qc_part2 /
+    documentation_quality that the caller splits back into the usual
+    report files."""
+    client = _get_client(api_key)
+    model = "gemini-2.5-flash"
+    full_prompt = "\n\n".join((
+        _qa_shared_context(transcript, mer_markdown),
+        "### QA_PART1 ###",
+        generate_qa_prompt(transcript, mer_markdown, include_data=False),
+        "### QA_PART2 ###",
+        get_qc_part2_prompt(transcript, include_data=False),
+        "### MER_TYPOS ###",
+        get_mer_typo_prompt(mer_markdown, include_data=False),
+        'Return ONE STRICT JSON object combining the three sections above:\n'
+        '{"qa_part1": <the QA_PART1 output object>, '
+        '"qc_part2": <the QA_PART2 output object>, '
+        '"documentation_quality": <the MER_TYPOS documentation_quality object>}',
+    ))
     try:
-        return json.loads(resp.text)
-    except json.JSONDecodeError:
-        return {"documentation_quality": {"spelling_errors_count": 0, "typos_found": [], "notes": "parse_error"}, "raw_response": resp.text}
+        memo_key = _gemini_cache_key('all', full_prompt.encode('utf-8'))
+        cached = _gemini_cache_get(memo_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        memo_key = None
+    contents = [types.Content(role="user", parts=[types.Part.from_text(text=full_prompt)])]
+    config = types.GenerateContentConfig(temperature=0, response_mime_type="application/json")
+    response = _generate_content(client, model, contents, config)
+    result = parse_llm_json(_get_response_text(response))
+    if isinstance(result, dict) and result.get('qa_part1') is not None:
+        if memo_key:
+            _gemini_cache_put(memo_key, result)
+        return result
+    return {"error": "Failed to parse combined analysis",
+            "raw_response": _get_response_text(response)}
+
+
 def save_transcript(transcript: Dict, output_path: str):
     """
     Save transcript to JSON file
@@ -893,11 +1647,105 @@ def save_transcript(transcript: Dict, output_path: str):
         transcript: Transcription JSON
         output_path: Path to save the transcript
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(transcript, f, indent=2, ensure_ascii=False)
+    _write_json(output_path, transcript)
     print(f"Transcript saved to: {output_path}")
 
 
+def _process_single_call(i: int, media_file: Path, out_path: Path, api_key: str,
+                         skip_transcription: bool) -> Tuple[Dict[str, Any], float, Optional[Dict[str, Any]]]:
+    """Run the full per-call pipeline (extract, probe, frames, transcribe).
+
+    Returns (transcript, duration, individual_result); a failed call comes
+    back as empty segments with zero duration and no result entry, matching
+    what the old inline loop recorded. Calls are independent, so the caller
+    can fan these out across threads — the heavy steps are Gemini and
+    ffmpeg waits, which release the GIL."""
+    log_progress(f"Processing call {i}: {media_file.name}", 3 + i, 10)
+
+    call_dir = out_path / f"call{i}"
+    call_dir.mkdir(parents=True, exist_ok=True)
+
+    # Handle video files - extract audio (one ffmpeg run also yields the
+    # loudness stats and the container duration)
+    audio_path = str(media_file)
+    tech_analysis = None
+    duration = None
+    is_video = media_file.suffix.lower() in {'.mp4', '.webm', '.mov'}
+    if is_video:
+        extracted_audio = call_dir / "audio.mp3"
+        extracted_ok, tech_analysis, duration = prepare_audio(str(media_file), str(extracted_audio))
+        if extracted_ok:
+            audio_path = str(extracted_audio)
+        else:
+            print(f"Warning: Could not extract audio from {media_file.name}")
+
+    # Get duration (videos got theirs during extraction)
+    if duration is None:
+        duration = get_media_duration(audio_path) or 0.0
+
+    # Technical analysis (audio); videos got theirs during extraction
+    if tech_analysis is None:
+        tech_analysis = analyze_audio_technical(audio_path)
+
+    # Video analysis (only if original is video)
+    video_analysis = {"attire_check": "unknown", "visibility_status": "unknown", "privacy_maintained": None, "screenshots": []}
+    if is_video:
+        frames = extract_video_frames(str(media_file), call_dir, duration=duration)
+        if frames:
+            # Static videos (screen shares, frozen cameras) yield the same
+            # JPEG at every sample point; drop byte-identical frames so
+            # the vision call carries the minimum set.
+            seen = set()
+            unique_frames = []
+            for fp in frames:
+                try:
+                    d = _file_digest_payload(fp)
+                except Exception:
+                    d = fp
+                if d not in seen:
+                    seen.add(d)
+                    unique_frames.append(fp)
+            video_analysis = analyze_video_frames(unique_frames, api_key)
+        else:
+            # No frames grabbed: skip the Gemini vision call outright and
+            # record the NA shape downstream merging expects.
+            video_analysis = {"attire_check": "NA", "visibility_status": "NA", "privacy_maintained": "NA", "screenshots": []}
+
+    # Transcribe or load existing
+    try:
+        transcript_path = call_dir / "transcript.json"
+        transcript = None
+        if skip_transcription and transcript_path.exists():
+            with open(transcript_path, 'r') as f:
+                transcript = json.load(f)
+        elif skip_transcription and not transcript_path.exists():
+            transcript = {"segments": []}
+        else:
+            if duration and duration > 900:
+                chunks_dir = call_dir / 'chunks'
+                chunk_paths = split_audio_into_chunks(audio_path, chunks_dir, chunk_seconds=300)
+                print(f"Call {i}: duration {int(duration)}s -> chunking into {len(chunk_paths)} parts")
+                transcript = transcribe_chunks_and_merge(
+                    chunk_paths, api_key, chunk_seconds=300, total_duration=duration)
+            else:
+                transcript = transcribe_audio(audio_path, api_key)
+            _write_json(transcript_path, transcript)
+
+        return transcript, duration, {
+            "call_index": i,
+            "media_file": str(media_file),
+            "audio_path": audio_path,
+            "duration": duration,
+            "transcript_path": str(transcript_path),
+            "segments_count": len((transcript or {}).get('segments', [])),
+            "technical_analysis": tech_analysis,
+            "video_analysis": video_analysis,
+        }
+    except Exception as e:
+        print(f"Transcription failed for call {i}: {e}")
+        return {"segments": []}, 0.0, None
+
+
 def process_multi_call_record(record_dir: str, api_key: str, output_dir: Optional[str] = None, skip_transcription: bool = False) -> Dict[str, Any]:
     """Process a complete record with multiple calls"""
     record_path = Path(record_dir)
@@ -914,105 +1762,53 @@ def process_multi_call_record(record_dir: str, api_key: str, output_dir: Optiona
         out_path = record_path / "_processed"
     out_path.mkdir(parents=True, exist_ok=True)
     
-    # Find MER PDF
-    mer_files = list(record_path.glob("*_MER.pdf"))
+    # Find MER PDF and media files in one directory pass
+    mer_files, media_files = scan_record(record_path)
     if not mer_files:
         raise FileNotFoundError(f"MER PDF not found in {record_dir}")
     
     mer_pdf = mer_files[0]
     log_progress(f"Found MER: {mer_pdf.name}", 1, 10)
     
-    # Extract MER content
-    mer_markdown = extract_pdf_to_markdown(str(mer_pdf))
+    # Extract MER content (cached by PDF hash under _processed)
+    mer_markdown = get_or_extract_mer(str(mer_pdf), out_path)
     log_progress("MER extraction completed", 2, 10)
     
-    # Find media files
-    media_files = find_media_files(record_path)
+    # Media files came from the same scan_record pass
     if not media_files:
         raise FileNotFoundError(f"No media files found in {record_dir}")
     
     log_progress(f"Found {len(media_files)} media files", 3, 10)
     
-    # Process each media file
+    # Process each media file; calls are independent and dominated by
+    # Gemini/ffmpeg latency, so fan out across threads. ex.map keeps the
+    # results in call order for the merge below.
     transcripts = []
     call_durations = []
     individual_results = []
-    
-    for i, media_file in enumerate(media_files, 1):
-        log_progress(f"Processing call {i}: {media_file.name}", 3 + i, 10)
-        
-        call_dir = out_path / f"call{i}"
-        call_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Handle video files - extract audio
-        audio_path = str(media_file)
-        if media_file.suffix.lower() in {'.mp4', '.webm', '.mov'}:
-            extracted_audio = call_dir / "audio.mp3"
-            if extract_audio_from_video(str(media_file), str(extracted_audio)):
-                audio_path = str(extracted_audio)
-            else:
-                print(f"Warning: Could not extract audio from {media_file.name}")
-        
-        # Get duration
-        duration = get_media_duration(audio_path) or 0.0
-        call_durations.append(duration)
 
-        # Technical analysis (audio)
-        tech_analysis = analyze_audio_technical(audio_path)
+    if len(media_files) > 1:
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(media_files))) as ex:
+            outcomes = list(ex.map(
+                lambda item: _process_single_call(item[0], item[1], out_path, api_key, skip_transcription),
+                enumerate(media_files, 1)))
+    else:
+        outcomes = [_process_single_call(1, media_files[0], out_path, api_key, skip_transcription)]
 
-        # Video analysis (only if original is video)
-        video_analysis = {"attire_check": "unknown", "visibility_status": "unknown", "privacy_maintained": None, "screenshots": []}
-        is_video = media_file.suffix.lower() in {'.mp4', '.webm', '.mov'}
-        if is_video:
-            frames = extract_video_frames(str(media_file), call_dir)
-            if frames:
-                video_analysis = analyze_video_frames(frames, api_key)
+    for transcript, duration, call_result in outcomes:
+        transcripts.append(transcript)
+        call_durations.append(duration)
+        if call_result is not None:
+            individual_results.append(call_result)
 
-        # Transcribe or load existing
-        try:
-            transcript_path = call_dir / "transcript.json"
-            transcript = None
-            if skip_transcription and transcript_path.exists():
-                with open(transcript_path, 'r') as f:
-                    transcript = json.load(f)
-            elif skip_transcription and not transcript_path.exists():
-                transcript = {"segments": []}
-            else:
-                if duration and duration > 900:
-                    chunks_dir = call_dir / 'chunks'
-                    chunk_paths = split_audio_into_chunks(audio_path, chunks_dir, chunk_seconds=300)
-                    print(f"Call {i}: duration {int(duration)}s -> chunking into {len(chunk_paths)} parts")
-                    transcript = transcribe_chunks_and_merge(chunk_paths, api_key)
-                else:
-                    transcript = transcribe_audio(audio_path, api_key)
-                with open(transcript_path, 'w') as f:
-                    json.dump(transcript, f, indent=2)
-
-            transcripts.append(transcript)
-
-            individual_results.append({
-                "call_index": i,
-                "media_file": str(media_file),
-                "audio_path": audio_path,
-                "duration": duration,
-                "transcript_path": str(transcript_path),
-                "segments_count": len((transcript or {}).get('segments', [])),
-                "technical_analysis": tech_analysis,
-                "video_analysis": video_analysis,
-            })
-        except Exception as e:
-            print(f"Transcription failed for call {i}: {e}")
-            transcripts.append({"segments": []})
-            call_durations[-1] = 0.0
-    
     # Merge all transcripts
     log_progress("Merging transcripts", 7, 10)
     merged_transcript = merge_transcripts(transcripts, call_durations)
     
     # Save merged transcript
     merged_transcript_path = out_path / "merged_transcript.json"
-    with open(merged_transcript_path, 'w') as f:
-        json.dump(merged_transcript, f, indent=2)
+    _write_json(merged_transcript_path, merged_transcript)
     
     # Save a human-readable merged transcript text for LLM prompts
     merged_text = build_merged_transcript_text(merged_transcript)
@@ -1023,16 +1819,57 @@ def process_multi_call_record(record_dir: str, api_key: str, output_dir: Optiona
     except Exception:
         pass
 
-    # QA Part 1 Analysis using merged transcript (or existing text override)
-    log_progress("Running QA Part 1 analysis on merged transcript", 8, 10)
-    try:
-        # If existing text file present, use it; else use newly built
+    # QA analyses run on the in-memory merged text built above; the .txt
+    # on disk is persistence for later inspection, not an input (the old
+    # read-back could only ever return the string just written).
+    # Part 1 and Part 2 are independent Gemini calls, so they run
+    # concurrently and this phase costs max(latencies) instead of the sum;
+    # the result merging below stays on the main thread.
+
+    # Combined mode: one Gemini call produces all three analyses, so the
+    # shared context is sent once and there is nothing to cache or fan
+    # out. A failed combined call falls back to the per-part path below.
+    combined = None
+    if USE_COMBINED_QA:
         try:
-            with open(out_path / 'merged_transcript.txt', 'r') as tf:
-                txt_override = tf.read()
+            combined = analyze_all({"raw_text": merged_text}, mer_markdown, api_key)
+            if not isinstance(combined, dict) or 'error' in combined:
+                combined = None
         except Exception:
-            txt_override = merged_text
-        qa_part1 = analyze_qa({"raw_text": txt_override}, mer_markdown, api_key)
+            combined = None
+
+    # Upload the shared transcript+MER data once as explicit cached
+    # content; both analyses then reference it by handle instead of
+    # re-sending it. Best-effort: without a cache the prompts embed the
+    # data inline exactly as before.
+    qa_cache_name = None
+    qa_executor = None
+    fut_qa1 = fut_qa2 = None
+    if combined is None:
+        try:
+            cache = _get_client(api_key).caches.create(
+                model="gemini-2.5-flash",
+                config=types.CreateCachedContentConfig(
+                    contents=[types.Content(role="user", parts=[types.Part.from_text(
+                        text=_qa_shared_context({"raw_text": merged_text}, mer_markdown))])],
+                    ttl="600s",
+                ),
+            )
+            qa_cache_name = getattr(cache, 'name', None)
+        except Exception:
+            qa_cache_name = None
+
+        import concurrent.futures
+        qa_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        log_progress("Running QA Part 1 analysis on merged transcript", 8, 10)
+        fut_qa1 = qa_executor.submit(analyze_qa, {"raw_text": merged_text}, mer_markdown, api_key, qa_cache_name)
+        log_progress("Running QA Part 2 analysis on merged transcript", 9, 10)
+        fut_qa2 = qa_executor.submit(analyze_qc_part2, {"raw_text": merged_text}, api_key, qa_cache_name)
+
+    try:
+        qa_part1 = (combined.get('qa_part1') or {}) if combined is not None else fut_qa1.result()
+        if combined is not None and combined.get('documentation_quality'):
+            qa_part1.setdefault('documentation_quality', combined['documentation_quality'])
         # Inject technical_status and video_analysis based on longest call's analysis
         # Select the longest call for representative tech/video
         longest = None
@@ -1058,26 +1895,26 @@ def process_multi_call_record(record_dir: str, api_key: str, output_dir: Optiona
         qa_part1.setdefault('video_analysis', {})
         qa_part1['video_analysis'].update(_na_video(vid))
         qa_part1_path = out_path / "merged_qa_report.json"
-        save_qa_report(qa_part1, str(qa_part1_path))
+        save_qa_report(qa_part1, str(qa_part1_path), transcript=merged_transcript)
     except Exception as e:
         print(f"QA Part 1 failed: {e}")
         qa_part1 = {}
-    
-    # QA Part 2 Analysis using merged transcript text (or existing override)
-    log_progress("Running QA Part 2 analysis on merged transcript", 9, 10)
+
     try:
-        try:
-            with open(out_path / 'merged_transcript.txt', 'r') as tf:
-                txt_override = tf.read()
-        except Exception:
-            txt_override = merged_text
-        qa_part2 = analyze_qc_part2({"raw_text": txt_override}, api_key)
+        qa_part2 = (combined.get('qc_part2') or {}) if combined is not None else fut_qa2.result()
         qa_part2_path = out_path / "merged_qa_report_part2.json"
         save_qc_part2(qa_part2, str(qa_part2_path))
     except Exception as e:
         print(f"QA Part 2 failed: {e}")
         qa_part2 = {}
-    
+
+    if qa_executor is not None:
+        qa_executor.shutdown(wait=False)
+    if qa_cache_name:
+        try:
+            _get_client(api_key).caches.delete(name=qa_cache_name)
+        except Exception:
+            pass
     log_progress("Processing completed!", 10, 10)
     
     # Compile results
@@ -1099,8 +1936,7 @@ def process_multi_call_record(record_dir: str, api_key: str, output_dir: Optiona
     
     # Save processing summary
     summary_path = out_path / "processing_summary.json"
-    with open(summary_path, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    _write_json(summary_path, results, default=str)
     
     return results
 
@@ -1115,13 +1951,17 @@ def main():
     parser.add_argument("--mer", dest="mer", help="Path to MER PDF file (legacy mode)")
     parser.add_argument("--record-dir", dest="record_dir", help="Path to record directory containing MER PDF and media files")
     parser.add_argument("--skip-transcription", dest="skip_transcription", action='store_true', help="Use existing transcripts if present and skip re-transcription")
+    parser.add_argument("--batch", dest="batch", action='store_true', help="Transcribe chunks via Gemini Batch Mode (cheaper, no RPM limits, may take hours)")
     parser.add_argument("--output", dest="output", help="Output directory or file path")
     parser.add_argument("--transcript-output", dest="transcript_output", default="transcript.json", help="Path to save transcript JSON (legacy mode)")
     parser.add_argument("--api-key", dest="api_key", required=True, help="Gemini API key")
     args = parser.parse_args()
 
     API_KEY = args.api_key
-    
+    if args.batch:
+        global USE_BATCH
+        USE_BATCH = True
+
     print("Starting MediBuddy QA Analysis...")
     
     # Multi-call processing mode
@@ -1179,7 +2019,7 @@ def main():
         # Step 3: Perform QA Part 1 analysis
         print("\n3. Performing QA Part 1 analysis...")
         qa_report = analyze_qa(transcript, mer_markdown, API_KEY)
-        save_qa_report(qa_report, output_file)
+        save_qa_report(qa_report, output_file, transcript=transcript)
         
         # Step 4: Perform QA Part 2 analysis
         print("\n4. Performing QA Part 2 analysis...")
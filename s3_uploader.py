@@ -2,21 +2,60 @@ import os
 import sys
 import time
 import json
-import mimetypes
+import hmac
+import hashlib
 import argparse
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import quote
 import urllib.request
 import email.utils
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 
 WORKSPACE_ROOT = Path(__file__).resolve().parent
 
+# Upload only original MER PDFs and original call/video recordings;
+# processed audio is derived locally. A tuple lets str.endswith test all
+# extensions in one C-level call with no splitext or Path per entry.
+ALLOWED_EXT = (".pdf", ".mp3", ".wav", ".m4a", ".mp4", ".mov", ".avi", ".mkv")
+
+# Only the eight extensions above ever reach the uploader, so a flat dict
+# beats mimetypes.guess_type's lazy table load and per-call parsing.
+CTYPE = {
+    ".pdf": "application/pdf",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".avi": "video/x-msvideo",
+    ".mkv": "video/x-matroska",
+}
+
+# Recordings run hundreds of MB; 16 MB parts with more concurrent PUTs per
+# file keep the link saturated on high-RTT paths and cut per-part request
+# overhead versus the s3transfer defaults (8 MB / 10 threads).
+TRANSFER_CFG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+    max_io_queue=1000,
+)
+
 
 def human_size(num_bytes: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
@@ -28,114 +67,320 @@ def human_size(num_bytes: int) -> str:
     return f"{size:.2f} PB"
 
 
-def build_s3_client() -> boto3.client:
-    aws_access_key = os.environ.get("AWS_ACCESS_KEY_ID") or os.environ.get("AWS_ACCESS_KEY")
-    aws_secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY") or os.environ.get("AWS_SECRET_KEY")
-    aws_region = os.environ.get("AWS_REGION", "ap-south-1")
-
-    # If explicit env vars are provided, use them; otherwise rely on default provider chain (profile/SSO/IMDS)
-    if aws_access_key and aws_secret_key:
-        return boto3.client(
-            "s3",
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=aws_region,
-            config=Config(signature_version="s3v4"),
-        )
-    return boto3.client(
-        "s3",
-        region_name=aws_region,
-        config=Config(signature_version="s3v4"),
+def _client_config() -> Config:
+    # Pool must cover the upload workers plus the multipart threads each
+    # transfer spawns, or extra requests rebuild TCP+TLS per call; adaptive
+    # retries back off under S3 throttling instead of failing the file.
+    return Config(
+        signature_version="s3v4",
+        max_pool_connections=int(os.environ.get("S3_MAX_POOL", "64")),
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
     )
 
 
-def iter_media_files(base_dir: Path):
-    allowed_ext = {
-        ".pdf",
-        ".mp3",
-        ".wav",
-        ".m4a",
-        ".mp4",
-        ".mov",
-        ".avi",
-        ".mkv",
-    }
-    exclude_dirs = {"node_modules", ".git", "__pycache__"}
+# One session resolves credentials once for the process; clients are then
+# cheap to mint from it. Workers keep a client per thread so nothing
+# contends on credential refresh under high fan-out.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_TLS = threading.local()
+
+
+def _get_session() -> boto3.session.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                aws_access_key = os.environ.get("AWS_ACCESS_KEY_ID") or os.environ.get("AWS_ACCESS_KEY")
+                aws_secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY") or os.environ.get("AWS_SECRET_KEY")
+                aws_region = os.environ.get("AWS_REGION", "ap-south-1")
+                # If explicit env vars are provided, use them; otherwise rely on default provider chain (profile/SSO/IMDS)
+                if aws_access_key and aws_secret_key:
+                    _SESSION = boto3.session.Session(
+                        aws_access_key_id=aws_access_key,
+                        aws_secret_access_key=aws_secret_key,
+                        region_name=aws_region,
+                    )
+                else:
+                    _SESSION = boto3.session.Session(region_name=aws_region)
+    return _SESSION
 
-    for root, dirs, files in os.walk(base_dir):
-        # Prune excluded directories and generated artifacts. Upload only original MER PDFs
-        # and original call/video recordings; processed audio is derived locally.
-        dirs[:] = [d for d in dirs if d not in exclude_dirs and d != "_processed"]
 
-        for fname in files:
-            fpath = Path(root) / fname
-            if fpath.suffix.lower() in allowed_ext:
-                yield fpath
+def build_s3_client() -> boto3.client:
+    return _get_session().client("s3", config=_client_config())
+
+
+def get_thread_client() -> boto3.client:
+    """Lazily build one S3 client per thread from the shared session."""
+    client = getattr(_TLS, "client", None)
+    if client is None:
+        client = build_s3_client()
+        _TLS.client = client
+    return client
+
+
+def iter_media_entries(base_dir: Path):
+    """Yield (path, stat_result) for every media/PDF file under base_dir.
+
+    A manual scandir walk reuses the DirEntry stat for both the is_file
+    check and the size, so each file costs one stat instead of the os.walk
+    enumeration plus a second path.stat() in the upload loop. Directories
+    are pruned by name before descending; only matching files pay for a
+    Path object. os.scandir itself is C-backed (getdents + batched stat),
+    so a native walker dependency (scandir_rs) or a `find` subprocess
+    would only shave the thin Python loop around it while losing the
+    stat_result this yields for inode-ordered dispatch — not worth a new
+    dependency at this tree's size (hundreds of files, not 100k+)."""
+    exclude_dirs = {"node_modules", ".git", "__pycache__", "_processed"}
+
+    stack = [str(base_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file() and entry.name.lower().endswith(ALLOWED_EXT):
+                        yield Path(entry.path), entry.stat()
+                except OSError:
+                    continue
+
+
+def write_pointer(path: Path, text: str) -> None:
+    """Replace a local file with a one-line pointer in a single write.
+
+    os.open/os.write with the pre-encoded payload is one syscall per
+    file versus text-mode open plus two buffered writes — it adds up
+    once 16 upload workers are rewriting pointers concurrently."""
+    payload = text.encode("utf-8") + b"\n"
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
 
 def guess_content_type(path: Path) -> str:
-    ctype, _ = mimetypes.guess_type(str(path))
-    return ctype or "application/octet-stream"
+    return CTYPE.get(path.suffix.lower(), "application/octet-stream")
+
+
+def _dumps_line(obj) -> str:
+    """One compact JSON line for the streaming manifest, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8") + "\n"
+    return json.dumps(obj, separators=(",", ":")) + "\n"
+
+
+def _write_manifest_json(path: Path, summary: dict) -> None:
+    """Write the pretty-printed manifest summary, via orjson when installed.
+
+    The items list can run to thousands of entries; orjson serializes it
+    in C and emits bytes directly instead of stdlib json's per-key loop."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as mf:
+            json.dump(summary, mf, indent=2)
+
+
+def _open_for_upload(path: Path):
+    """Open a source file for streaming upload with a 1 MiB read buffer.
+
+    The default 8 KiB buffering means thousands of read syscalls per
+    multipart chunk of a multi-GB recording; a 1 MiB buffer cuts that to
+    a handful per part. That leaves the read path a couple of syscalls
+    per 16 MB part, so batched-submission readers (io_uring) have nothing
+    left to amortize here — the remaining cost is TLS and the network."""
+    return open(path, "rb", buffering=1 << 20)
+
+
+@dataclass(slots=True)
+class UploadTask:
+    """Precomputed plan for one upload.
+
+    The relative path, object key and content type are all pure string
+    work; doing it once up front keeps the worker threads free of
+    everything but the actual read-and-PUT."""
+    path: Path
+    rel: str
+    key: str
+    size: int
+    ctype: str
 
 
 def upload_and_replace(
-    s3_client: boto3.client,
     bucket: str,
     key_prefix: str,
-    files: list[Path],
+    files: list[tuple[Path, int]],
     presign_expires: int = 604800,  # 7 days
 ):
     manifest = []
-    total = len(files)
     uploaded_bytes = 0
+    jsonl_path = WORKSPACE_ROOT / "s3_manifest.jsonl"
 
-    for idx, path in enumerate(files, start=1):
-        rel_path = path.relative_to(WORKSPACE_ROOT)
-        key = f"{key_prefix}/{rel_path.as_posix()}"
-        content_type = guess_content_type(path)
-
-        size = path.stat().st_size
-        print(f"[{idx}/{total}] Uploading {rel_path} ({human_size(size)}) → s3://{bucket}/{key}")
+    # Replay the streaming manifest from earlier runs: a file whose key is
+    # already logged and whose local copy is already a URL pointer has
+    # nothing left to do, so a restart costs one small read per file
+    # instead of re-uploading every byte.
+    done_entries: dict = {}
+    try:
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(e, dict) and e.get("key"):
+                    done_entries[e["key"]] = e
+    except OSError:
+        pass
+
+    def _is_pointer(path: Path) -> bool:
         try:
-            s3_client.upload_file(
-                Filename=str(path),
-                Bucket=bucket,
-                Key=key,
-                ExtraArgs={"ContentType": content_type},
-            )
-            uploaded_bytes += size
-        except (BotoCoreError, ClientError) as e:
-            print(f"ERROR: Failed to upload {rel_path}: {e}")
-            continue
-
+            with open(path, "rb") as f:
+                return f.read(8).startswith((b"http", b"s3://"))
+        except OSError:
+            return False
+
+    pending = []
+    for path, size in files:
+        rel = path.relative_to(WORKSPACE_ROOT).as_posix()
+        key = f"{key_prefix}/{rel}"
+        prev = done_entries.get(key)
+        if prev is not None and _is_pointer(path):
+            manifest.append(prev)
+        else:
+            pending.append(UploadTask(path, rel, key, size, guess_content_type(path)))
+    if len(pending) < len(files):
+        print(f"Skipping {len(files) - len(pending)} already-uploaded files (manifest replay).")
+    total = len(pending)
+
+    def _upload_one(idx: int, task: UploadTask):
+        """Phase 1: upload one file's bytes.
+
+        Returns the task on success or None on failure so one bad file
+        never aborts the batch. Path, key, size and content type all come
+        precomputed on the task — no stat or string work here."""
+        client = get_thread_client()
+
+        print(f"[{idx}/{total}] Uploading {task.rel} ({human_size(task.size)}) → s3://{bucket}/{task.key}")
         try:
-            url = s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=presign_expires,
-            )
-        except (BotoCoreError, ClientError) as e:
-            print(f"ERROR: Failed to generate URL for {rel_path}: {e}")
-            url = None
+            with _open_for_upload(task.path) as body:
+                if task.size < TRANSFER_CFG.multipart_threshold:
+                    # Single-part files (PDFs, short clips) skip the
+                    # s3transfer manager — one PutObject instead of a
+                    # futures state machine around one part.
+                    client.put_object(
+                        Body=body,
+                        Bucket=bucket,
+                        Key=task.key,
+                        ContentType=task.ctype,
+                    )
+                else:
+                    client.upload_fileobj(
+                        body,
+                        Bucket=bucket,
+                        Key=task.key,
+                        ExtraArgs={"ContentType": task.ctype},
+                        Config=TRANSFER_CFG,
+                    )
+        except (OSError, BotoCoreError, ClientError) as e:
+            print(f"ERROR: Failed to upload {task.rel}: {e}")
+            return None
+        return task
+
+    # Credentials for the local signer are read once, not per file.
+    access_key = os.environ.get("AWS_ACCESS_KEY_ID") or os.environ.get("AWS_ACCESS_KEY")
+    secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY") or os.environ.get("AWS_SECRET_KEY")
+    region = os.environ.get("AWS_REGION", "ap-south-1")
+
+    def _finalize_one(task: UploadTask):
+        """Phase 2: presign one uploaded object and rewrite its pointer.
+
+        Presigns locally when env credentials are set (cached signing key,
+        no botocore serializer per URL); the SDK presigner remains the
+        fallback for provider-chain credentials."""
+        url = None
+        if access_key and secret_key:
+            try:
+                url = presign_get(bucket, task.key, presign_expires, region,
+                                  access_key, secret_key)
+            except Exception as e:
+                print(f"ERROR: Local presign failed for {task.rel}: {e}")
+                url = None
+        if not url:
+            try:
+                url = get_thread_client().generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket, "Key": task.key},
+                    ExpiresIn=presign_expires,
+                )
+            except (BotoCoreError, ClientError) as e:
+                print(f"ERROR: Failed to generate URL for {task.rel}: {e}")
+                url = None
 
         # Overwrite local file with pointer to S3 URL (text). This intentionally replaces content.
         try:
-            with open(path, "w", encoding="utf-8") as wf:
-                wf.write(url or f"s3://{bucket}/{key}")
-                wf.write("\n")
-        except Exception as e:
-            print(f"ERROR: Failed to replace local file {rel_path} with URL: {e}")
-
-        manifest.append(
-            {
-                "local_path": str(rel_path),
-                "bucket": bucket,
-                "key": key,
-                "content_type": content_type,
-                "size_bytes": size,
-                "presigned_url": url,
-            }
-        )
+            write_pointer(task.path, url or f"s3://{bucket}/{task.key}")
+        except OSError as e:
+            print(f"ERROR: Failed to replace local file {task.rel} with URL: {e}")
+
+        return {
+            "local_path": task.rel,
+            "bucket": bucket,
+            "key": task.key,
+            "content_type": task.ctype,
+            "size_bytes": task.size,
+            "presigned_url": url,
+        }
+
+    # Phase 1 is network-bound (S3 PUTs), so fan the files out across
+    # threads and let every worker spend its time on the wire.
+    workers = max(1, min(total, int(os.environ.get("S3_UPLOAD_WORKERS", "16"))))
+    uploaded: list[UploadTask] = []
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_upload_one, idx, task)
+                   for idx, task in enumerate(pending, start=1)]
+        for fut in as_completed(futures):
+            task = fut.result()
+            if task is not None:
+                uploaded.append(task)
+
+    # Each finalized file is also appended as one line to a JSONL log, so
+    # a crash mid-run keeps a durable record of everything completed so
+    # far instead of losing the whole in-memory manifest. An upload that
+    # crashes before its pointer is written simply re-uploads next run.
+    try:
+        manifest_fp = open(jsonl_path, "a", encoding="utf-8", buffering=1)
+    except OSError as e:
+        print(f"WARN: Cannot open {jsonl_path} for streaming manifest: {e}")
+        manifest_fp = None
+
+    # Phase 2 signs and rewrites pointers without uploads in the way.
+    # hashlib/hmac release the GIL, so threads are enough to saturate the
+    # HMAC chain; entries arrive in completion order on this collector
+    # thread, so the JSONL appends need no lock.
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for fut in as_completed([ex.submit(_finalize_one, t) for t in uploaded]):
+                entry = fut.result()
+                manifest.append(entry)
+                uploaded_bytes += entry["size_bytes"]
+                if manifest_fp is not None:
+                    try:
+                        manifest_fp.write(_dumps_line(entry))
+                    except OSError:
+                        pass
+    finally:
+        if manifest_fp is not None:
+            manifest_fp.close()
 
     return manifest, uploaded_bytes
 
@@ -216,16 +461,13 @@ def refresh_presigned_urls(
             if local_path:
                 lp = WORKSPACE_ROOT / local_path
                 if lp.exists():
-                    with open(lp, "w", encoding="utf-8") as wf:
-                        wf.write(url)
-                        wf.write("\n")
+                    write_pointer(lp, url)
         except Exception as e:
             print(f"WARN: Failed to update local pointer {local_path}: {e}")
 
     manifest["refreshed_at"] = datetime.now(timezone.utc).isoformat()
     try:
-        with open(manifest_path, "w", encoding="utf-8") as mf:
-            json.dump(manifest, mf, indent=2)
+        _write_manifest_json(manifest_path, manifest)
     except Exception as e:
         print(f"ERROR: Failed to write updated manifest: {e}")
         return refreshed
@@ -252,6 +494,46 @@ def _fetch_s3_server_time(bucket: str) -> datetime:
         return None
 
 
+# SigV4 signing keys only rotate with the credential/date/region scope, so
+# derive the HMAC chain once per day instead of four HMACs per URL.
+_SIGNING_KEY_CACHE: dict = {}
+
+
+def _sigv4_signing_key(secret_key: str, yyyymmdd: str, region: str) -> bytes:
+    cache_key = (secret_key, yyyymmdd, region)
+    k_signing = _SIGNING_KEY_CACHE.get(cache_key)
+    if k_signing is None:
+        def _sign(key_bytes, msg):
+            return hmac.new(key_bytes, msg.encode("utf-8"), hashlib.sha256).digest()
+        k_date = _sign(("AWS4" + secret_key).encode("utf-8"), yyyymmdd)
+        k_region = _sign(k_date, region)
+        k_service = _sign(k_region, "s3")
+        k_signing = _sign(k_service, "aws4_request")
+        _SIGNING_KEY_CACHE.clear()
+        _SIGNING_KEY_CACHE[cache_key] = k_signing
+    return k_signing
+
+
+def presign_get(bucket: str, key: str, expires: int, region: str, access_key: str, secret_key: str) -> str:
+    """Presign an S3 GET locally: pure HMAC/SHA256, no botocore stack.
+
+    generate_presigned_url walks the full endpoint-resolution and
+    serializer machinery per call; for a batch of files that CPU cost
+    sits on the critical path. This formats the URL directly with the
+    cached daily signing key."""
+    now = datetime.now(timezone.utc)
+    return _manual_presign_s3_get(
+        bucket=bucket,
+        key=key,
+        region=region,
+        access_key=access_key,
+        secret_key=secret_key,
+        expires=expires,
+        amz_date=now.strftime("%Y%m%dT%H%M%SZ"),
+        yyyymmdd=now.strftime("%Y%m%d"),
+    )
+
+
 def _manual_presign_s3_get(*, bucket: str, key: str, region: str, access_key: str, secret_key: str, expires: int, amz_date: str, yyyymmdd: str) -> str:
     """Minimal SigV4 presign for S3 GET using server time to avoid clock skew issues."""
     service = "s3"
@@ -277,7 +559,6 @@ def _manual_presign_s3_get(*, bucket: str, key: str, region: str, access_key: st
         signed_headers,
         payload_hash,
     ])
-    import hashlib, hmac as _hmac
     cr_hash = hashlib.sha256(canonical_request.encode()).hexdigest()
     string_to_sign = "\n".join([
         "AWS4-HMAC-SHA256",
@@ -285,14 +566,8 @@ def _manual_presign_s3_get(*, bucket: str, key: str, region: str, access_key: st
         credential_scope,
         cr_hash,
     ])
-    def _sign(key_bytes, msg):
-        return _hmac.new(key_bytes, msg.encode("utf-8"), hashlib.sha256).digest()
-    k_secret = ("AWS4" + secret_key).encode("utf-8")
-    k_date = _sign(k_secret, yyyymmdd)
-    k_region = _sign(k_date, region)
-    k_service = _sign(k_region, service)
-    k_signing = _sign(k_service, "aws4_request")
-    signature = _hmac.new(k_signing, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    k_signing = _sigv4_signing_key(secret_key, yyyymmdd, region)
+    signature = hmac.new(k_signing, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
     final_query = canonical_query + "&X-Amz-Signature=" + signature
     return f"https://{host}{canonical_uri}?{final_query}"
 
@@ -303,22 +578,19 @@ def main():
 
     # Scope to current record inputs. Avoid uploading root-level old sample files.
     rr_dir = WORKSPACE_ROOT / "reports and recordings"
-    scan_dirs = [rr_dir] if rr_dir.exists() else [WORKSPACE_ROOT]
-
-    # Collect files (unique paths)
-    files = []
-    seen = set()
-    for base in scan_dirs:
-        for f in iter_media_files(base):
-            # Ensure within workspace
-            try:
-                rel = f.relative_to(WORKSPACE_ROOT)
-            except ValueError:
-                continue
-            if rel in seen:
-                continue
-            seen.add(rel)
-            files.append(f)
+    base = rr_dir if rr_dir.exists() else WORKSPACE_ROOT
+
+    # One walk over one base directory: the walker never yields the same
+    # entry twice and does not follow directory symlinks, so no seen-set
+    # dedup or workspace-containment re-check is needed.
+    entries = list(iter_media_entries(base))
+
+    # Dispatch in (device, inode) order: concurrent readers then touch the
+    # disk roughly in on-layout order, which keeps readahead effective
+    # instead of seeking randomly across the tree. The stat from the walk
+    # is reused — no extra syscalls.
+    entries.sort(key=lambda e: (e[1].st_dev, e[1].st_ino))
+    files = [(p, st.st_size) for p, st in entries]
 
     if not files:
         print("No media/PDF files found to upload.")
@@ -326,25 +598,22 @@ def main():
 
     print(f"Found {len(files)} files to upload.")
 
-    s3 = build_s3_client()
     t0 = time.time()
-    manifest, total_bytes = upload_and_replace(s3, bucket, key_prefix, files)
+    manifest, total_bytes = upload_and_replace(bucket, key_prefix, files)
     dt = time.time() - t0
 
     manifest_path = WORKSPACE_ROOT / "s3_manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as mf:
-        json.dump(
-            {
-                "bucket": bucket,
-                "key_prefix": key_prefix,
-                "total_files": len(manifest),
-                "total_bytes": total_bytes,
-                "elapsed_seconds": round(dt, 2),
-                "items": manifest,
-            },
-            mf,
-            indent=2,
-        )
+    _write_manifest_json(
+        manifest_path,
+        {
+            "bucket": bucket,
+            "key_prefix": key_prefix,
+            "total_files": len(manifest),
+            "total_bytes": total_bytes,
+            "elapsed_seconds": round(dt, 2),
+            "items": manifest,
+        },
+    )
 
     print(
         f"Uploaded {len(manifest)} files ({human_size(total_bytes)}) in {dt:.1f}s. Manifest: {manifest_path}"
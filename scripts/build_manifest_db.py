@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Index s3_manifest.json into s3_manifest.sqlite keyed by local_path.
+
+The app parses the whole manifest JSON on first use in every worker;
+building the sqlite index once makes cold-start lookups a single
+indexed SELECT instead of a full parse.
+
+Run from the repo root:
+    python3 scripts/build_manifest_db.py
+"""
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main() -> int:
+    man_path = ROOT / 's3_manifest.json'
+    db_path = ROOT / 's3_manifest.sqlite'
+    if not man_path.exists():
+        print(f"manifest not found: {man_path}")
+        return 1
+    with open(man_path, 'rb') as f:
+        man = json.loads(f.read())
+    items = man.get('items', []) or []
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DROP TABLE IF EXISTS manifest")
+        conn.execute(
+            "CREATE TABLE manifest ("
+            "local_path TEXT PRIMARY KEY, presigned_url TEXT, bucket TEXT, key TEXT)")
+        conn.executemany(
+            "INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?)",
+            ((it.get('local_path'), it.get('presigned_url'), it.get('bucket'), it.get('key'))
+             for it in items if isinstance(it, dict) and it.get('local_path')))
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"indexed {len(items)} items -> {db_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())